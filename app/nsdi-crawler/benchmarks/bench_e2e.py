@@ -0,0 +1,116 @@
+"""
+크롤러 전체 실행 벤치마크
+======================
+
+    python -m benchmarks.bench_e2e
+    python -m benchmarks.bench_e2e --rows 1000 --latency 0.05 -c PAGE_WORKERS=4
+    python -m benchmarks.bench_e2e --s3-endpoint-url http://127.0.0.1:5000
+
+NsdiStub 서버(stub_server)와 로컬 S3 로 NsdiCrawler.run 전체를 실행하고
+초당 목록 페이지 수, 초당 다운로드 MB, 최대 메모리(RSS, 자식 프로세스 포함)를 출력합니다.
+--s3-endpoint-url 이 없으면 moto 로 프로세스 안에서 S3 를 흉내냅니다.
+nsdi-store 의 bench_e2e 로 이어서 저장까지 측정하려면 motoserver/moto 컨테이너, minio 처럼
+프로세스 밖의 S3 를 띄우고 두 벤치마크에 같은 --s3-endpoint-url, --bucket 을 넘겨주세요.
+"""
+import contextlib
+import time
+import typing
+
+import boto3
+import click
+from nsdi_metrics import MetricsRegistry, PeakRssSampler
+
+from nsdi_crawler.crawler import NsdiCrawler
+from .stub_server import NsdiStubServer
+
+MB = 1024 * 1024
+
+
+@contextlib.contextmanager
+def local_s3(
+    endpoint_url: typing.Optional[str], bucket: str
+) -> typing.Iterator[None]:
+    if endpoint_url:
+        yield
+        return
+
+    try:
+        from moto import mock_aws
+    except ImportError:
+        raise click.UsageError("--s3-endpoint-url 또는 moto 가 필요합니다")
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(
+            Bucket=bucket
+        )
+        yield
+
+
+@click.command()
+@click.option("--rows", default=250, help="서비스별 목록 행 수")
+@click.option("--csv-rows", default=1000, help="압축 파일 하나의 CSV 행 수")
+@click.option("--latency", default=0.0, help="stub 서버 응답 지연(초)")
+@click.option("--html-dir", default=None, type=click.Path(exists=True))
+@click.option("--s3-endpoint-url", default=None)
+@click.option("--bucket", default="nsdi-bench")
+@click.option(
+    "-c",
+    "--config",
+    "config_list",
+    multiple=True,
+    help="크롤러 설정 (예: PAGE_WORKERS=4)",
+)
+def main(
+    rows: int,
+    csv_rows: int,
+    latency: float,
+    html_dir: typing.Optional[str],
+    s3_endpoint_url: typing.Optional[str],
+    bucket: str,
+    config_list: typing.Tuple[str, ...],
+) -> None:
+    server = NsdiStubServer(
+        rows=rows, csv_rows=csv_rows, latency=latency, html_dir=html_dir
+    ).start()
+    config: typing.Dict[str, typing.Any] = {
+        "ENVIRONMENT": "local",
+        "DATA_TYPE": "전체데이터",
+        "DOWNLOAD": "ON",
+        "NSDI_BASE_URL": server.url,
+        "AWS_ACCESS_KEY_ID": "bench",
+        "AWS_SECRET_ACCESS_KEY": "bench",
+        "AWS_REGION_NAME": "us-east-1",
+        "AWS_ENDPOINT_URL": s3_endpoint_url,
+        "AWS_S3_BUCKET_NAME": bucket,
+    }
+    config.update(x.split("=", 1) for x in config_list)
+    click.echo(f"stub: {server.url}, rows: {rows}, csv rows: {csv_rows}")
+
+    try:
+        with local_s3(s3_endpoint_url, bucket):
+            sampler = PeakRssSampler()
+            crawler = NsdiCrawler(
+                config, metrics=MetricsRegistry(rss_sampler=sampler)
+            )
+            with sampler:
+                start = time.perf_counter()
+                crawler.run("BENCHMARK")
+                elapsed = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    statistics = server.statistics
+    click.echo(
+        f"crawler: {elapsed:.2f}s, "
+        f"pages {statistics.page_count} "
+        f"({statistics.page_count / elapsed:.1f} pages/s), "
+        f"files {statistics.download_count} / "
+        f"{statistics.download_bytes / MB:.1f} MB "
+        f"({statistics.download_bytes / MB / elapsed:.2f} MB/s), "
+        f"peak RSS {sampler.peak / MB:.1f} MB"
+    )
+    for name, peak in sorted(sampler.stage_peak.items()):
+        click.echo(f"  {name}: peak RSS {peak / MB:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
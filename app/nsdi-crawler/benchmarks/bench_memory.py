@@ -0,0 +1,75 @@
+"""
+목록 파싱 메모리 벤치마크
+======================
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --rows 5000 --parser lxml
+
+여러 페이지를 파싱한 결과를 모두 메모리에 들고 있을 때(크롤러가 지역별 목록을 모으는 경우)
+원본 HTML 을 보관하는 경우와 보관하지 않는 경우의 최대 메모리 사용량을 비교합니다.
+"""
+import gc
+import time
+import tracemalloc
+import typing
+
+import click
+
+from nsdi_crawler.client.data import (
+    NsdiLandUsingInfoResponse,
+    PARSER_BS4,
+    PARSER_LXML,
+)
+from .fixtures import render_listing_pages
+
+
+def measure(
+    pages: typing.List[str], parser: str, keep_raw: bool
+) -> typing.Tuple[int, int, float]:
+    """
+    (파싱 후 유지되는 메모리, 최대 메모리, 걸린 시간) 을 반환합니다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    responses = [
+        NsdiLandUsingInfoResponse.from_html(page, parser, keep_raw)
+        for page in pages
+    ]
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del responses
+
+    return current, peak, elapsed
+
+
+@click.command()
+@click.option("--rows", default=2500, help="생성할 목록 행 수")
+@click.option(
+    "--parser",
+    default=PARSER_BS4,
+    type=click.Choice([PARSER_BS4, PARSER_LXML]),
+)
+def main(rows: int, parser: str) -> None:
+    pages = render_listing_pages("F024", rows)
+    click.echo(f"pages: {len(pages)}, rows: {rows}, parser: {parser}")
+
+    results = {}
+    for keep_raw in (True, False):
+        current, peak, elapsed = measure(pages, parser, keep_raw)
+        results[keep_raw] = current
+        click.echo(
+            f"keep_raw={str(keep_raw):5}: "
+            f"retained {current / 1024 / 1024:.2f} MB, "
+            f"peak {peak / 1024 / 1024:.2f} MB, "
+            f"{elapsed * 1000 / len(pages):.2f} ms/page"
+        )
+
+    click.echo(f"retained ratio: {results[True] / results[False]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+목록 페이지 파서 벤치마크
+======================
+
+    python -m benchmarks.bench_parser
+    python -m benchmarks.bench_parser --html saved_page_1.html --html ...
+
+bs4 파서와 lxml 파서로 같은 페이지를 파싱한 결과가 같은지 확인하고 페이지당 파싱 시간을 비교합니다.
+"""
+import time
+import typing
+
+import attr
+import click
+
+from nsdi_crawler.client.data import (
+    NsdiLandUsingInfoResponse,
+    PARSER_BS4,
+    PARSER_LXML,
+)
+from .fixtures import render_listing_pages
+
+
+def parsed_fields(
+    response: NsdiLandUsingInfoResponse,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    # 원본 HTML 은 파서마다 직렬화 방식이 달라 비교에서 제외합니다
+    return [
+        attr.asdict(x, filter=lambda a, v: a.name != "raw_data")
+        for x in response.land_using_info
+    ] + [{"total_page": response.total_page}]
+
+
+def measure(pages: typing.List[str], parser: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            NsdiLandUsingInfoResponse.from_html(page, parser)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+
+@click.command()
+@click.option("--html", "html_paths", multiple=True, type=click.Path())
+@click.option("--rows", default=250, help="생성할 목록 행 수")
+@click.option("--repeat", default=20)
+def main(html_paths: typing.Tuple[str, ...], rows: int, repeat: int) -> None:
+    if html_paths:
+        pages = []
+        for path in html_paths:
+            with open(path, "r", encoding="utf-8") as f:
+                pages.append(f.read())
+    else:
+        pages = render_listing_pages("F024", rows)
+
+    for page in pages:
+        bs4_fields = parsed_fields(
+            NsdiLandUsingInfoResponse.from_html(page, PARSER_BS4)
+        )
+        lxml_fields = parsed_fields(
+            NsdiLandUsingInfoResponse.from_html(page, PARSER_LXML)
+        )
+        if bs4_fields != lxml_fields:
+            raise click.ClickException("bs4 and lxml results are different")
+
+    bs4_seconds = measure(pages, PARSER_BS4, repeat)
+    lxml_seconds = measure(pages, PARSER_LXML, repeat)
+
+    click.echo(f"pages: {len(pages)}, repeat: {repeat}")
+    click.echo(f"bs4 : {bs4_seconds * 1000:.2f} ms/page")
+    click.echo(f"lxml: {lxml_seconds * 1000:.2f} ms/page")
+    click.echo(f"speedup: {bs4_seconds / lxml_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
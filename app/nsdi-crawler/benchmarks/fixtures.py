@@ -0,0 +1,249 @@
+"""
+fixtures
+========
+
+국가공간정보포털 목록 페이지와 같은 구조의 HTML 을 만들어 벤치마크에 사용합니다.
+실제 페이지를 저장해둔 파일이 있다면 각 벤치마크의 --html 옵션으로 대신 사용할 수 있습니다.
+다운로드 파일은 NSDI 와 같은 한글 컬럼명의 CP949 CSV 하나를 담은 압축 파일로 만듭니다.
+"""
+import csv
+import datetime
+import io
+import random
+import typing
+import zipfile
+
+SIDO_LIST = [
+    ("11", "서울특별시"),
+    ("26", "부산광역시"),
+    ("27", "대구광역시"),
+    ("28", "인천광역시"),
+    ("29", "광주광역시"),
+    ("30", "대전광역시"),
+    ("31", "울산광역시"),
+    ("36", "세종특별자치시"),
+    ("41", "경기도"),
+    ("42", "강원도"),
+    ("43", "충청북도"),
+    ("44", "충청남도"),
+    ("45", "전라북도"),
+    ("46", "전라남도"),
+    ("47", "경상북도"),
+    ("48", "경상남도"),
+    ("50", "제주특별자치도"),
+]
+
+GUGUN_LIST = [
+    ("11680", "서울특별시 강남구"),
+    ("11650", "서울특별시 서초구"),
+    ("26350", "부산광역시 해운대구"),
+    ("28177", "인천광역시 미추홀구"),
+    ("41135", "경기도 성남시 분당구"),
+    ("41465", "경기도 용인시 수지구"),
+]
+
+SERVICE_LIST = {
+    "F014": ("토지이용계획정보", "D155"),
+    "F024": ("토지특성정보", "D194"),
+}
+
+ROWS_PER_PAGE = 10
+
+#: 서비스별 CSV 컬럼명 (nsdi-store 가 변환하는 컬럼과 같습니다)
+CSV_COLUMN_LIST = {
+    "F014": [
+        "고유번호", "관리번호", "법정동코드", "법정동명", "대장구분코드",
+        "대장구분명", "지번", "도면번호", "저촉여부코드", "저촉여부",
+        "용도지역지구코드", "용도지역지구명", "등록일자", "데이터기준일자",
+    ],
+    "F024": [
+        "고유번호", "법정동코드", "법정동명", "대장구분코드", "대장구분명",
+        "지번", "토지일련번호", "기준년도", "기준월", "지목코드", "지목명",
+        "토지면적", "용도지역코드1", "용도지역명1", "용도지역코드2",
+        "용도지역명2", "토지이용상황코드", "토지이동상황", "지형높이코드",
+        "지형높이", "지형형상코드", "지형형상", "도로접면코드", "도로접면",
+        "공시지가", "데이터기준일자",
+    ],
+}
+
+# 실제 페이지의 상단 메뉴, 검색 폼, 스크립트 분량을 흉내내기 위한 내용
+_HEADER = "".join(
+    f'<li class="depth1"><a href="/nsdi/eios/menu{i}.do">메뉴 {i}</a>'
+    f'<ul class="depth2">'
+    + "".join(
+        f'<li><a href="/nsdi/eios/menu{i}_{j}.do">하위 메뉴 {i}-{j}</a></li>'
+        for j in range(12)
+    )
+    + "</ul></li>"
+    for i in range(10)
+)
+_SCRIPT = "".join(
+    f"function fn_script_{i}(a, b) {{ return a + b + {i}; }}\n"
+    for i in range(200)
+)
+
+
+class ListingRow(typing.NamedTuple):
+    data_type: str
+    city_type: str
+    name_type: str
+    base_date: str
+    file_size: str
+    svc_id: str
+    extrc_dt: str
+    extrc_se: str
+    extrc_scope: str
+    file_name: str
+    opert_sn: str
+
+
+def make_listing_rows(
+    svc_id: str, count: int, seed: int = 0, data_type: str = "전체데이터"
+) -> typing.List[ListingRow]:
+    """
+    최신 데이터가 앞에 오도록 정렬된 목록 행을 만듭니다.
+    """
+    rand = random.Random(seed)
+    name_type, dataset_code = SERVICE_LIST[svc_id]
+    extrc_se = "AL" if data_type == "전체데이터" else "CH"
+    region_list = SIDO_LIST + (GUGUN_LIST if svc_id == "F024" else [])
+    base = datetime.date(2020, 10, 1)
+
+    rows = []
+    for i in range(count):
+        adm_code, city_type = rand.choice(region_list)
+        base_date = base - datetime.timedelta(days=i // 4)
+        extrc_dt = base_date.strftime("%Y%m%d")
+        rows.append(
+            ListingRow(
+                data_type=data_type,
+                city_type=city_type,
+                name_type=name_type,
+                base_date=base_date.strftime("%Y-%m-%d"),
+                file_size=f"{rand.randint(100, 900000):,} KB",
+                svc_id=svc_id,
+                extrc_dt=extrc_dt,
+                extrc_se=extrc_se,
+                extrc_scope=adm_code,
+                file_name=(
+                    f"{extrc_se}_{adm_code}_{dataset_code}_{extrc_dt}.zip"
+                ),
+                opert_sn=str(2000 + i),
+            )
+        )
+    return rows
+
+
+def render_listing_row(row: ListingRow) -> str:
+    return (
+        "<tr>\n"
+        f"  <td>{row.data_type}</td>\n"
+        f"  <td class=\"left\">{row.city_type}</td>\n"
+        f"  <td class=\"left\">{row.name_type}</td>\n"
+        f"  <td>{row.base_date}</td>\n"
+        f"  <td>{row.file_size}</td>\n"
+        "  <td>\n"
+        "    <button type=\"button\" class=\"btn-down\" "
+        f"onclick=\"javascript:fn_fileDownload('{row.svc_id}', "
+        f"'{row.extrc_dt}', '{row.extrc_se}', '{row.extrc_scope}', "
+        f"'{row.file_name}', '{row.opert_sn}'); return false;\">"
+        "<span>다운로드</span></button>\n"
+        "  </td>\n"
+        "</tr>\n"
+    )
+
+
+def render_listing_page(
+    rows: typing.Sequence[ListingRow], page_index: int, total_page: int
+) -> str:
+    tr_list = "".join(render_listing_row(x) for x in rows)
+    return (
+        "<!DOCTYPE html>\n"
+        "<html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        "<title>국가공간정보포털 오픈마켓</title>"
+        f"<script type=\"text/javascript\">{_SCRIPT}</script></head>\n"
+        "<body><div id=\"wrap\"><div id=\"header\">"
+        f"<ul class=\"gnb\">{_HEADER}</ul></div>\n"
+        "<div id=\"container\"><form id=\"searchForm\" method=\"post\">"
+        "<input type=\"hidden\" name=\"svcSe\" value=\"F\">"
+        "<input type=\"text\" name=\"startDate\" value=\"\">"
+        "<input type=\"text\" name=\"endDate\" value=\"\"></form>\n"
+        "<form id=\"fileListForm\" method=\"post\">\n"
+        "<table class=\"table-list\"><caption>파일 목록</caption>\n"
+        "<thead><tr><th>구분</th><th>지역</th><th>데이터셋명</th>"
+        "<th>기준일자</th><th>파일크기</th><th>다운로드</th></tr></thead>\n"
+        f"<tbody>\n{tr_list}</tbody>\n</table>\n</form>\n"
+        "<div class=\"paging\">"
+        "<button type=\"button\" class=\"btn-first\" "
+        "onclick=\"fn_egov_link_page_second(1);return false;\"></button>"
+        f"<strong>{page_index}</strong>"
+        "<button type=\"button\" class=\"btn-last\" "
+        f"onclick=\"fn_egov_link_page_second({total_page});return false;\">"
+        "</button></div>\n"
+        "</div><div id=\"footer\">Copyright 국토교통부</div></div>"
+        "</body></html>\n"
+    )
+
+
+def render_listing_pages(
+    svc_id: str, total_rows: int, seed: int = 0
+) -> typing.List[str]:
+    rows = make_listing_rows(svc_id, total_rows, seed)
+    total_page = max((len(rows) + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE, 1)
+    return [
+        render_listing_page(
+            rows[i * ROWS_PER_PAGE:(i + 1) * ROWS_PER_PAGE], i + 1, total_page
+        )
+        for i in range(total_page)
+    ]
+
+
+def make_csv_value(rand: random.Random, column: str, pnu: str) -> str:
+    if column == "고유번호":
+        return pnu
+    if column in ("등록일자", "데이터기준일자"):
+        return f"2020-{rand.randrange(1, 13):02}-01"
+    if column == "토지면적":
+        return f"{rand.randrange(1, 100000) / 10:.1f}"
+    if column == "공시지가":
+        return str(rand.randrange(1000, 10 ** 8))
+    if column.endswith("명") or column in ("저촉여부", "토지이동상황"):
+        return rand.choice(["서울특별시 강남구 역삼동", "대지", "제2종일반주거지역", ""])
+    return str(rand.randrange(0, 1000))
+
+
+def make_zip(
+    svc_id: str,
+    extrc_scope: str,
+    file_name: str,
+    opert_sn: str,
+    csv_rows: int,
+) -> bytes:
+    """
+    목록 행의 다운로드 파일을 만듭니다. 같은 파일 이름, 일련번호는 항상 같은 파일이 됩니다.
+    PNU 앞자리는 목록 행의 지역 코드(extrc_scope)입니다.
+    """
+    rand = random.Random(f"{file_name}:{opert_sn}")
+    column_list = CSV_COLUMN_LIST[svc_id]
+    adm_code = extrc_scope.ljust(5, "0")
+
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(column_list)
+    for _ in range(csv_rows):
+        pnu = (
+            f"{adm_code}{rand.randrange(101, 130):03}00"
+            f"{rand.randrange(1, 3)}{rand.randrange(1, 10000):04}"
+            f"{rand.randrange(0, 100):04}"
+        )
+        writer.writerow(
+            [make_csv_value(rand, x, pnu) for x in column_list]
+        )
+
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w", zipfile.ZIP_DEFLATED) as f:
+        f.writestr(
+            file_name.replace(".zip", ".csv"),
+            text.getvalue().encode("cp949"),
+        )
+    return data.getvalue()
@@ -0,0 +1,261 @@
+"""
+NSDI stub 서버
+=============
+
+    python -m benchmarks.stub_server --port 8080 --rows 2500 --latency 0.05
+    CRAWLER_NSDI_BASE_URL=http://127.0.0.1:8080 python manage.py run
+
+크롤러가 요청하는 국가공간정보포털 주소를 흉내내는 로컬 서버입니다.
+
+    GET  /nsdi/eios/OpenapiList.do, ServiceDetail.do  세션 초기화 페이지
+    GET  .../AdmService/admCodeList.json, admSiList.json  지역 목록
+    POST /nsdi/eios/ServiceDetail.do  목록 페이지 (fixtures 또는 --html-dir 의 저장된 페이지)
+    POST /nsdi/eios/fileDownload.do  압축 파일 (Range 요청 지원)
+
+모든 응답은 --latency 초만큼 늦게 보내며 요청 수, 보낸 바이트 수를 기록합니다.
+--html-dir 에 {svcId}_{페이지}.html 파일이 있으면 만든 페이지 대신 그 파일을 보냅니다.
+"""
+import functools
+import http.server
+import json
+import os
+import threading
+import time
+import typing
+import urllib.parse
+
+import attr
+import click
+
+from .fixtures import (
+    GUGUN_LIST,
+    ROWS_PER_PAGE,
+    SERVICE_LIST,
+    SIDO_LIST,
+    ListingRow,
+    make_listing_rows,
+    make_zip,
+    render_listing_page,
+)
+
+REGION_PATH = "/nsdi/eios/service/rest/AdmService/"
+
+
+@attr.s
+class StubStatistics(object):
+    #: 목록 페이지 요청 수
+    page_count: int = attr.ib(default=0)
+    #: 지역 목록 요청 수
+    region_count: int = attr.ib(default=0)
+    #: 압축 파일 요청 수
+    download_count: int = attr.ib(default=0)
+    #: 압축 파일로 보낸 바이트 수
+    download_bytes: int = attr.ib(default=0)
+
+
+class NsdiStubHandler(http.server.BaseHTTPRequestHandler):
+    server: "NsdiStubServer"
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+    def send_body(
+        self,
+        body: bytes,
+        content_type: str,
+        status: int = 200,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_form(self) -> typing.Dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = urllib.parse.parse_qs(
+            self.rfile.read(length).decode("utf-8"), keep_blank_values=True
+        )
+        return {k: v[0] for k, v in data.items()}
+
+    def do_GET(self) -> None:
+        self.server.wait()
+        url = urllib.parse.urlparse(self.path)
+        if url.path.startswith(REGION_PATH):
+            query = urllib.parse.parse_qs(url.query)
+            adm_code = query.get("admCode", [""])[0]
+            body = self.server.region_json(url.path, adm_code)
+            self.send_body(body, "application/json; charset=utf-8")
+        else:
+            self.send_body(
+                "<html><body>국가공간정보포털</body></html>".encode("utf-8"),
+                "text/html; charset=utf-8",
+            )
+
+    def do_POST(self) -> None:
+        self.server.wait()
+        form = self.read_form()
+        if self.path.endswith("/fileDownload.do"):
+            self.send_download(form)
+        else:
+            body = self.server.listing_page(
+                form.get("svcId", ""),
+                form.get("startDate", ""),
+                form.get("endDate", ""),
+                int(form.get("pageIndexSecond") or 1),
+            )
+            self.send_body(body, "text/html; charset=utf-8")
+
+    def send_download(self, form: typing.Dict[str, str]) -> None:
+        data = self.server.zip_data(
+            form.get("svcIdDialog", ""),
+            form.get("extrcScopeDialog", ""),
+            form.get("fileNmDialog", ""),
+            form.get("opertSnDialog", ""),
+        )
+        offset = 0
+        range_header = self.headers.get("Range") or ""
+        if range_header.startswith("bytes=") and range_header.endswith("-"):
+            offset = min(int(range_header[6:-1] or 0), len(data))
+
+        body = data[offset:]
+        self.server.add_download(len(body))
+        if offset:
+            content_range = f"bytes {offset}-{len(data) - 1}/{len(data)}"
+            self.send_body(
+                body, "application/zip", 206, {"Content-Range": content_range}
+            )
+        else:
+            self.send_body(body, "application/zip")
+
+
+class NsdiStubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        rows: int = 250,
+        csv_rows: int = 1000,
+        latency: float = 0.0,
+        html_dir: typing.Optional[str] = None,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), NsdiStubHandler)
+        self.latency = latency
+        self.csv_rows = csv_rows
+        self.html_dir = html_dir
+        self.listing_dict: typing.Dict[str, typing.List[ListingRow]] = {
+            svc_id: make_listing_rows(svc_id, rows, seed)
+            for svc_id in SERVICE_LIST
+        }
+        self.statistics = StubStatistics()
+        self.statistics_lock = threading.Lock()
+        self.thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "NsdiStubServer":
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def wait(self) -> None:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def region_json(self, path: str, adm_code: str) -> bytes:
+        if path.endswith("admSiList.json"):
+            region_list = [x for x in GUGUN_LIST if x[0].startswith(adm_code)]
+        else:
+            region_list = SIDO_LIST
+        with self.statistics_lock:
+            self.statistics.region_count += 1
+        data = {
+            "admVOList": {
+                "admVOList": [
+                    {
+                        "admCode": code,
+                        "admCodeNm": name,
+                        "lowestAdmCodeNm": name,
+                    }
+                    for code, name in region_list
+                ]
+            }
+        }
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def listing_page(
+        self, svc_id: str, start_date: str, end_date: str, page_index: int
+    ) -> bytes:
+        with self.statistics_lock:
+            self.statistics.page_count += 1
+
+        if self.html_dir:
+            path = os.path.join(self.html_dir, f"{svc_id}_{page_index}.html")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return f.read()
+
+        row_list = [
+            x
+            for x in self.listing_dict.get(svc_id, [])
+            if start_date <= x.base_date <= end_date
+        ]
+        total_page = max(
+            (len(row_list) + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE, 1
+        )
+        start = (page_index - 1) * ROWS_PER_PAGE
+        return render_listing_page(
+            row_list[start:start + ROWS_PER_PAGE], page_index, total_page
+        ).encode("utf-8")
+
+    @functools.lru_cache(maxsize=64)
+    def zip_data(
+        self, svc_id: str, extrc_scope: str, file_name: str, opert_sn: str
+    ) -> bytes:
+        return make_zip(
+            svc_id, extrc_scope, file_name, opert_sn, self.csv_rows
+        )
+
+    def add_download(self, size: int) -> None:
+        with self.statistics_lock:
+            self.statistics.download_count += 1
+            self.statistics.download_bytes += size
+
+
+@click.command()
+@click.option("--port", default=8080)
+@click.option("--rows", default=250, help="서비스별 목록 행 수")
+@click.option("--csv-rows", default=1000, help="압축 파일 하나의 CSV 행 수")
+@click.option("--latency", default=0.0, help="응답 지연(초)")
+@click.option("--html-dir", default=None, type=click.Path(exists=True))
+def main(
+    port: int,
+    rows: int,
+    csv_rows: int,
+    latency: float,
+    html_dir: typing.Optional[str],
+) -> None:
+    server = NsdiStubServer(port, rows, csv_rows, latency, html_dir)
+    click.echo(f"NSDI stub server: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        click.echo(f"statistics: {attr.asdict(server.statistics)}")
+
+
+if __name__ == "__main__":
+    main()
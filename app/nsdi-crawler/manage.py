@@ -9,6 +9,12 @@ import structlog
 from tanker.utils.logging import setup_logging
 from dotenv import load_dotenv, find_dotenv
 from nsdi_crawler.crawler import NsdiCrawler
+from nsdi_crawler.crawler.upload import create_boto3_client
+from nsdi_metrics import (
+    CloudWatchMetricsExporter,
+    MetricsRegistry,
+    PrometheusTextfileExporter,
+)
 from crawler.aws_client import CloudWatchClient
 from apscheduler.schedulers.background import BackgroundScheduler
 import sentry_sdk
@@ -29,7 +35,12 @@ class Context(object):
     config: typing.Dict[str, typing.Any] = attr.ib()
 
 
-def init_runner(context: Context, run_by: str) -> typing.Callable:
+def init_runner(
+    context: Context,
+    run_by: str,
+    refresh_regions: bool = False,
+    metrics: typing.Optional[MetricsRegistry] = None,
+) -> typing.Callable:
     setup_logging(context.config["DEBUG"])
 
     sentry_sdk.init(
@@ -41,9 +52,18 @@ def init_runner(context: Context, run_by: str) -> typing.Callable:
         ],
     )
 
+    registry = metrics or MetricsRegistry()
+    textfile_path = context.config.get("METRICS_TEXTFILE")
+
     def runner() -> None:
-        crawler = NsdiCrawler(context.config)
-        crawler.run(run_by)
+        crawler = NsdiCrawler(context.config, refresh_regions, registry)
+        try:
+            crawler.run(run_by)
+        finally:
+            if textfile_path:
+                PrometheusTextfileExporter(
+                    textfile_path, "nsdi_crawler", registry
+                ).export()
 
     return runner
 
@@ -90,15 +110,51 @@ def shell(ctx: typing.Any, no_ipython: typing.Any) -> None:
 
 
 @cli.command()
+@click.option(
+    "--refresh-regions",
+    default=False,
+    is_flag=True,
+    help="지역 목록 캐시를 무시하고 NSDI 에서 다시 받습니다",
+)
 @click.pass_context
-def run(ctx: typing.Any) -> None:
+def run(ctx: typing.Any, refresh_regions: bool) -> None:
     context: Context = ctx.obj["context"]
 
-    runner = init_runner(context, "DEVELOPER")
+    runner = init_runner(context, "DEVELOPER", refresh_regions)
 
     runner()
 
 
+@cli.command()
+@click.option(
+    "--name-type",
+    "name_type_list",
+    multiple=True,
+    default=["토지이용계획정보", "토지특성정보"],
+)
+@click.pass_context
+def repair_log_pointer(
+    ctx: typing.Any, name_type_list: typing.Tuple[str, ...]
+) -> None:
+    """
+    S3 전체 목록에서 최신 크롤러 로그를 찾아 latest 포인터를 다시 작성합니다.
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    crawler = NsdiCrawler(context.config)
+    for name_type in name_type_list:
+        pointer = crawler.repair_crawler_log_pointer(name_type)
+        if pointer is None:
+            logger.warning("Crawler log not found", name_type=name_type)
+        else:
+            logger.info(
+                "Repair crawler log pointer",
+                name_type=name_type,
+                log_key=pointer.log_key,
+            )
+
+
 # scheduled tasks로 돌릴 때 사용하는 함수이고, cloudwatch 로그를 찍습니다.
 @cli.command()
 @click.pass_context
@@ -106,11 +162,20 @@ def run_scheduler(ctx: typing.Any) -> None:
     context: Context = ctx.obj["context"]
 
     cloudwatch = CloudWatchClient(context.config)
+    metrics = MetricsRegistry()
+    exporter: typing.Optional[CloudWatchMetricsExporter] = None
+    if context.config.get("CLOUDWATCH_METRICS") != "OFF":
+        exporter = CloudWatchMetricsExporter(
+            create_boto3_client(context.config, "cloudwatch"),
+            "NsdiCrawler",
+            metrics,
+            context.config["ENVIRONMENT"],
+        )
 
     scheduler = BackgroundScheduler()
     scheduler.add_job(
         _run_cloudwatch_log,
-        args=[cloudwatch],
+        args=[cloudwatch, exporter],
         id="cloudwatch_log",
         name="cloudwatch_log",
         trigger="cron",
@@ -119,14 +184,20 @@ def run_scheduler(ctx: typing.Any) -> None:
 
     scheduler.start()
 
-    runner = init_runner(context, "SCHEDULER")
-
-    runner()
+    runner = init_runner(context, "SCHEDULER", metrics=metrics)
 
-    scheduler.remove_job("cloudwatch_log")
+    try:
+        runner()
+    finally:
+        scheduler.remove_job("cloudwatch_log")
+        # 마지막 전송 이후 1분이 되지 않은 지표도 보냅니다
+        _export_metrics(exporter)
 
 
-def _run_cloudwatch_log(client: CloudWatchClient) -> None:
+def _run_cloudwatch_log(
+    client: CloudWatchClient,
+    exporter: typing.Optional[CloudWatchMetricsExporter] = None,
+) -> None:
     try:
         client.put_metric(
             "NsdiCrawler",
@@ -147,6 +218,22 @@ def _run_cloudwatch_log(client: CloudWatchClient) -> None:
     except Exception as e:
         logger.error("Exception while cloudwatch scheduler", exc_info=e)
 
+    _export_metrics(exporter)
+
+
+def _export_metrics(
+    exporter: typing.Optional[CloudWatchMetricsExporter],
+) -> None:
+    """
+    단계별 지표(페이지 조회, 파싱, 다운로드, S3 업로드 등)를 PutMetricData 로 묶어서 보냅니다.
+    """
+    if exporter is None:
+        return
+    try:
+        exporter.export()
+    except Exception as e:
+        logger.error("Exception while exporting metrics", exc_info=e)
+
 
 def main() -> None:
     cli()
@@ -1,5 +1,16 @@
+from .async_client import NsdiAsyncClient
 from .client import NsdiClient
+from .download import DownloadJournal, NsdiResumableDownloader
+from .loop import EventLoopThread, NsdiLoopClient
+from .ratelimit import AsyncRateLimiter, RateLimiter
 
 __all__ = [
+    'NsdiAsyncClient',
     'NsdiClient',
+    'DownloadJournal',
+    'NsdiResumableDownloader',
+    'EventLoopThread',
+    'NsdiLoopClient',
+    'AsyncRateLimiter',
+    'RateLimiter',
 ]
@@ -0,0 +1,305 @@
+import asyncio
+import json
+import types
+import typing
+
+import aiohttp
+
+from nsdi_crawler.client.exc import NsdiClientResponseError
+from .client import BASE_URL, USER_AGENT
+from .data import (
+    NsdiLandUsingInfoResponse,
+    NsdiLandUsingInfo,
+    NsdiRegion,
+    PARSER_BS4,
+)
+from .ratelimit import AsyncRateLimiter
+
+
+class NsdiAsyncClient(object):
+    """
+    NsdiClient 와 같은 요청을 asyncio 이벤트 루프에서 보낼 수 있도록 aiohttp 로 구현한 클라이언트입니다.
+    세션과 쿠키를 유지해야 하므로 async with 안에서 사용합니다.
+
+        async with NsdiAsyncClient(config) as client:
+            response = await client.init_page("NIDO", "F", "F", "F014")
+            region_list = await client.fetch_region_list(response)
+    """
+
+    def __init__(
+        self,
+        config: typing.Dict[str, typing.Any],
+        rate_limiter: typing.Optional[AsyncRateLimiter] = None,
+    ) -> None:
+        super().__init__()
+
+        proxy = config.get("PROXY_HOST") or None
+        if proxy and "://" not in proxy:
+            proxy = f"http://{proxy}"
+        self.proxy: typing.Optional[str] = proxy
+        self.base_url = (config.get("NSDI_BASE_URL") or BASE_URL).rstrip("/")
+        self.connection_limit = max(int(config.get("PAGE_WORKERS") or 1), 10)
+        self.rate_limiter = rate_limiter
+        self.parser = config.get("PARSER") or PARSER_BS4
+        self.keep_raw_html = config.get("KEEP_RAW_HTML") == "ON"
+        # Header Settings
+        self.headers: typing.Dict[str, str] = {"User-Agent": USER_AGENT}
+        self.session: typing.Optional[aiohttp.ClientSession] = None
+        # Retryer 와 같이 연결 오류만 최대 3번까지 재시도합니다
+        self.max_trials = 3
+
+    async def __aenter__(self) -> "NsdiAsyncClient":
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.connection_limit
+                ),
+            )
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(
+        self, method: str, url: str, **kwargs: typing.Any
+    ) -> aiohttp.ClientResponse:
+        if self.session is None:
+            raise RuntimeError("NsdiAsyncClient session is not opened")
+
+        trial = 1
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            try:
+                return await self.session.request(
+                    method,
+                    self.base_url + url,
+                    headers=self.headers,
+                    proxy=self.proxy,
+                    **kwargs,
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if trial >= self.max_trials:
+                    raise
+                # ExponentialModulusBackoffStrategy(2, 10) 와 같은 간격으로 대기합니다
+                await asyncio.sleep(min(2 ** trial, 10))
+                trial += 1
+
+    async def _read_text(self, r: aiohttp.ClientResponse) -> str:
+        # 본문을 읽지 않은 오류 응답은 커넥션을 돌려주지 않으므로 직접 반환합니다
+        try:
+            r.raise_for_status()
+        except aiohttp.ClientResponseError:
+            r.release()
+            raise
+        return await r.text()
+
+    async def _handle_json_response(
+        self, r: aiohttp.ClientResponse
+    ) -> typing.Dict[str, typing.Any]:
+        text = await self._read_text(r)
+
+        try:
+            return json.loads(text)
+        except (json.JSONDecodeError, ValueError):
+            raise NsdiClientResponseError(r.status, text)
+
+    async def _handle_text_response(self, r: aiohttp.ClientResponse) -> str:
+        text = await self._read_text(r)
+
+        try:
+            json.loads(text)
+        except (json.JSONDecodeError, ValueError):
+            return text
+        else:
+            raise NsdiClientResponseError(r.status, text)
+
+    async def init_page(
+        self, prov_org: str, gubun: str, svc_se: str, svc_id: str
+    ) -> aiohttp.ClientResponse:
+        # 세션에 쿠키와 세션정보를 넣어줌
+        params1 = {
+            "provOrg": prov_org,
+            "gubun": gubun,
+        }
+
+        parmas = {
+            "svcSe": svc_se,
+            "svcId": svc_id,
+        }
+
+        response1 = await self._request(
+            "GET", "/nsdi/eios/OpenapiList.do", params=params1
+        )
+        await self._handle_text_response(response1)
+
+        response = await self._request(
+            "GET", "/nsdi/eios/ServiceDetail.do", params=parmas
+        )
+        await self._handle_text_response(response)
+
+        return response
+
+    async def fetch_land_using_info_html(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+        page_index: int,
+    ) -> str:
+        """
+        목록 페이지 HTML 을 반환합니다. 파싱은 이벤트 루프를 막지 않도록 호출한 쪽에서 합니다.
+        """
+
+        data = {
+            "svcSe": svc_se,
+            "svcId": svc_id,
+            "pageIndex": "1",
+            "provOrg": prov_org,
+            "startDate": start_date,
+            "endDate": end_date,
+            "doArea": "",
+            "svcNmSearch": "",
+            "pageIndexSecond": "1",
+        }
+
+        if prov_org == "NIDO":
+            data.update(
+                {
+                    "extrcSeSearch": extrc_se_search,
+                }
+            )
+
+        if page_index:
+            data.update({"pageIndexSecond": str(page_index)})
+
+        return await self._handle_text_response(
+            await self._request(
+                "POST", "/nsdi/eios/ServiceDetail.do", data=data
+            )
+        )
+
+    async def fetch_land_using_info_table(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+        page_index: int,
+    ) -> NsdiLandUsingInfoResponse:
+        response = await self.fetch_land_using_info_html(
+            svc_se,
+            svc_id,
+            start_date,
+            end_date,
+            extrc_se_search,
+            prov_org,
+            page_index,
+        )
+
+        return NsdiLandUsingInfoResponse.from_html(
+            response, self.parser, self.keep_raw_html
+        )
+
+    async def fetch_download_response(
+        self,
+        table_data: NsdiLandUsingInfo.NsdiTableData, prov_org: str
+    ) -> aiohttp.ClientResponse:
+        """
+        본문을 읽지 않은 응답을 반환합니다.
+        response.content.iter_chunked 로 읽은 후 반드시 response.release() 를 호출해주세요.
+        """
+        data = {
+            "opertSnDialog": table_data.opert_sn_dialog,
+            "fileNmDialog": table_data.file_nm_dialog,
+            "extrcScopeDialog": table_data.extrc_scope_dialog,
+            "extrcSeDialog": table_data.extrc_se_dialog,
+            "extrcDtDialog": table_data.extrc_dt_dialog,
+            "svcIdDialog": table_data.svcld_dialog,
+            "checkedValue": "",
+            "downloadFileTy": "",
+            "provOrg": prov_org,
+        }
+
+        response = await self._request(
+            "POST", "/nsdi/eios/fileDownload.do", data=data
+        )
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientResponseError:
+            response.release()
+            raise
+
+        return response
+
+    async def download(
+        self,
+        table_data: NsdiLandUsingInfo.NsdiTableData,
+        prov_org: str,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        압축 파일을 chunk_size 단위로 file_path 에 저장하고 저장한 바이트 수를 반환합니다.
+        """
+        response = await self.fetch_download_response(table_data, prov_org)
+        size = 0
+        try:
+            with open(file_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.release()
+
+        return size
+
+    async def fetch_region_list(
+        self, response: aiohttp.ClientResponse
+    ) -> typing.List[NsdiRegion]:
+        self.headers.update({"Referer": str(response.url)})
+
+        data = await self._handle_json_response(
+            await self._request(
+                "GET", "/nsdi/eios/service/rest/AdmService/admCodeList.json",
+            )
+        )
+
+        region_list = data["admVOList"]["admVOList"]
+
+        return [NsdiRegion.from_json(x) for x in region_list]
+
+    async def fetch_region_detail_list(
+        self, adm_code: str
+    ) -> typing.List[NsdiRegion]:
+
+        params = {"admCode": adm_code}
+        data = await self._handle_json_response(
+            await self._request(
+                "GET",
+                "/nsdi/eios/service/rest/AdmService/admSiList.json",
+                params=params,
+            )
+        )
+
+        region_detail_list = data["admVOList"]["admVOList"]
+
+        return [NsdiRegion.from_json(x) for x in region_detail_list]
@@ -2,12 +2,22 @@ import functools
 import json
 import typing
 import requests
+from requests.adapters import HTTPAdapter
 from requests_toolbelt.sessions import BaseUrlSession
 from tanker.utils.requests import apply_proxy
 from tanker.utils.retryer import Retryer
 from tanker.utils.retryer.strategy import ExponentialModulusBackoffStrategy
 from nsdi_crawler.client.exc import NsdiClientResponseError
-from .data import NsdiLandUsingInfoResponse, NsdiLandUsingInfo, NsdiRegion
+from nsdi_metrics import MetricsRegistry
+from .data import (
+    NsdiLandUsingInfoResponse,
+    NsdiLandUsingInfo,
+    NsdiRegion,
+    PARSER_BS4,
+)
+from .ratelimit import RateLimiter
+
+BASE_URL = "http://openapi.nsdi.go.kr"
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
@@ -17,13 +27,26 @@ USER_AGENT = (
 
 
 class NsdiClient(object):
-    def __init__(self, config: typing.Dict[str, typing.Any]) -> None:
+    def __init__(
+        self,
+        config: typing.Dict[str, typing.Any],
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+    ) -> None:
         super().__init__()
 
         proxy = config.get("PROXY_HOST") or None
+        # 페이지를 병렬로 가져올 때 워커 수만큼 커넥션을 유지합니다
+        pool_size = max(int(config.get("PAGE_WORKERS") or 1), 10)
         # Header Settings
-        self.session = BaseUrlSession("http://openapi.nsdi.go.kr/")
+        base_url = config.get("NSDI_BASE_URL") or BASE_URL
+        self.session = BaseUrlSession(base_url.rstrip("/") + "/")
         self.session.headers.update({"User-Agent": USER_AGENT})
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=pool_size))
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or MetricsRegistry()
+        self.parser = config.get("PARSER") or PARSER_BS4
+        self.keep_raw_html = config.get("KEEP_RAW_HTML") == "ON"
 
         if proxy:
             apply_proxy(self.session, proxy)
@@ -38,6 +61,14 @@ class NsdiClient(object):
             default_max_trials=3,
         )
 
+    def _request(
+        self, method: str, url: str, **kwargs: typing.Any
+    ) -> requests.Response:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        return self.session.request(method, url, **kwargs)
+
     def _handle_json_response(
         self, r: requests.Response
     ) -> typing.Dict[str, typing.Any]:
@@ -73,13 +104,13 @@ class NsdiClient(object):
             "svcId": svc_id,
         }
 
-        response1 = self.session.get(
-            "/nsdi/eios/OpenapiList.do", params=params1
+        response1 = self._request(
+            "GET", "/nsdi/eios/OpenapiList.do", params=params1
         )
         self._handle_text_response(response1)
 
-        response = self.session.get(
-            "/nsdi/eios/ServiceDetail.do", params=parmas
+        response = self._request(
+            "GET", "/nsdi/eios/ServiceDetail.do", params=parmas
         )
         self._handle_text_response(response)
 
@@ -118,24 +149,36 @@ class NsdiClient(object):
         if page_index:
             data.update({"pageIndexSecond": str(page_index)})
 
-        response = self._handle_text_response(
-            self.retryer.run(
-                (
-                    functools.partial(
-                        self.session.post,
-                        "/nsdi/eios/ServiceDetail.do",
-                        data=data,
+        with self.metrics.timer("page_fetch"):
+            response = self._handle_text_response(
+                self.retryer.run(
+                    (
+                        functools.partial(
+                            self._request,
+                            "POST",
+                            "/nsdi/eios/ServiceDetail.do",
+                            data=data,
+                        )
                     )
                 )
             )
-        )
 
-        return NsdiLandUsingInfoResponse.from_html(response)
+        with self.metrics.timer("page_parse"):
+            return NsdiLandUsingInfoResponse.from_html(
+                response, self.parser, self.keep_raw_html
+            )
 
     def fetch_download_response(
         self,
-        table_data: NsdiLandUsingInfo.NsdiTableData, prov_org: str
+        table_data: NsdiLandUsingInfo.NsdiTableData,
+        prov_org: str,
+        offset: int = 0,
     ) -> requests.Response:
+        """
+        offset 이 있으면 Range 헤더로 이어받기를 요청합니다.
+        서버가 Range 를 지원하지 않으면 200 응답으로 처음부터 내려올 수 있습니다.
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
         data = {
             "opertSnDialog": table_data.opert_sn_dialog,
             "fileNmDialog": table_data.file_nm_dialog,
@@ -150,7 +193,12 @@ class NsdiClient(object):
 
         response = self.retryer.run(
             functools.partial(
-                self.session.post, "/nsdi/eios/fileDownload.do", data=data
+                self._request,
+                "POST",
+                "/nsdi/eios/fileDownload.do",
+                data=data,
+                headers=headers,
+                stream=True,
             )
         )
         # 다운로드시에 response.iter_content를 사용해야하기때문에 이와 같이 설정하였습니다
@@ -166,7 +214,8 @@ class NsdiClient(object):
         response = self._handle_json_response(
             self.retryer.run(
                 functools.partial(
-                    self.session.get,
+                    self._request,
+                    "GET",
                     "/nsdi/eios/service/rest/AdmService/admCodeList.json",
                 )
             )
@@ -184,7 +233,8 @@ class NsdiClient(object):
         response = self._handle_json_response(
             self.retryer.run(
                 functools.partial(
-                    self.session.get,
+                    self._request,
+                    "GET",
                     "/nsdi/eios/service/rest/AdmService/admSiList.json",
                     params=params,
                 )
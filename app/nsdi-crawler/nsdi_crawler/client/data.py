@@ -1,25 +1,48 @@
+import html
 import typing
 from abc import abstractmethod, ABCMeta
 import attr
 import re
 import bs4
+import lxml.html
+
+from .exc import NsdiClientParseError
+
+#: 목록 페이지 파서 : bs4(BeautifulSoup + CSS select), lxml(lxml.html + XPath)
+PARSER_BS4 = "bs4"
+PARSER_LXML = "lxml"
+
+_FILE_LIST_TBODY_XPATH = "//*[@id='fileListForm']/table/tbody"
+_LAST_PAGE_XPATH = (
+    "//button[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' btn-last ')]/@onclick"
+)
 
 
 class NsdiHtmlData(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def to_html(self) -> str:
         pass
 
 
 class NsdiIndexData(NsdiHtmlData):
+    __slots__ = ()
+
     @abstractmethod
     def pk(self) -> str:
         pass
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class NsdiLandUsingInfo(NsdiHtmlData):
-    @attr.s(frozen=True)
+    """
+    목록 페이지가 많아도 메모리를 적게 쓰도록 기본적으로 원본 HTML(raw_data)은 보관하지 않습니다.
+    keep_raw=True 로 파싱한 경우에만 원본을 보관하며 to_html 은 원본이 없으면 필드로 다시 만듭니다.
+    """
+
+    @attr.s(frozen=True, slots=True)
     class NsdiTableData(NsdiHtmlData):
         # data : F014
         # description : ?
@@ -40,14 +63,33 @@ class NsdiLandUsingInfo(NsdiHtmlData):
         # description : ?
         opert_sn_dialog: str = attr.ib()
         # 원본 데이터
-        raw_data: str = attr.ib()
+        raw_data: typing.Optional[str] = attr.ib(
+            default=None, repr=False, eq=False
+        )
 
         @classmethod
         def from_html(
                 cls,
-                data: bs4.element.Tag
+                data: bs4.element.Tag,
+                keep_raw: bool = False
         ) -> "NsdiLandUsingInfo.NsdiTableData":
             value = data['onclick']  # onclick 속성 가져오기
+            return cls.from_onclick(value, keep_raw)
+
+        @classmethod
+        def from_lxml(
+                cls,
+                data: lxml.html.HtmlElement,
+                keep_raw: bool = False
+        ) -> "NsdiLandUsingInfo.NsdiTableData":
+            return cls.from_onclick(data.get('onclick'), keep_raw)
+
+        @classmethod
+        def from_onclick(
+                cls,
+                value: str,
+                keep_raw: bool = False
+        ) -> "NsdiLandUsingInfo.NsdiTableData":
             data = re.findall(r"['\"](.*?)['\"]", value)
             svcld_dialog = data[0]
             extrc_dt_dialog = data[1]
@@ -55,7 +97,7 @@ class NsdiLandUsingInfo(NsdiHtmlData):
             extrc_scope_dialog = data[3]
             file_nm_dialog = data[4]
             opert_sn_dialog = data[5]
-            raw_data = str(data)
+            raw_data = str(data) if keep_raw else None
 
             return cls(
                 svcld_dialog=svcld_dialog,
@@ -68,7 +110,25 @@ class NsdiLandUsingInfo(NsdiHtmlData):
             )
 
         def to_html(self) -> str:
-            return self.raw_data
+            if self.raw_data is not None:
+                return self.raw_data
+
+            args = ", ".join(
+                f"'{x}'"
+                for x in (
+                    self.svcld_dialog,
+                    self.extrc_dt_dialog,
+                    self.extrc_se_dialog,
+                    self.extrc_scope_dialog,
+                    self.file_nm_dialog,
+                    self.opert_sn_dialog,
+                )
+            )
+            return (
+                '<button type="button" class="btn-down" '
+                f'onclick="{html.escape(f"fn_fileDownload({args});")}">'
+                '다운로드</button>'
+            )
 
     # data : 전체데이터, 변동데이터
     # description : 구분
@@ -89,10 +149,12 @@ class NsdiLandUsingInfo(NsdiHtmlData):
     # description : 구분
     table_data: NsdiTableData = attr.ib()
     #: Raw tr data
-    raw_data: str = attr.ib()
+    raw_data: typing.Optional[str] = attr.ib(
+        default=None, repr=False, eq=False
+    )
 
     @classmethod
-    def from_html(cls, tr: bs4.element.Tag
+    def from_html(cls, tr: bs4.element.Tag, keep_raw: bool = False
                   ) -> "NsdiLandUsingInfo":
         td_list = tr.select("td")
         data_type = td_list[0].text.strip()
@@ -101,7 +163,9 @@ class NsdiLandUsingInfo(NsdiHtmlData):
         base_date = td_list[3].text.strip()
         file_size = td_list[4].text.strip()
         button_value = td_list[5].select("button")[0]
-        table_data = NsdiLandUsingInfo.NsdiTableData.from_html(button_value)
+        table_data = NsdiLandUsingInfo.NsdiTableData.from_html(
+            button_value, keep_raw
+        )
 
         return cls(
             data_type=data_type,
@@ -110,14 +174,54 @@ class NsdiLandUsingInfo(NsdiHtmlData):
             base_date=base_date,
             file_size=file_size,
             table_data=table_data,
-            raw_data=str(tr)
+            raw_data=str(tr) if keep_raw else None
+        )
+
+    @classmethod
+    def from_lxml(cls, tr: lxml.html.HtmlElement, keep_raw: bool = False
+                  ) -> "NsdiLandUsingInfo":
+        td_list = tr.xpath(".//td")
+        data_type = td_list[0].text_content().strip()
+        city_type = td_list[1].text_content().strip()
+        name_type = td_list[2].text_content().strip()
+        base_date = td_list[3].text_content().strip()
+        file_size = td_list[4].text_content().strip()
+        button_value = td_list[5].xpath(".//button")[0]
+        table_data = NsdiLandUsingInfo.NsdiTableData.from_lxml(
+            button_value, keep_raw
+        )
+
+        return cls(
+            data_type=data_type,
+            city_type=city_type,
+            name_type=name_type,
+            base_date=base_date,
+            file_size=file_size,
+            table_data=table_data,
+            raw_data=(
+                lxml.html.tostring(tr, encoding="unicode")
+                if keep_raw else None
+            )
         )
 
     def to_html(self) -> str:
-        return self.raw_data
+        if self.raw_data is not None:
+            return self.raw_data
+
+        td_list = "".join(
+            f"<td>{html.escape(x or '')}</td>"
+            for x in (
+                self.data_type,
+                self.city_type,
+                self.name_type,
+                self.base_date,
+                self.file_size,
+            )
+        )
+        return f"<tr>{td_list}<td>{self.table_data.to_html()}</td></tr>"
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class NsdiLandUsingInfoResponse(NsdiHtmlData):
     # data: []
     # description: 토지이용정보
@@ -126,10 +230,17 @@ class NsdiLandUsingInfoResponse(NsdiHtmlData):
     # description: 총 페이지 수
     total_page: int = attr.ib()
     #: Raw 페이지 네이션
-    raw_data: str = attr.ib()
+    raw_data: typing.Optional[str] = attr.ib(
+        default=None, repr=False, eq=False
+    )
 
     @classmethod
-    def from_html(cls, data: str) -> "NsdiLandUsingInfoResponse":
+    def from_html(
+        cls, data: str, parser: str = PARSER_BS4, keep_raw: bool = False
+    ) -> "NsdiLandUsingInfoResponse":
+        if parser == PARSER_LXML:
+            return cls.from_lxml(data, keep_raw)
+
         soup = bs4.BeautifulSoup(data, 'lxml')
         tbody = soup.select("#fileListForm > table > tbody")
         tr_list = tbody[0].select("tr")
@@ -140,13 +251,47 @@ class NsdiLandUsingInfoResponse(NsdiHtmlData):
 
         return cls(
             land_using_info=[
-                NsdiLandUsingInfo.from_html(x) for x in tr_list],
+                NsdiLandUsingInfo.from_html(x, keep_raw) for x in tr_list],
             total_page=total_page,
-            raw_data=str(data)
+            raw_data=str(data) if keep_raw else None
+        )
+
+    @classmethod
+    def from_lxml(
+        cls, data: str, keep_raw: bool = False
+    ) -> "NsdiLandUsingInfoResponse":
+        """
+        BeautifulSoup 트리를 만들지 않고 lxml XPath 로 파일 목록과 마지막 페이지 버튼만 읽습니다.
+        """
+        root = lxml.html.fromstring(data)
+        tbody = root.xpath(_FILE_LIST_TBODY_XPATH)
+        tr_list = tbody[0].xpath(".//tr")
+
+        total_page_value = root.xpath(_LAST_PAGE_XPATH)
+        if not total_page_value:
+            raise NsdiClientParseError("not found last page button")
+        total_page = int(re.findall(r"\d+", total_page_value[0])[0])
+
+        return cls(
+            land_using_info=[
+                NsdiLandUsingInfo.from_lxml(x, keep_raw) for x in tr_list],
+            total_page=total_page,
+            raw_data=str(data) if keep_raw else None
         )
 
     def to_html(self) -> str:
-        return self.raw_data
+        if self.raw_data is not None:
+            return self.raw_data
+
+        tr_list = "".join(x.to_html() for x in self.land_using_info)
+        return (
+            '<form id="fileListForm"><table>'
+            f"<tbody>{tr_list}</tbody>"
+            '</table></form>'
+            '<button type="button" class="btn-last" '
+            f'onclick="fn_egov_link_page_second({self.total_page});">'
+            '</button>'
+        )
 
 
 @attr.s(frozen=True)
@@ -197,3 +342,17 @@ class NsdiRegion(object):
             regstrSeCode=data.get("regstrSeCode"),
             pnu=data.get("pnu")
         )
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "lowestAdmCodeNm": self.lowest_adm_code_nm,
+            "admCode": self.adm_code,
+            "admCodeNm": self.adm_code_nm,
+            "lnm": self.lnm,
+            "mnnm": self.mnnm,
+            "slno": self.slno,
+            "ldEmdLiCode": self.ldEmdLiCode,
+            "ldCpsgCode": self.ldCpsgCode,
+            "regstrSeCode": self.regstrSeCode,
+            "pnu": self.pnu,
+        }
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import re
+import time
+import typing
+
+import attr
+import requests
+import structlog
+
+from .client import NsdiClient
+from .data import NsdiLandUsingInfo
+
+logger = structlog.get_logger(__name__)
+
+#: 다운로드 도중 연결이 끊겼을 때 이어받기를 시도할 오류
+RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+
+class NsdiIncompleteDownloadError(requests.exceptions.ConnectionError):
+    pass
+
+
+@attr.s
+class DownloadJournal(object):
+    #: 파일 이름
+    file_name: str = attr.ib()
+    #: 디스크에 저장이 끝난 바이트 수
+    offset: int = attr.ib(default=0)
+    #: 전체 파일 크기 (알 수 없으면 None)
+    total_size: typing.Optional[int] = attr.ib(default=None)
+    #: 다운로드가 끝난 파일의 sha256
+    sha256: typing.Optional[str] = attr.ib(default=None)
+    completed: bool = attr.ib(default=False)
+
+    class DownloadJournalData(typing.Dict):
+        file_name: str
+        offset: int
+        total_size: typing.Optional[int]
+        sha256: typing.Optional[str]
+        completed: bool
+
+    @classmethod
+    def from_json(cls, data: DownloadJournalData) -> "DownloadJournal":
+        return cls(
+            file_name=data["file_name"],
+            offset=data["offset"],
+            total_size=data.get("total_size"),
+            sha256=data.get("sha256"),
+            completed=data.get("completed", False),
+        )
+
+    @classmethod
+    def load(cls, path: str, file_name: str) -> "DownloadJournal":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                journal = cls.from_json(json.load(f))
+        except (IOError, ValueError, KeyError):
+            return cls(file_name=file_name)
+
+        if journal.file_name != file_name:
+            return cls(file_name=file_name)
+        return journal
+
+    def save(self, path: str) -> None:
+        # 저장 도중 종료되어도 이전 저널이 남도록 임시 파일에 쓴 후 교체합니다
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(attr.asdict(self), f)
+        os.replace(temp_path, path)
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class NsdiResumableDownloader(object):
+    """
+    압축 파일을 이어받기가 가능하도록 다운로드합니다.
+    저장한 바이트 수는 '<파일>.journal' 에 기록하고 재시도할 때는 그 위치부터 이어받습니다.
+    서버가 Range 요청을 지원하지 않으면 처음부터 다시 받되 이미 저장한 부분은 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        nsdi_client: NsdiClient,
+        max_trials: int = 5,
+        chunk_size: int = 1024 * 1024,
+        journal_interval: int = 8 * 1024 * 1024,
+    ) -> None:
+        super().__init__()
+        self.nsdi_client = nsdi_client
+        self.max_trials = max_trials
+        self.chunk_size = chunk_size
+        self.journal_interval = journal_interval
+
+    @staticmethod
+    def journal_path(file_path: str) -> str:
+        return file_path + ".journal"
+
+    def download(
+        self,
+        table_data: NsdiLandUsingInfo.NsdiTableData,
+        prov_org: str,
+        file_path: str,
+    ) -> DownloadJournal:
+        journal_path = self.journal_path(file_path)
+        journal = DownloadJournal.load(
+            journal_path, table_data.file_nm_dialog
+        )
+
+        if journal.completed and os.path.exists(file_path):
+            if file_sha256(file_path) == journal.sha256:
+                return journal
+            journal = DownloadJournal(file_name=table_data.file_nm_dialog)
+
+        if not os.path.exists(file_path):
+            journal.offset = 0
+
+        trial = 1
+        while True:
+            try:
+                self._download_once(table_data, prov_org, file_path, journal)
+                break
+            except RESUMABLE_ERRORS as e:
+                journal.save(journal_path)
+                if trial >= self.max_trials:
+                    raise
+                logger.warning(
+                    "Resume download",
+                    file_name=journal.file_name,
+                    offset=journal.offset,
+                    trial=trial,
+                    error=str(e),
+                )
+                time.sleep(min(2 ** trial, 10))
+                trial += 1
+
+        journal.sha256 = file_sha256(file_path)
+        journal.completed = True
+        journal.save(journal_path)
+
+        return journal
+
+    def _download_once(
+        self,
+        table_data: NsdiLandUsingInfo.NsdiTableData,
+        prov_org: str,
+        file_path: str,
+        journal: DownloadJournal,
+    ) -> None:
+        try:
+            response = self.nsdi_client.fetch_download_response(
+                table_data, prov_org, offset=journal.offset
+            )
+        except requests.exceptions.HTTPError as e:
+            if (
+                e.response is None
+                or e.response.status_code != 416
+                or not journal.offset
+            ):
+                raise
+            e.response.close()
+            self._resolve_range_not_satisfiable(e.response, file_path, journal)
+            return
+
+        try:
+            skip = self._resolve_skip(response, journal)
+            mode = "r+b" if os.path.exists(file_path) else "wb"
+            with open(file_path, mode) as f:
+                # 저널에 기록되지 않은 뒷부분은 신뢰할 수 없으므로 잘라냅니다
+                f.seek(journal.offset)
+                f.truncate()
+                unsaved = 0
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if skip:
+                        skipped = min(skip, len(chunk))
+                        chunk = chunk[skipped:]
+                        skip -= skipped
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    journal.offset += len(chunk)
+                    unsaved += len(chunk)
+                    if unsaved >= self.journal_interval:
+                        f.flush()
+                        journal.save(self.journal_path(file_path))
+                        unsaved = 0
+        finally:
+            response.close()
+
+        if journal.total_size is not None and (
+            journal.offset < journal.total_size
+        ):
+            raise NsdiIncompleteDownloadError(
+                f"{journal.file_name}: "
+                f"{journal.offset}/{journal.total_size} bytes"
+            )
+
+    def _resolve_range_not_satisfiable(
+        self,
+        response: requests.Response,
+        file_path: str,
+        journal: DownloadJournal,
+    ) -> None:
+        """
+        저장한 위치부터 요청했는데 416 이 오면 마지막 조각까지 저장하고 완료를 기록하기 전에
+        종료된 경우입니다. 저장한 크기가 전체 크기와 같으면 다운로드가 끝난 것으로 보고
+        (sha256 은 download 에서 기록합니다) 아니면 처음부터 다시 받습니다.
+        """
+        match = re.match(
+            r"bytes \*/(\d+)", response.headers.get("Content-Range", "")
+        )
+        if match:
+            journal.total_size = int(match.group(1))
+
+        if (
+            journal.total_size is not None
+            and journal.offset == journal.total_size
+            and os.path.getsize(file_path) >= journal.offset
+        ):
+            with open(file_path, "r+b") as f:
+                f.truncate(journal.offset)
+            return
+
+        logger.warning(
+            "Restart download",
+            file_name=journal.file_name,
+            offset=journal.offset,
+            total_size=journal.total_size,
+        )
+        journal.offset = 0
+        journal.total_size = None
+        raise NsdiIncompleteDownloadError(
+            f"{journal.file_name}: range not satisfiable"
+        )
+
+    def _resolve_skip(
+        self, response: requests.Response, journal: DownloadJournal
+    ) -> int:
+        """
+        응답 본문에서 이미 저장한 부분만큼 건너뛸 바이트 수를 반환합니다.
+        """
+        content_range = response.headers.get("Content-Range", "")
+        match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", content_range)
+        if response.status_code == 206 and match:
+            start, total = match.groups()
+            if total != "*":
+                journal.total_size = int(total)
+            if int(start) > journal.offset:
+                # 저장한 위치 이후부터 내려오면 이어붙일 수 없으므로 처음부터 다시 받습니다
+                journal.offset = 0
+                raise NsdiIncompleteDownloadError(
+                    f"{journal.file_name}: unexpected range {content_range}"
+                )
+            return journal.offset - int(start)
+
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            journal.total_size = int(content_length)
+
+        return journal.offset
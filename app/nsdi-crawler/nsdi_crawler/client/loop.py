@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import typing
+
+import aiohttp
+from nsdi_metrics import MetricsRegistry
+
+from .async_client import NsdiAsyncClient
+from .data import NsdiLandUsingInfoResponse, NsdiLandUsingInfo, NsdiRegion
+from .ratelimit import AsyncRateLimiter
+
+T = typing.TypeVar("T")
+
+
+class EventLoopThread(object):
+    """
+    별도 스레드에서 asyncio 이벤트 루프를 실행하고 다른 스레드가 코루틴을 맡길 수 있게 합니다.
+    처음 run 을 호출할 때 스레드를 시작하며 stop 후에는 다시 사용할 수 없습니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        self.thread: typing.Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.loop.run_forever,
+                    name="nsdi-event-loop",
+                    daemon=True,
+                )
+                self.thread.start()
+
+    def run(self, coro: typing.Awaitable[T]) -> T:
+        """
+        코루틴을 이벤트 루프에서 실행하고 끝날 때까지 기다린 후 결과를 반환합니다.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self) -> None:
+        with self.lock:
+            if self.thread is not None:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self.thread.join()
+                self.thread = None
+            if not self.loop.is_closed():
+                self.loop.close()
+
+
+class NsdiLoopClient(object):
+    """
+    NsdiClient 와 같은 메소드로 NsdiAsyncClient 요청을 EventLoopThread 에서 실행합니다.
+    크롤러의 스레드 풀은 그대로 두고 소켓 입출력만 하나의 이벤트 루프에 모으므로
+    NIDO, SCOS 의 목록, 지역, 다운로드 요청이 한 스레드에서 동시에 처리됩니다.
+    목록 페이지 파싱은 이벤트 루프를 막지 않도록 호출한 스레드에서 합니다.
+    """
+
+    def __init__(
+        self,
+        config: typing.Dict[str, typing.Any],
+        event_loop: EventLoopThread,
+        rate_limiter: typing.Optional[AsyncRateLimiter] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+    ) -> None:
+        super().__init__()
+        self.event_loop = event_loop
+        self.client = NsdiAsyncClient(config, rate_limiter)
+        self.metrics = metrics or MetricsRegistry()
+
+    def _run(
+        self,
+        fn: typing.Callable[..., typing.Awaitable[T]],
+        *args: typing.Any,
+    ) -> T:
+        async def call() -> T:
+            # 세션은 이벤트 루프 안에서 만들어야 하므로 첫 요청에서 엽니다
+            await self.client.open()
+            return await fn(*args)
+
+        return self.event_loop.run(call())
+
+    def close(self) -> None:
+        self.event_loop.run(self.client.close())
+
+    def init_page(
+        self, prov_org: str, gubun: str, svc_se: str, svc_id: str
+    ) -> aiohttp.ClientResponse:
+        return self._run(
+            self.client.init_page, prov_org, gubun, svc_se, svc_id
+        )
+
+    def fetch_land_using_info_table(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+        page_index: int,
+    ) -> NsdiLandUsingInfoResponse:
+        with self.metrics.timer("page_fetch"):
+            response = self._run(
+                self.client.fetch_land_using_info_html,
+                svc_se,
+                svc_id,
+                start_date,
+                end_date,
+                extrc_se_search,
+                prov_org,
+                page_index,
+            )
+
+        with self.metrics.timer("page_parse"):
+            return NsdiLandUsingInfoResponse.from_html(
+                response, self.client.parser, self.client.keep_raw_html
+            )
+
+    def download(
+        self,
+        table_data: NsdiLandUsingInfo.NsdiTableData,
+        prov_org: str,
+        file_path: str,
+    ) -> int:
+        return self._run(
+            self.client.download, table_data, prov_org, file_path
+        )
+
+    def fetch_region_list(
+        self, response: aiohttp.ClientResponse
+    ) -> typing.List[NsdiRegion]:
+        return self._run(self.client.fetch_region_list, response)
+
+    def fetch_region_detail_list(
+        self, adm_code: str
+    ) -> typing.List[NsdiRegion]:
+        return self._run(self.client.fetch_region_detail_list, adm_code)
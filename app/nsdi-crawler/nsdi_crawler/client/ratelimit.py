@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter(object):
+    """
+    한 호스트에 보내는 요청 수를 초당 rate 개로 제한합니다.
+    여러 스레드에서 같은 인스턴스를 공유할 수 있으며 rate 가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AsyncRateLimiter(object):
+    """
+    RateLimiter 의 asyncio 버전입니다. 같은 이벤트 루프 안에서만 공유해야 합니다.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_time = 0.0
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+
+        # 이벤트 루프는 단일 스레드이므로 await 전까지는 잠금 없이 갱신해도 안전합니다
+        now = time.monotonic()
+        wait = self._next_time - now
+        self._next_time = max(now, self._next_time) + self.interval
+
+        if wait > 0:
+            await asyncio.sleep(wait)
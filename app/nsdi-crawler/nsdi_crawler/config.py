@@ -20,6 +20,54 @@ SCHEMA = {
     "DATA_TYPE": fields.StringField(optional=True),
     #: Crawler Download Mode : ON은 실제 파일 저장 OFF는 리소스 파일
     "DOWNLOAD": fields.StringField(optional=True),
+    #: NSDI 주소 (기본 http://openapi.nsdi.go.kr, 벤치마크에서는 stub 서버 주소)
+    "NSDI_BASE_URL": fields.StringField(optional=True),
+    #: 목록 페이지를 동시에 가져올 워커 수 (1이면 순차 수집)
+    "PAGE_WORKERS": fields.StringField(optional=True),
+    #: NSDI 호스트에 보내는 초당 최대 요청 수 (0 또는 빈 값이면 제한 없음)
+    "RATE_LIMIT": fields.StringField(optional=True),
+    #: NIDO, SCOS 의 목록, 지역, 다운로드 요청을 aiohttp 이벤트 루프 하나에서 처리할지 여부 : ON, OFF
+    #: (ON 이면 STREAM_UPLOAD, RESUMABLE_DOWNLOAD 는 사용하지 않습니다)
+    "ASYNC_CLIENT": fields.StringField(optional=True),
+    #: 압축 파일을 디스크를 거치지 않고 S3 멀티파트 업로드로 올릴지 여부 : ON, OFF
+    "STREAM_UPLOAD": fields.StringField(optional=True),
+    #: 이 크기(MB) 이상이고 크기를 알 수 있는 파일만 스트리밍 업로드 (기본 100MB)
+    "STREAM_UPLOAD_THRESHOLD": fields.StringField(optional=True),
+    #: 멀티파트 업로드 파트 크기(MB, 최소 5MB, 기본 16MB)
+    "MULTIPART_PART_SIZE": fields.StringField(optional=True),
+    #: 연결이 끊긴 다운로드를 Range 요청으로 이어받을지 여부 : ON, OFF
+    "RESUMABLE_DOWNLOAD": fields.StringField(optional=True),
+    #: 이어받기용 파일과 저널을 보관할 경로 (없으면 실행마다 임시 디렉토리)
+    "DOWNLOAD_DIR": fields.StringField(optional=True),
+    #: 다운로드 워커 수 (0이면 목록을 읽으면서 바로 다운로드, 업로드)
+    "DOWNLOAD_WORKERS": fields.StringField(optional=True),
+    #: S3 업로드 워커 수 (기본 2)
+    "UPLOAD_WORKERS": fields.StringField(optional=True),
+    #: 다운로드, 업로드 단계별 대기 큐 크기 (기본 4)
+    "PIPELINE_QUEUE_SIZE": fields.StringField(optional=True),
+    #: 목록 페이지 파서 : bs4, lxml
+    "PARSER": fields.StringField(optional=True),
+    #: 파싱한 목록의 원본 HTML 보관 여부 : ON, OFF (기본 OFF)
+    "KEEP_RAW_HTML": fields.StringField(optional=True),
+    #: 크롤러 로그보다 오래된 페이지를 만나면 목록 조회를 멈출지 여부 : ON, OFF
+    "INCREMENTAL": fields.StringField(optional=True),
+    #: 조회 기간을 구간별로 나눠 동시에 조회할지 여부 : ON, OFF
+    "DATE_PARTITION": fields.StringField(optional=True),
+    #: 조회 구간 하나의 개월 수 (기본 1)
+    "DATE_PARTITION_MONTHS": fields.StringField(optional=True),
+    #: 조회 구간을 동시에 가져올 워커 수 (기본 4)
+    "DATE_PARTITION_WORKERS": fields.StringField(optional=True),
+    #: 지역 목록 캐시 파일을 저장할 경로 (없으면 로컬 캐시 사용 안함)
+    "REGION_CACHE_PATH": fields.StringField(optional=True),
+    #: 지역 목록 캐시를 S3에도 저장할지 여부 : ON, OFF
+    "REGION_CACHE_S3": fields.StringField(optional=True),
+    #: 지역 목록 캐시를 그대로 사용할 기간(일, 기본 7일)
+    #: 지나면 시/도 목록과 모든 시/군/구 목록을 다시 받습니다
+    "REGION_CACHE_TTL_DAYS": fields.StringField(optional=True),
+    #: 단계별 지표를 Prometheus textfile 형식으로 저장할 파일 경로 (*.prom, 없으면 저장 안함)
+    "METRICS_TEXTFILE": fields.StringField(optional=True),
+    #: 단계별 지표를 run_scheduler 에서 CloudWatch 로 보낼지 여부 : ON, OFF (기본 ON)
+    "CLOUDWATCH_METRICS": fields.StringField(optional=True),
     #: AWS sepecific access key id value
     "AWS_ACCESS_KEY_ID": fields.StringField(optional=True),
     #: AWS sepecific secret access key value
@@ -1,26 +1,54 @@
 import datetime
+import functools
+import hashlib
+import itertools
 import json
+import os
 import tempfile
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import attr
+import botocore.exceptions
 import pytz
+import requests
 import structlog
 from crawler import resource
 from crawler.aws_client import S3Client
 from crawler.utils.download import download_from_response
+from nsdi_metrics import UNIT_BYTES, MetricsRegistry
 from tanker.slack import SlackClient
 from tanker.utils.datetime import tznow, timestamp
 
-from nsdi_crawler.client import NsdiClient
-from nsdi_crawler.client.data import NsdiLandUsingInfo
+from nsdi_crawler.client import (
+    AsyncRateLimiter,
+    EventLoopThread,
+    NsdiClient,
+    NsdiLoopClient,
+    NsdiResumableDownloader,
+    RateLimiter,
+)
+from nsdi_crawler.client.download import file_sha256
+from nsdi_crawler.client.data import (
+    NsdiLandUsingInfo,
+    NsdiLandUsingInfoResponse,
+)
+from nsdi_crawler.client.exc import NsdiClientParseError
 from .data import (
+    CRAWLER_LOG_FORMAT_VERSION,
     CrawlerStatistics,
     CrawlerRegionDate,
+    CrawlerLogPointer,
     CrawlerLogResponse,
+    CrawlerManifestEntry,
     slack_failure_percentage_statistics,
 )
 from .exc import NsdiCrawlerNotFoundError
+from .pipeline import Pipeline, PipelineStage
+from .region import RegionCatalogue
+from .upload import S3MultipartUploader
+from .window import DateWindow, parse_date, split_date_windows
 
 logger = structlog.get_logger(__name__)
 
@@ -31,18 +59,78 @@ class NsdiCrawler(object):
     def __init__(
         self,
         config: typing.Dict[str, typing.Any],
+        refresh_regions: bool = False,
+        metrics: typing.Optional[MetricsRegistry] = None,
     ) -> None:
         super().__init__()
         self.config = config
+        #: 단계별 소요 시간, 처리량 (run_scheduler 가 CloudWatch 로 보냅니다)
+        self.metrics = metrics or MetricsRegistry()
         self.slack_client = SlackClient(
             config.get("SLACK_CHANNEL"), config.get("SLACK_API_TOKEN")
         )
-        self.nsdi_client = NsdiClient(config)
+        self.page_workers = int(config.get("PAGE_WORKERS") or 1)
+        rate = float(config.get("RATE_LIMIT") or 0)
+        self.rate_limiter = RateLimiter(rate)
+        self.event_loop: typing.Optional[EventLoopThread] = None
+        # 토지이용계획정보(NIDO)와 토지특성정보(SCOS)는 각자의 세션으로 동시에 수집합니다
+        self.nsdi_clients: typing.Dict[
+            str, typing.Union[NsdiClient, NsdiLoopClient]
+        ] = {}
+        if config.get("ASYNC_CLIENT") == "ON":
+            # 두 세션의 요청을 하나의 이벤트 루프에서 처리합니다
+            self.event_loop = EventLoopThread()
+            async_rate_limiter = AsyncRateLimiter(rate)
+            for prov_org in ("NIDO", "SCOS"):
+                self.nsdi_clients[prov_org] = NsdiLoopClient(
+                    config, self.event_loop, async_rate_limiter, self.metrics
+                )
+        else:
+            for prov_org in ("NIDO", "SCOS"):
+                self.nsdi_clients[prov_org] = NsdiClient(
+                    config, self.rate_limiter, self.metrics
+                )
         self.s3_client = S3Client(config)
+        # 이벤트 루프 클라이언트는 응답을 파일로만 받으므로 스트리밍 업로드를 사용하지 않습니다
+        self.stream_upload = (
+            config.get("STREAM_UPLOAD") == "ON" and self.event_loop is None
+        )
+        self.stream_upload_threshold = (
+            int(config.get("STREAM_UPLOAD_THRESHOLD") or 100) * 1024 * 1024
+        )
+        self.s3_uploader: typing.Optional[S3MultipartUploader] = None
+        if self.stream_upload:
+            self.s3_uploader = S3MultipartUploader(
+                config,
+                int(config.get("MULTIPART_PART_SIZE") or 16) * 1024 * 1024,
+            )
+        # 이어받기를 사용하면 스트리밍 업로드보다 우선합니다
+        self.resumable_download = (
+            config.get("RESUMABLE_DOWNLOAD") == "ON"
+            and self.event_loop is None
+        )
+        self.download_dir: typing.Optional[str] = (
+            config.get("DOWNLOAD_DIR") or None
+        )
+        self.download_workers = int(config.get("DOWNLOAD_WORKERS") or 0)
+        self.upload_workers = int(config.get("UPLOAD_WORKERS") or 2)
+        self.pipeline_queue_size = int(config.get("PIPELINE_QUEUE_SIZE") or 4)
+        self.incremental = config.get("INCREMENTAL") == "ON"
+        self.date_partition = config.get("DATE_PARTITION") == "ON"
+        self.date_partition_months = int(
+            config.get("DATE_PARTITION_MONTHS") or 1
+        )
+        self.date_partition_workers = int(
+            config.get("DATE_PARTITION_WORKERS") or 4
+        )
+        self.region_catalogue = RegionCatalogue(config)
+        self.refresh_regions = refresh_regions
         self.region_land_use_dict: typing.Dict[str, str] = dict()
         self.region_land_feature_dict: typing.Dict[str, str] = dict()
         self.total_statistics = CrawlerStatistics()
         self.failure_statistics = CrawlerStatistics()
+        self.statistics_lock = threading.Lock()
+        self.manifest_entries: typing.List[CrawlerManifestEntry] = []
         self.crawling_date: datetime.datetime = tznow(
             pytz.timezone("Asia/Seoul")
         )
@@ -66,11 +154,20 @@ class NsdiCrawler(object):
             f"({self.config['ENVIRONMENT']}, {run_by})"
         )
 
-        self.crawl(run_by)
+        try:
+            self.crawl(run_by)
+        except Exception:
+            self.slack_client.send_info_slack(
+                f"데이터 업데이트 실패\n"
+                f"TIME_STAMP: {self.crawling_start_time}\n\n"
+                f"statistics: {self.failure_percentage_statistics()}",
+            )
+            raise
+        finally:
+            self.close_nsdi_clients()
+            logger.info("Crawler metrics", **self.metrics.summary())
 
-        statistics = slack_failure_percentage_statistics(
-            self.total_statistics, self.failure_statistics
-        )
+        statistics = self.failure_percentage_statistics()
 
         if (
             self.total_statistics.land_use_zip_count == 0
@@ -88,7 +185,55 @@ class NsdiCrawler(object):
                 f"statistics: {statistics}",
             )
 
+    def close_nsdi_clients(self) -> None:
+        if self.event_loop is None:
+            return
+
+        for nsdi_client in self.nsdi_clients.values():
+            if isinstance(nsdi_client, NsdiLoopClient):
+                nsdi_client.close()
+        self.event_loop.stop()
+
+    def failure_percentage_statistics(self) -> typing.Dict[str, typing.Any]:
+        with self.statistics_lock:
+            return slack_failure_percentage_statistics(
+                self.total_statistics, self.failure_statistics
+            )
+
     def crawl(self, run_by: str) -> None:
+        """
+        토지이용계획정보와 토지특성정보는 통계 외에 공유하는 상태가 없으므로 동시에 수집합니다.
+        크롤러 로그는 두 수집이 모두 끝난 후에 작성됩니다.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            land_use_future = executor.submit(self.crawl_land_use_pipeline)
+            land_feature_future = executor.submit(
+                self.crawl_land_feature_pipeline
+            )
+            land_use_future.result()
+            land_feature_future.result()
+
+        if self.total_statistics.land_use_zip_count > 0:
+            self.update_crawler_log(run_by, "토지이용계획정보")
+
+        if self.total_statistics.land_feature_zip_count > 0:
+            self.update_crawler_log(run_by, "토지특성정보")
+
+        if (
+            self.total_statistics.land_use_zip_count == 0
+            and self.total_statistics.land_feature_zip_count != 0
+        ):
+            self.update_crawler_log(run_by, "토지이용계획정보없음")
+        if (
+            self.total_statistics.land_feature_zip_count == 0
+            and self.total_statistics.land_use_zip_count != 0
+        ):
+            self.update_crawler_log(run_by, "토지특성정보없음")
+
+        if self.manifest_entries:
+            self.upload_manifest()
+
+    def crawl_land_use_pipeline(self) -> None:
         land_use_log_none = self.fetch_region_crawler_log(
             prov_org="NIDO",
             gubun="F",
@@ -97,14 +242,6 @@ class NsdiCrawler(object):
             name_type="토지이용계획정보",
         )
 
-        land_feature_log_none = self.fetch_region_crawler_log(
-            prov_org="SCOS",
-            gubun="F",
-            svc_se="F",
-            svc_id="F024",
-            name_type="토지특성정보",
-        )
-
         try:
             self.crawl_land_use(
                 prov_org="NIDO",
@@ -115,6 +252,15 @@ class NsdiCrawler(object):
         except NsdiCrawlerNotFoundError:
             logger.info("해당하는 날짜의 데이터가 없습니다")
 
+    def crawl_land_feature_pipeline(self) -> None:
+        land_feature_log_none = self.fetch_region_crawler_log(
+            prov_org="SCOS",
+            gubun="F",
+            svc_se="F",
+            svc_id="F024",
+            name_type="토지특성정보",
+        )
+
         try:
             self.crawl_land_feature(
                 prov_org="SCOS",
@@ -125,23 +271,6 @@ class NsdiCrawler(object):
         except NsdiCrawlerNotFoundError:
             logger.info("해당하는 날짜의 데이터가 없습니다")
 
-        if self.total_statistics.land_use_zip_count > 0:
-            self.update_crawler_log(run_by, "토지이용계획정보")
-
-        if self.total_statistics.land_feature_zip_count > 0:
-            self.update_crawler_log(run_by, "토지특성정보")
-
-        if (
-            self.total_statistics.land_use_zip_count == 0
-            and self.total_statistics.land_feature_zip_count != 0
-        ):
-            self.update_crawler_log(run_by, "토지이용계획정보없음")
-        if (
-            self.total_statistics.land_feature_zip_count == 0
-            and self.total_statistics.land_use_zip_count != 0
-        ):
-            self.update_crawler_log(run_by, "토지특성정보없음")
-
     def crawl_land_use(
         self,
         *,
@@ -209,9 +338,42 @@ class NsdiCrawler(object):
         extrc_se_search: str,
         prov_org: str,
     ) -> None:
+        if self.date_partition:
+            page_list = self.fetch_partitioned_page_list(
+                svc_se, svc_id, start_date, end_date, extrc_se_search, prov_org
+            )
+        else:
+            page_list = self.fetch_page_list(
+                svc_se, svc_id, start_date, end_date, extrc_se_search, prov_org
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:  # 임시 디렉토리 설정
+            if self.download_workers > 0:
+                with self.create_download_pipeline(
+                    temp_dir, prov_org
+                ) as pipeline:
+                    self.apply_land_using_info_pages(
+                        page_list, temp_dir, prov_org, pipeline
+                    )
+            else:
+                self.apply_land_using_info_pages(page_list, temp_dir, prov_org)
 
+    def fetch_page_list(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+    ) -> typing.Iterator[typing.List[NsdiLandUsingInfo]]:
+        """
+        조회 기간의 페이지 목록을 오래된 순서(마지막 페이지부터)로 반환합니다.
+        1페이지는 전체 페이지 수를 알기 위해 먼저 가져오고 마지막에 다시 사용합니다.
+        INCREMENTAL 이 ON 이면 크롤러 로그 이후의 페이지만 가져옵니다.
+        """
         try:
-            page = self.nsdi_client.fetch_land_using_info_table(
+            page = self.nsdi_clients[prov_org].fetch_land_using_info_table(
                 svc_se,
                 svc_id,
                 start_date,
@@ -220,72 +382,329 @@ class NsdiCrawler(object):
                 prov_org,
                 1,
             )
-        except TypeError:
+        except (TypeError, NsdiClientParseError):
             raise NsdiCrawlerNotFoundError("해당하는 날짜의 데이터가 없습니다")
 
-        with tempfile.TemporaryDirectory() as temp_dir:  # 임시 디렉토리 설정
-            for i in range(page.total_page, 0, -1):
-                info_list = self.nsdi_client.fetch_land_using_info_table(
-                    svc_se,
-                    svc_id,
-                    start_date,
-                    end_date,
-                    extrc_se_search,
-                    prov_org,
-                    i,
-                ).land_using_info
-
-                for info in reversed(info_list):
-                    region_dict_date = info.base_date
-                    if info.city_type == "인천광역시 남구":
-                        if info.name_type == "토지이용계획정보":
-                            region_dict_date = self.region_land_use_dict[
-                                "인천광역시 미추홀구"
-                            ]
-                        elif info.name_type == "토지특성정보":
-                            region_dict_date = self.region_land_feature_dict[
-                                "인천광역시 미추홀구"
-                            ]
-                    else:
-                        if info.name_type == "토지이용계획정보":
-                            region_dict_date = self.region_land_use_dict[
-                                info.city_type
-                            ]
-                        elif info.name_type == "토지특성정보":
-                            region_dict_date = self.region_land_feature_dict[
-                                info.city_type
-                            ]
-                    log_datetime = datetime.datetime.strptime(
-                        region_dict_date, "%Y-%m-%d"
-                    )
-                    nsdi_datetime = datetime.datetime.strptime(
-                        info.base_date, "%Y-%m-%d"
+        min_date = self.min_region_date(prov_org)
+        if self.incremental and min_date is not None:
+            return self.fetch_incremental_page_list(
+                svc_se,
+                svc_id,
+                start_date,
+                end_date,
+                extrc_se_search,
+                prov_org,
+                page,
+                min_date,
+            )
+
+        return itertools.chain(
+            self.fetch_land_using_info_pages(
+                svc_se,
+                svc_id,
+                start_date,
+                end_date,
+                extrc_se_search,
+                prov_org,
+                range(page.total_page, 1, -1),
+            ),
+            [page.land_using_info],
+        )
+
+    def fetch_incremental_page_list(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+        first_page: NsdiLandUsingInfoResponse,
+        min_date: datetime.date,
+    ) -> typing.Iterator[typing.List[NsdiLandUsingInfo]]:
+        """
+        목록은 최신순이므로 1페이지부터 PAGE_WORKERS 개씩 가져오다가
+        페이지 전체가 min_date 이전인 페이지를 만나면 더 이상 가져오지 않습니다.
+        그 이후 페이지의 데이터는 모든 지역의 크롤러 로그 날짜보다 오래되어 반영되지 않습니다.
+        로그에 날짜가 없는 지역이 있으면 min_region_date 가 None 이므로 호출되지 않습니다.
+        """
+        page_list = [first_page.land_using_info]
+        page_index = 2
+
+        while page_index <= first_page.total_page and not self.is_old_page(
+            page_list[-1], min_date
+        ):
+            page_indexes = range(
+                page_index,
+                min(page_index + self.page_workers, first_page.total_page + 1),
+            )
+            for info_list in self.fetch_land_using_info_pages(
+                svc_se,
+                svc_id,
+                start_date,
+                end_date,
+                extrc_se_search,
+                prov_org,
+                page_indexes,
+            ):
+                page_list.append(info_list)
+                if self.is_old_page(info_list, min_date):
+                    break
+            page_index = page_indexes.stop
+
+        logger.info(
+            "Incremental listing",
+            prov_org=prov_org,
+            min_region_date=str(min_date),
+            fetched_page=len(page_list),
+            total_page=first_page.total_page,
+        )
+
+        return reversed(page_list)
+
+    @staticmethod
+    def is_old_page(
+        info_list: typing.List[NsdiLandUsingInfo], min_date: datetime.date
+    ) -> bool:
+        # 빈 페이지는 날짜를 알 수 없으므로 다음 페이지를 계속 가져옵니다
+        return bool(info_list) and all(
+            parse_date(x.base_date) <= min_date for x in info_list
+        )
+
+    def fetch_partitioned_page_list(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+    ) -> typing.Iterator[typing.List[NsdiLandUsingInfo]]:
+        """
+        조회 기간을 DATE_PARTITION_MONTHS 개월 단위 구간으로 나눠 구간별로 동시에 조회합니다.
+        크롤러 로그상 모든 지역의 날짜 이전에 끝나는 구간은 새 데이터가 없으므로 조회하지 않습니다.
+        반영 순서는 기존과 같도록 오래된 구간부터 구간 안에서도 오래된 페이지부터 반환합니다.
+        """
+        window_list = split_date_windows(
+            start_date, end_date, self.date_partition_months
+        )
+        min_date = self.min_region_date(prov_org)
+        if min_date is not None:
+            window_list = [x for x in window_list if x.end_date > min_date]
+
+        logger.info(
+            "Date windows",
+            prov_org=prov_org,
+            min_region_date=str(min_date),
+            window_count=len(window_list),
+        )
+
+        def fetch_window(
+            window: DateWindow,
+        ) -> typing.List[typing.List[NsdiLandUsingInfo]]:
+            try:
+                return list(
+                    self.fetch_page_list(
+                        svc_se,
+                        svc_id,
+                        window.start_date_str,
+                        window.end_date_str,
+                        extrc_se_search,
+                        prov_org,
                     )
+                )
+            except NsdiCrawlerNotFoundError:
+                return []
 
-                    if nsdi_datetime > log_datetime and (
-                        info.name_type == "토지이용계획정보"
-                        or info.name_type == "토지특성정보"
-                    ):  # 로그에 비해 최신이면 다운로드
-                        logger.info(
-                            "Crawling Data",
-                            data_type=info.data_type,
-                            city_type=info.city_type,
-                            name_type=info.name_type,
-                            base_date=info.base_date,
-                            file_size=info.file_size,
-                        )
-                        self.download_zip_data(info, temp_dir, prov_org)
-                        if info.name_type == "토지이용계획정보":
-                            self.region_land_use_dict[
-                                info.city_type
-                            ] = info.base_date
-                        elif info.name_type == "토지특성정보":
-                            self.region_land_feature_dict[
-                                info.city_type
-                            ] = info.base_date
-
-                    else:
-                        continue
+        with ThreadPoolExecutor(
+            max_workers=max(self.date_partition_workers, 1)
+        ) as executor:
+            window_page_list = list(executor.map(fetch_window, window_list))
+
+        if not any(window_page_list):
+            raise NsdiCrawlerNotFoundError("해당하는 날짜의 데이터가 없습니다")
+
+        return self.unique_page_list(
+            itertools.chain.from_iterable(window_page_list)
+        )
+
+    def unique_page_list(
+        self, page_list: typing.Iterable[typing.List[NsdiLandUsingInfo]]
+    ) -> typing.Iterator[typing.List[NsdiLandUsingInfo]]:
+        """
+        이웃한 조회 구간은 경계 날짜를 공유하므로 두 구간에서 조회된 파일은 한 번만 반환합니다.
+        """
+        seen: typing.Set[NsdiLandUsingInfo.NsdiTableData] = set()
+        for info_list in page_list:
+            yield [x for x in info_list if x.table_data not in seen]
+            seen.update(x.table_data for x in info_list)
+
+    def min_region_date(self, prov_org: str) -> typing.Optional[datetime.date]:
+        """
+        크롤러 로그에 기록된 지역별 날짜 중 가장 오래된 날짜를 반환합니다.
+        로그에 날짜가 없는 지역("0001-01-01")이 하나라도 있으면 그 지역의 모든 데이터를
+        받아야 하므로 None 을 반환합니다. (조회 구간, 페이지를 건너뛰지 않습니다)
+        """
+        if prov_org == "NIDO":
+            region_dict = self.region_land_use_dict
+        else:
+            region_dict = self.region_land_feature_dict
+
+        date_list = list(region_dict.values())
+        if not date_list or "0001-01-01" in date_list:
+            return None
+
+        return parse_date(min(date_list))
+
+    def apply_land_using_info_pages(
+        self,
+        page_list: typing.Iterable[typing.List[NsdiLandUsingInfo]],
+        temp_dir: str,
+        prov_org: str,
+        pipeline: typing.Optional[Pipeline] = None,
+    ) -> None:
+        for info_list in page_list:
+            for info in reversed(info_list):
+                self.apply_land_using_info(info, temp_dir, prov_org, pipeline)
+
+    def create_download_pipeline(
+        self, temp_dir: str, prov_org: str
+    ) -> Pipeline:
+        """
+        목록에서 찾은 파일을 다운로드 워커가 받고 업로드 워커가 S3에 올리도록 연결합니다.
+        """
+
+        def download(
+            info: NsdiLandUsingInfo,
+        ) -> typing.Tuple[
+            typing.Tuple[NsdiLandUsingInfo, typing.Optional[str]], int
+        ]:
+            try:
+                path = self.download_zip_file(info, temp_dir, prov_org)
+            except Exception:
+                self.count_failure_zip_data(info)
+                raise
+            size = os.path.getsize(path) if path else 0
+            return (info, path), size
+
+        def upload(
+            item: typing.Tuple[NsdiLandUsingInfo, typing.Optional[str]],
+        ) -> typing.Tuple[None, int]:
+            info, path = item
+            size = 0
+            if path:
+                size = os.path.getsize(path)
+                try:
+                    self.upload_zip_data(info, path)
+                except Exception:
+                    self.count_failure_zip_data(info)
+                    raise
+                self.remove_zip_file(path)
+            self.count_zip_data(info)
+            return None, size
+
+        return Pipeline(
+            prov_org,
+            [
+                PipelineStage(
+                    "download",
+                    download,
+                    self.download_workers,
+                    self.pipeline_queue_size,
+                ),
+                PipelineStage(
+                    "upload",
+                    upload,
+                    self.upload_workers,
+                    self.pipeline_queue_size,
+                ),
+            ],
+        )
+
+    def fetch_land_using_info_pages(
+        self,
+        svc_se: str,
+        svc_id: str,
+        start_date: str,
+        end_date: str,
+        extrc_se_search: str,
+        prov_org: str,
+        page_indexes: typing.Iterable[int],
+    ) -> typing.Iterator[typing.List[NsdiLandUsingInfo]]:
+        """
+        page_indexes 순서대로 페이지의 토지정보 목록을 반환합니다.
+        PAGE_WORKERS 가 1보다 크면 페이지를 병렬로 가져오지만 반환 순서는 그대로 유지됩니다.
+        """
+        fetch_page = functools.partial(
+            self.nsdi_clients[prov_org].fetch_land_using_info_table,
+            svc_se,
+            svc_id,
+            start_date,
+            end_date,
+            extrc_se_search,
+            prov_org,
+        )
+
+        if self.page_workers <= 1:
+            for page_index in page_indexes:
+                yield fetch_page(page_index).land_using_info
+            return
+
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            for page in executor.map(fetch_page, page_indexes):
+                yield page.land_using_info
+
+    def apply_land_using_info(
+        self,
+        info: NsdiLandUsingInfo,
+        temp_dir: str,
+        prov_org: str,
+        pipeline: typing.Optional[Pipeline] = None,
+    ) -> None:
+        """
+        크롤러 로그의 지역별 날짜보다 최신인 데이터만 다운로드하고 날짜를 갱신합니다.
+        pipeline 이 있으면 다운로드와 업로드는 파이프라인 워커에게 넘깁니다.
+        """
+        region_dict_date = info.base_date
+        if info.city_type == "인천광역시 남구":
+            if info.name_type == "토지이용계획정보":
+                region_dict_date = self.region_land_use_dict[
+                    "인천광역시 미추홀구"
+                ]
+            elif info.name_type == "토지특성정보":
+                region_dict_date = self.region_land_feature_dict[
+                    "인천광역시 미추홀구"
+                ]
+        else:
+            if info.name_type == "토지이용계획정보":
+                region_dict_date = self.region_land_use_dict[info.city_type]
+            elif info.name_type == "토지특성정보":
+                region_dict_date = self.region_land_feature_dict[
+                    info.city_type
+                ]
+        log_datetime = datetime.datetime.strptime(region_dict_date, "%Y-%m-%d")
+        nsdi_datetime = datetime.datetime.strptime(info.base_date, "%Y-%m-%d")
+
+        if nsdi_datetime > log_datetime and (
+            info.name_type == "토지이용계획정보"
+            or info.name_type == "토지특성정보"
+        ):  # 로그에 비해 최신이면 다운로드
+            logger.info(
+                "Crawling Data",
+                data_type=info.data_type,
+                city_type=info.city_type,
+                name_type=info.name_type,
+                base_date=info.base_date,
+                file_size=info.file_size,
+            )
+            if pipeline is not None:
+                pipeline.put(info)
+            else:
+                self.download_zip_data(info, temp_dir, prov_org)
+            if info.name_type == "토지이용계획정보":
+                self.region_land_use_dict[info.city_type] = info.base_date
+            elif info.name_type == "토지특성정보":
+                self.region_land_feature_dict[info.city_type] = info.base_date
 
     def download_zip_data(
         self,
@@ -293,31 +712,141 @@ class NsdiCrawler(object):
         temp_dir: str,
         prov_org: str,
     ) -> None:
+        try:
+            path = self.download_zip_file(
+                nsdi_land_using_info, temp_dir, prov_org
+            )
+            if path:
+                self.upload_zip_data(nsdi_land_using_info, path)
+        except Exception:
+            self.count_failure_zip_data(nsdi_land_using_info)
+            raise
+        if path:
+            self.remove_zip_file(path)
+
+        self.count_zip_data(nsdi_land_using_info)
+
+    def download_zip_file(
+        self,
+        nsdi_land_using_info: NsdiLandUsingInfo,
+        temp_dir: str,
+        prov_org: str,
+    ) -> typing.Optional[str]:
+        """
+        업로드할 압축 파일 경로를 반환합니다.
+        S3로 바로 스트리밍 업로드한 경우에는 None 을 반환합니다.
+        """
         table_data = nsdi_land_using_info.table_data
-        temp_path = str(temp_dir) + "\\"
+        temp_path = os.path.join(self.download_dir or str(temp_dir), "")
         file_name = table_data.file_nm_dialog
 
-        if self.config["DOWNLOAD"] == "ON":
-            # 압축 파일 다운로드
-            response = self.nsdi_client.fetch_download_response(
+        if self.config["DOWNLOAD"] != "ON":
+            return resource.get_resource("/csv/nsdi_csv.zip")
+
+        nsdi_client = self.nsdi_clients[prov_org]
+        if isinstance(nsdi_client, NsdiLoopClient):
+            os.makedirs(temp_path, exist_ok=True)
+            with self.metrics.timer("zip_download"):
+                nsdi_client.download(
+                    table_data, prov_org, temp_path + file_name
+                )
+            self.count_download_bytes(temp_path + file_name)
+            return temp_path + file_name
+
+        if self.resumable_download:
+            os.makedirs(temp_path, exist_ok=True)
+            downloader = NsdiResumableDownloader(nsdi_client)
+            with self.metrics.timer("zip_download"):
+                downloader.download(
+                    table_data, prov_org, temp_path + file_name
+                )
+            self.count_download_bytes(temp_path + file_name)
+            return temp_path + file_name
+
+        # 압축 파일 다운로드
+        # 스트리밍 업로드는 본문을 받으면서 올리므로 본문을 받는 시간은 s3_upload 에 기록됩니다
+        with self.metrics.timer("zip_download"):
+            response = nsdi_client.fetch_download_response(
                 table_data, prov_org
             )
-            download_from_response(temp_path, file_name, response)
-            path = temp_path + file_name
-        else:
-            path = resource.get_resource("/csv/nsdi_csv.zip")
+            stream = self.should_stream_upload(response)
+            if not stream:
+                download_from_response(temp_path, file_name, response)
+        if stream:
+            self.stream_zip_data(nsdi_land_using_info, response)
+            return None
+
+        self.count_download_bytes(temp_path + file_name)
+        return temp_path + file_name
+
+    def count_download_bytes(self, path: str) -> None:
+        self.metrics.increment(
+            "download_bytes", os.path.getsize(path), UNIT_BYTES
+        )
+
+    def remove_zip_file(self, path: str) -> None:
+        """
+        업로드가 끝난 압축 파일과 이어받기 저널을 지웁니다.
+        """
+        if self.config["DOWNLOAD"] != "ON":
+            return
+
+        journal_path = NsdiResumableDownloader.journal_path(path)
+        for file_path in (path, journal_path):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def count_zip_data(self, nsdi_land_using_info: NsdiLandUsingInfo) -> None:
+        with self.statistics_lock:
+            if nsdi_land_using_info.name_type == "토지이용계획정보":
+                self.total_statistics.land_use_zip_count += 1
+            elif nsdi_land_using_info.name_type == "토지특성정보":
+                self.total_statistics.land_feature_zip_count += 1
+
+    def count_failure_zip_data(
+        self, nsdi_land_using_info: NsdiLandUsingInfo
+    ) -> None:
+        """
+        다운로드, 업로드에 실패한 파일 수를 기록합니다. 실패한 파일은 크롤러 로그에 반영되지 않습니다.
+        """
+        with self.statistics_lock:
+            if nsdi_land_using_info.name_type == "토지이용계획정보":
+                self.failure_statistics.land_use_zip_count += 1
+            elif nsdi_land_using_info.name_type == "토지특성정보":
+                self.failure_statistics.land_feature_zip_count += 1
+        self.metrics.increment("zip_failure")
+
+    def should_stream_upload(self, response: requests.Response) -> bool:
+        """
+        크기를 알 수 없거나 작은 파일은 기존처럼 임시 파일을 거쳐 업로드합니다.
+        """
+        if not self.stream_upload:
+            return False
 
-        self.upload_zip_data(nsdi_land_using_info, path)
+        try:
+            content_length = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return False
 
-        if nsdi_land_using_info.name_type == "토지이용계획정보":
-            self.total_statistics.land_use_zip_count += 1
-        elif nsdi_land_using_info.name_type == "토지특성정보":
-            self.total_statistics.land_feature_zip_count += 1
+        return content_length >= self.stream_upload_threshold
 
-    def upload_zip_data(
-        self, nsdi_land_using_info: NsdiLandUsingInfo, temp_path: str
-    ) -> None:
+    def run_folder_name(self) -> str:
+        return (
+            f"{self.config['ENVIRONMENT']}/"
+            f"{self.crawling_date.year}/"
+            f"{self.crawling_date.month:02}/"
+            f"{self.crawling_date.day:02}/"
+            f"{str(self.crawling_start_time)}"
+        )
 
+    @staticmethod
+    def split_city_type(
+        nsdi_land_using_info: NsdiLandUsingInfo,
+    ) -> typing.Tuple[str, str]:
+        """
+        (시,도 폴더 이름, 시,군,구 폴더 이름) 을 반환합니다.
+        기존 S3 폴더와 같도록 시,군,구 폴더 이름은 앞의 공백을 그대로 둡니다.
+        """
         if len(nsdi_land_using_info.city_type.split()) > 1:  # 시,군,구 데이터일때
             region_split = nsdi_land_using_info.city_type.split()
             sido_name = region_split[0]
@@ -326,12 +855,15 @@ class NsdiCrawler(object):
             sido_name = nsdi_land_using_info.city_type
             gugun_name = "ALL"
 
-        folder_name = (
-            f"{self.config['ENVIRONMENT']}/"
-            f"{self.crawling_date.year}/"
-            f"{self.crawling_date.month:02}/"
-            f"{self.crawling_date.day:02}/"
-            f"{str(self.crawling_start_time)}/"
+        return sido_name, gugun_name
+
+    def zip_data_folder_name(
+        self, nsdi_land_using_info: NsdiLandUsingInfo
+    ) -> str:
+        sido_name, gugun_name = self.split_city_type(nsdi_land_using_info)
+
+        return (
+            f"{self.run_folder_name()}/"
             f"{nsdi_land_using_info.name_type}/"
             f"data/"
             f"{nsdi_land_using_info.data_type}/"
@@ -339,13 +871,113 @@ class NsdiCrawler(object):
             f"{gugun_name}/"
             f"base_date_{nsdi_land_using_info.base_date}"
         )
+
+    def upload_zip_data(
+        self, nsdi_land_using_info: NsdiLandUsingInfo, temp_path: str
+    ) -> None:
+        folder_name = self.zip_data_folder_name(nsdi_land_using_info)
+        file_name = nsdi_land_using_info.table_data.file_nm_dialog
+
+        with self.metrics.timer("s3_upload"):
+            self.s3_client.upload_s3_zip(
+                folder_name=folder_name,
+                file_name=file_name,
+                temp_path=temp_path,
+                mime_type="application/zip",
+            )
+        self.metrics.increment(
+            "s3_upload_bytes", os.path.getsize(temp_path), UNIT_BYTES
+        )
+
+        self.add_manifest_entry(
+            nsdi_land_using_info,
+            f"{folder_name}/{file_name}",
+            os.path.getsize(temp_path),
+            file_sha256(temp_path),
+        )
+
+    def stream_zip_data(
+        self,
+        nsdi_land_using_info: NsdiLandUsingInfo,
+        response: requests.Response,
+    ) -> None:
+        """
+        다운로드 응답을 임시 파일 없이 그대로 S3 멀티파트 업로드로 올립니다.
+        """
+        assert self.s3_uploader is not None
+        folder_name = self.zip_data_folder_name(nsdi_land_using_info)
         file_name = nsdi_land_using_info.table_data.file_nm_dialog
 
-        self.s3_client.upload_s3_zip(
-            folder_name=folder_name,
-            file_name=file_name,
-            temp_path=temp_path,
-            mime_type="application/zip",
+        sha256 = hashlib.sha256()
+
+        def iter_chunks() -> typing.Iterator[bytes]:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                sha256.update(chunk)
+                yield chunk
+
+        try:
+            with self.metrics.timer("s3_upload"):
+                size = self.s3_uploader.upload_chunks(
+                    f"{folder_name}/{file_name}",
+                    iter_chunks(),
+                    "application/zip",
+                )
+        finally:
+            response.close()
+        self.metrics.increment("download_bytes", size, UNIT_BYTES)
+        self.metrics.increment("s3_upload_bytes", size, UNIT_BYTES)
+
+        logger.info("Stream upload finish", file_name=file_name, size=size)
+
+        self.add_manifest_entry(
+            nsdi_land_using_info,
+            f"{folder_name}/{file_name}",
+            size,
+            sha256.hexdigest(),
+        )
+
+    def add_manifest_entry(
+        self,
+        nsdi_land_using_info: NsdiLandUsingInfo,
+        key: str,
+        size: int,
+        sha256: str,
+    ) -> None:
+        sido_name, gugun_name = self.split_city_type(nsdi_land_using_info)
+        entry = CrawlerManifestEntry(
+            key=key,
+            name_type=nsdi_land_using_info.name_type,
+            data_type=nsdi_land_using_info.data_type,
+            sido=sido_name,
+            gugun=gugun_name.strip(),
+            base_date=nsdi_land_using_info.base_date,
+            file_name=nsdi_land_using_info.table_data.file_nm_dialog,
+            size=size,
+            sha256=sha256,
+        )
+        with self.statistics_lock:
+            self.manifest_entries.append(entry)
+
+    def upload_manifest(self) -> None:
+        """
+        이번 실행에서 업로드한 압축 파일 목록을 실행 폴더의 manifest.json 으로 저장합니다.
+        """
+        entry_list = sorted(
+            self.manifest_entries,
+            key=lambda x: (x.name_type, x.sido, x.gugun, x.base_date, x.key),
+        )
+        data = {
+            "version": CRAWLER_LOG_FORMAT_VERSION,
+            "time_stamp": self.crawling_start_time,
+            "entries": [attr.asdict(x) for x in entry_list],
+        }
+
+        self.s3_client.upload_s3(
+            self.run_folder_name(),
+            "manifest.json",
+            data,
+            "application/json",
+            encoding="utf-8",
         )
 
     def update_crawler_log(self, run_by: str, name_type: str) -> None:
@@ -388,15 +1020,7 @@ class NsdiCrawler(object):
             "region_date": [vars(x) for x in region_date_list],
         }
 
-        folder_name = (
-            f"{self.config['ENVIRONMENT']}/"
-            f"{self.crawling_date.year}/"
-            f"{self.crawling_date.month:02}/"
-            f"{self.crawling_date.day:02}/"
-            f"{str(self.crawling_start_time)}/"
-            f"{name_type}/"
-            f"crawler-log"
-        )
+        folder_name = f"{self.run_folder_name()}/{name_type}/crawler-log"
 
         file_name = f"{self.crawling_start_time}.json"
 
@@ -404,6 +1028,94 @@ class NsdiCrawler(object):
             folder_name, file_name, data, "application/json", encoding="utf-8"
         )
 
+        self.update_crawler_log_pointer(
+            CrawlerLogPointer.from_log_key(f"{folder_name}/{file_name}")
+        )
+
+    def crawler_log_pointer_folder(self) -> str:
+        # 환경 폴더 안에 두면 년도 폴더 목록에 섞이므로 밖에 저장합니다
+        return f"latest/{self.config['ENVIRONMENT']}"
+
+    def update_crawler_log_pointer(self, pointer: CrawlerLogPointer) -> None:
+        """
+        이미 더 최신 로그를 가리키고 있으면 갱신하지 않습니다.
+        """
+        current_pointer = self.fetch_crawler_log_pointer(pointer.name_type)
+        if current_pointer and current_pointer.sort_key > pointer.sort_key:
+            logger.warning(
+                "Skip crawler log pointer update",
+                name_type=pointer.name_type,
+                current_log_key=current_pointer.log_key,
+                log_key=pointer.log_key,
+            )
+            return
+
+        self.s3_client.upload_s3(
+            self.crawler_log_pointer_folder(),
+            f"{pointer.name_type}.json",
+            pointer.to_json(),
+            "application/json",
+            encoding="utf-8",
+        )
+
+    def list_s3_objects(
+        self, prefix: str, **kwargs: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        """
+        S3 목록 페이지를 반환하며 페이지마다 걸린 시간을 s3_list 로 기록합니다.
+        """
+        return self.metrics.timed_iter(
+            "s3_list", self.s3_client.get_objects(prefix, **kwargs)
+        )
+
+    def fetch_crawler_log_pointer(
+        self, name_type: str
+    ) -> typing.Optional[CrawlerLogPointer]:
+        key = f"{self.crawler_log_pointer_folder()}/{name_type}.json"
+        try:
+            response = self.s3_client.get_object(key)
+            data = json.loads(response.body.read())
+            if data.get("version") != CRAWLER_LOG_FORMAT_VERSION:
+                # 다른 형식의 포인터는 읽지 않고 새로 작성합니다
+                return None
+            return CrawlerLogPointer.from_json(data)
+        except (
+            botocore.exceptions.ClientError,
+            AttributeError,
+            KeyError,
+            ValueError,
+        ):
+            return None
+
+    def repair_crawler_log_pointer(
+        self, name_type: str
+    ) -> typing.Optional[CrawlerLogPointer]:
+        """
+        환경 폴더 전체 목록에서 가장 최신 크롤러 로그를 찾아 포인터를 다시 작성합니다.
+        """
+        env_prefix = f"{self.config['ENVIRONMENT']}/"
+        log_suffix = f"/{name_type}/crawler-log/"
+        pointer_list: typing.List[CrawlerLogPointer] = []
+
+        for response in self.list_s3_objects(env_prefix):
+            for content in response.contents or []:
+                key = content["Key"]
+                if log_suffix in key and key.endswith(".json"):
+                    pointer_list.append(CrawlerLogPointer.from_log_key(key))
+
+        if not pointer_list:
+            return None
+
+        pointer = max(pointer_list, key=lambda x: (x.sort_key, x.log_key))
+        self.s3_client.upload_s3(
+            self.crawler_log_pointer_folder(),
+            f"{pointer.name_type}.json",
+            pointer.to_json(),
+            "application/json",
+            encoding="utf-8",
+        )
+        return pointer
+
     def fetch_region_crawler_log(
         self,
         *,
@@ -416,18 +1128,23 @@ class NsdiCrawler(object):
         """
         지역별 날짜를 딕셔너리에 저장하고 크롤러 로그의 유무를 반환합니다.
         토지특성정보 데이터의 경우에는 시,군,구에 대한 최신 데이터 날짜도 가져옵니다.
+        지역 목록은 REGION_CACHE_PATH, REGION_CACHE_S3 가 설정되어 있으면 캐시를 사용합니다.
         """
-        response = self.nsdi_client.init_page(prov_org, gubun, svc_se, svc_id)
-        region_list = self.nsdi_client.fetch_region_list(response)
+        nsdi_client = self.nsdi_clients[prov_org]
+        response = nsdi_client.init_page(prov_org, gubun, svc_se, svc_id)
+        region_tree = self.region_catalogue.fetch_region_tree(
+            nsdi_client,
+            response,
+            svc_id,
+            with_detail=name_type == "토지특성정보",
+            refresh=self.refresh_regions,
+        )
 
-        for region in region_list:
+        for region, region_detail_list in region_tree:
             if name_type == "토지특성정보":
                 self.region_land_feature_dict.update(
                     {region.adm_code_nm: "0001-01-01"}
                 )
-                region_detail_list = self.nsdi_client.fetch_region_detail_list(
-                    region.adm_code
-                )
                 for region_detail in region_detail_list:
                     self.region_land_feature_dict.update(
                         {region_detail.adm_code_nm: "0001-01-01"}
@@ -457,6 +1174,11 @@ class NsdiCrawler(object):
         return CrawlerLogResponse.from_json(json_log)
 
     def fetch_crawler_log_path(self, name_type: str) -> str:  # 최신 로그 폴더 경로
+        pointer = self.fetch_crawler_log_pointer(name_type)
+        if pointer is not None:
+            return pointer.log_key
+
+        # 포인터가 없던 이전 로그는 폴더를 차례로 탐색합니다
         env_prefix = f"{self.config['ENVIRONMENT']}/"
         year_list: typing.List[str] = []
         month_list: typing.List[str] = []
@@ -464,7 +1186,7 @@ class NsdiCrawler(object):
         time_stamp_list: typing.List[str] = []
         log_id_list: typing.List[str] = []
 
-        for response in self.s3_client.get_objects(env_prefix, Delimiter="/"):
+        for response in self.list_s3_objects(env_prefix, Delimiter="/"):
             prefixes = response.common_prefixes
             for year_prefix in prefixes:
                 year = (
@@ -477,7 +1199,7 @@ class NsdiCrawler(object):
             year_list.sort()
         year_prefix = env_prefix + year_list[-1] + "/"
 
-        for response in self.s3_client.get_objects(year_prefix, Delimiter="/"):
+        for response in self.list_s3_objects(year_prefix, Delimiter="/"):
             prefixes = response.common_prefixes
             for month_prefix in prefixes:
                 month = (
@@ -490,7 +1212,7 @@ class NsdiCrawler(object):
             month_list.sort()
         month_prefix = year_prefix + month_list[-1] + "/"
 
-        for response in self.s3_client.get_objects(
+        for response in self.list_s3_objects(
             month_prefix, Delimiter="/"
         ):
             prefixes = response.common_prefixes
@@ -506,7 +1228,7 @@ class NsdiCrawler(object):
             day_list.sort()
         day_prefix = month_prefix + day_list[-1] + "/"
 
-        for response in self.s3_client.get_objects(day_prefix, Delimiter="/"):
+        for response in self.list_s3_objects(day_prefix, Delimiter="/"):
             prefixes = response.common_prefixes
             for time_stamp_prefix in prefixes:
                 time_stamp = (
@@ -522,7 +1244,7 @@ class NsdiCrawler(object):
 
         log_id_prefix = f"{time_stamp_prefix}" f"{name_type}/" f"crawler-log/"
 
-        for response in self.s3_client.get_objects(log_id_prefix):
+        for response in self.list_s3_objects(log_id_prefix):
             for content in response.contents:
                 log_id = content["Key"].split("/")[-1].replace(".json", "")
                 log_id_list.append(log_id)
@@ -2,6 +2,9 @@ import typing
 
 import attr
 
+#: latest 포인터, manifest.json 형식 버전 (nsdi-store 가 읽을 때 확인하므로 형식을 바꾸면 올려주세요)
+CRAWLER_LOG_FORMAT_VERSION = 1
+
 
 @attr.s
 class CrawlerRegionDate(object):
@@ -69,6 +72,106 @@ class CrawlerLogResponse(object):
         )
 
 
+@attr.s(frozen=True)
+class CrawlerLogPointer(object):
+    """
+    name_type 별 최신 크롤러 로그 위치입니다.
+    latest/{ENVIRONMENT}/{name_type}.json 에 저장되며 한 번의 GET 으로 최신 로그를 찾습니다.
+    """
+
+    name_type: str = attr.ib()
+    #: 크롤러 로그 S3 키
+    log_key: str = attr.ib()
+    #: 크롤러 로그를 작성한 실행의 폴더 ({ENVIRONMENT}/{년}/{월}/{일}/{time_stamp}/)
+    run_prefix: str = attr.ib()
+    time_stamp: str = attr.ib()
+
+    class CrawlerLogPointerData(typing.Dict):
+        name_type: str
+        log_key: str
+        run_prefix: str
+        time_stamp: str
+
+    @classmethod
+    def from_json(cls, data: CrawlerLogPointerData) -> "CrawlerLogPointer":
+        return cls(
+            name_type=data["name_type"],
+            log_key=data["log_key"],
+            run_prefix=data["run_prefix"],
+            time_stamp=data["time_stamp"],
+        )
+
+    @classmethod
+    def from_log_key(cls, log_key: str) -> "CrawlerLogPointer":
+        """
+        {ENVIRONMENT}/{년}/{월}/{일}/{time_stamp}/{name_type}/crawler-log/{id}.json
+        """
+        split_key = log_key.split("/")
+        return cls(
+            name_type=split_key[5],
+            log_key=log_key,
+            run_prefix="/".join(split_key[:5]) + "/",
+            time_stamp=split_key[4],
+        )
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {"version": CRAWLER_LOG_FORMAT_VERSION, **attr.asdict(self)}
+
+    @property
+    def sort_key(self) -> typing.Tuple[float, ...]:
+        # 문자열 정렬은 자릿수가 다른 월, 일, time_stamp 에서 순서가 틀리므로 숫자로 비교합니다
+        split_prefix = self.run_prefix.strip("/").split("/")[1:]
+        return tuple(float(x) for x in split_prefix)
+
+
+@attr.s(frozen=True)
+class CrawlerManifestEntry(object):
+    """
+    한 번의 실행에서 업로드한 압축 파일 정보입니다.
+    실행 폴더의 manifest.json 에 모아서 저장하며 store 는 폴더를 탐색하지 않고 이 목록을 사용합니다.
+    """
+
+    #: 압축 파일 S3 키
+    key: str = attr.ib()
+    name_type: str = attr.ib()
+    data_type: str = attr.ib()
+    #: 시,도 (예: 서울특별시)
+    sido: str = attr.ib()
+    #: 시,군,구 (시,도 데이터는 ALL)
+    gugun: str = attr.ib()
+    base_date: str = attr.ib()
+    file_name: str = attr.ib()
+    size: int = attr.ib()
+    sha256: str = attr.ib()
+
+    class CrawlerManifestEntryData(typing.Dict):
+        key: str
+        name_type: str
+        data_type: str
+        sido: str
+        gugun: str
+        base_date: str
+        file_name: str
+        size: int
+        sha256: str
+
+    @classmethod
+    def from_json(
+        cls, data: CrawlerManifestEntryData
+    ) -> "CrawlerManifestEntry":
+        return cls(
+            key=data["key"],
+            name_type=data["name_type"],
+            data_type=data["data_type"],
+            sido=data["sido"],
+            gugun=data["gugun"],
+            base_date=data["base_date"],
+            file_name=data["file_name"],
+            size=data["size"],
+            sha256=data["sha256"],
+        )
+
+
 def slack_failure_percentage_statistics(
     total_statistics: CrawlerStatistics, failure_statistics: CrawlerStatistics,
 ) -> typing.Dict[str, typing.Any]:
@@ -0,0 +1,175 @@
+import queue
+import threading
+import time
+import types
+import typing
+
+import attr
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+#: 핸들러는 다음 단계로 넘길 값과 처리한 바이트 수를 반환합니다
+StageHandler = typing.Callable[[typing.Any], typing.Tuple[typing.Any, int]]
+
+_STOP = object()
+
+
+@attr.s
+class StageMetrics(object):
+    name: str = attr.ib()
+    #: 처리한 작업 수
+    item_count: int = attr.ib(default=0)
+    #: 처리한 바이트 수
+    byte_count: int = attr.ib(default=0)
+    #: 워커들이 작업을 처리하는데 사용한 시간의 합
+    busy_seconds: float = attr.ib(default=0.0)
+    failure_count: int = attr.ib(default=0)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, repr=False)
+
+    def add(self, byte_count: int, seconds: float) -> None:
+        with self._lock:
+            self.item_count += 1
+            self.byte_count += byte_count
+            self.busy_seconds += seconds
+
+    def add_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+
+    def to_log(self, elapsed: float) -> typing.Dict[str, typing.Any]:
+        elapsed = max(elapsed, 1e-9)
+        return {
+            "stage": self.name,
+            "items": self.item_count,
+            "failures": self.failure_count,
+            "megabytes": round(self.byte_count / 1024 / 1024, 2),
+            "busy_seconds": round(self.busy_seconds, 2),
+            "items_per_sec": round(self.item_count / elapsed, 2),
+            "mb_per_sec": round(self.byte_count / 1024 / 1024 / elapsed, 2),
+        }
+
+
+class PipelineStage(object):
+    """
+    크기가 제한된 큐와 워커 스레드로 구성된 한 단계입니다.
+    큐가 가득 차면 앞 단계가 대기하므로 단계 사이에 쌓이는 작업 수가 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        workers: int,
+        queue_size: int,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.handler = handler
+        self.workers = max(workers, 1)
+        self.queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self.metrics = StageMetrics(name)
+        self.downstream: typing.Optional["PipelineStage"] = None
+        self.pipeline: typing.Optional["Pipeline"] = None
+        self._threads: typing.List[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"{self.name}-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item: typing.Any) -> None:
+        self.queue.put(item)
+
+    def close(self) -> None:
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        assert self.pipeline is not None
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            # 다른 단계에서 실패했다면 남은 작업은 처리하지 않고 비워줍니다
+            if self.pipeline.error is not None:
+                continue
+
+            start = time.monotonic()
+            try:
+                result, byte_count = self.handler(item)
+            except Exception as e:
+                self.metrics.add_failure()
+                self.pipeline.fail(e)
+                continue
+            self.metrics.add(byte_count, time.monotonic() - start)
+
+            if self.downstream is not None:
+                self.downstream.put(result)
+
+
+class Pipeline(object):
+    """
+    목록 수집(생산자) -> 다운로드 -> 업로드 처럼 단계별 워커 풀을 연결합니다.
+    with 블록이 정상 종료되면 모든 작업이 끝날 때까지 기다리고 첫번째 오류를 다시 발생시킵니다.
+    """
+
+    def __init__(self, name: str, stages: typing.List[PipelineStage]) -> None:
+        super().__init__()
+        self.name = name
+        self.stages = stages
+        self.source_metrics = StageMetrics("listing")
+        self.error: typing.Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+        self._start_time = 0.0
+
+        for stage, downstream in zip(stages, stages[1:]):
+            stage.downstream = downstream
+        for stage in stages:
+            stage.pipeline = self
+
+    def __enter__(self) -> "Pipeline":
+        self._start_time = time.monotonic()
+        for stage in self.stages:
+            stage.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        if exc is not None:
+            self.fail(exc)
+        self.close()
+
+    def fail(self, error: BaseException) -> None:
+        with self._error_lock:
+            if self.error is None:
+                self.error = error
+
+    def put(self, item: typing.Any, byte_count: int = 0) -> None:
+        if self.error is not None:
+            raise self.error
+        self.source_metrics.add(byte_count, 0.0)
+        self.stages[0].put(item)
+
+    def close(self) -> None:
+        for stage in self.stages:
+            stage.close()
+
+        elapsed = time.monotonic() - self._start_time
+        metrics_list = [self.source_metrics] + [x.metrics for x in self.stages]
+        for metrics in metrics_list:
+            logger.info(
+                "Pipeline stage", pipeline=self.name, **metrics.to_log(elapsed)
+            )
+
+        if self.error is not None:
+            raise self.error
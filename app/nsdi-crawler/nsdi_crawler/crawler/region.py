@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import typing
+
+import aiohttp
+import attr
+import botocore.exceptions
+import requests
+import structlog
+
+from nsdi_crawler.client import NsdiClient, NsdiLoopClient
+from nsdi_crawler.client.data import NsdiRegion
+from .upload import create_boto3_client
+
+logger = structlog.get_logger(__name__)
+
+#: (시/도, 시/군/구 목록) 시/군/구 목록이 필요 없는 서비스는 빈 목록입니다
+RegionTree = typing.List[typing.Tuple[NsdiRegion, typing.List[NsdiRegion]]]
+
+
+def region_tree_hash(tree: RegionTree) -> str:
+    data = json.dumps(
+        [
+            [region.to_json(), [x.to_json() for x in detail_list]]
+            for region, detail_list in tree
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+@attr.s
+class RegionCatalogueData(object):
+    svc_id: str = attr.ib()
+    #: 시/도, 시/군/구 목록 전체로 만든 sha256 (NSDI 의 ETag 가 아니며 바뀌었는지 로그로만 남깁니다)
+    content_hash: str = attr.ib()
+    #: 마지막으로 NSDI 와 비교한 시각 (epoch seconds)
+    checked_at: float = attr.ib()
+    #: adm_code 별 시/도
+    region_dict: typing.Dict[str, NsdiRegion] = attr.ib()
+    #: adm_code 별 시/군/구 목록 (받지 않았으면 없음)
+    detail_dict: typing.Dict[str, typing.List[NsdiRegion]] = attr.ib()
+
+    @classmethod
+    def from_json(
+        cls, data: typing.Dict[str, typing.Any]
+    ) -> "RegionCatalogueData":
+        return cls(
+            svc_id=data["svc_id"],
+            content_hash=data["content_hash"],
+            checked_at=data["checked_at"],
+            region_dict={
+                k: NsdiRegion.from_json(v)
+                for k, v in data["region_dict"].items()
+            },
+            detail_dict={
+                k: [NsdiRegion.from_json(x) for x in v]
+                for k, v in data["detail_dict"].items()
+            },
+        )
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "svc_id": self.svc_id,
+            "content_hash": self.content_hash,
+            "checked_at": self.checked_at,
+            "region_dict": {
+                k: v.to_json() for k, v in self.region_dict.items()
+            },
+            "detail_dict": {
+                k: [x.to_json() for x in v]
+                for k, v in self.detail_dict.items()
+            },
+        }
+
+    def tree(self, with_detail: bool) -> RegionTree:
+        return [
+            (region, self.detail_dict.get(adm_code, []) if with_detail else [])
+            for adm_code, region in self.region_dict.items()
+        ]
+
+
+class RegionCatalogue(object):
+    """
+    NSDI 지역 목록(시/도, 시/군/구)을 로컬 파일 또는 S3에 보관해서 실행마다 다시 받지 않습니다.
+    TTL 이 지나면 시/도 목록과 모든 시/군/구 목록을 다시 받습니다.
+    (시/도가 같아도 시/군/구가 새로 생기거나 나뉘거나 옮겨질 수 있습니다)
+    """
+
+    def __init__(self, config: typing.Dict[str, typing.Any]) -> None:
+        super().__init__()
+        self.cache_dir: typing.Optional[str] = (
+            config.get("REGION_CACHE_PATH") or None
+        )
+        self.s3_cache = config.get("REGION_CACHE_S3") == "ON"
+        self.ttl = float(config.get("REGION_CACHE_TTL_DAYS") or 7) * 86400
+        self.environment = config["ENVIRONMENT"]
+        self.bucket_name = config.get("AWS_S3_BUCKET_NAME")
+        self.s3_client: typing.Any = None
+        if self.s3_cache:
+            self.s3_client = create_boto3_client(config, "s3")
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_dir) or self.s3_cache
+
+    def cache_path(self, svc_id: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, f"region_{svc_id}.json")
+
+    def cache_key(self, svc_id: str) -> str:
+        # 크롤러 로그 폴더를 탐색할 때 섞이지 않도록 환경 폴더 밖에 저장합니다
+        return f"region-catalogue/{self.environment}/{svc_id}.json"
+
+    def fetch_region_tree(
+        self,
+        nsdi_client: typing.Union[NsdiClient, NsdiLoopClient],
+        response: typing.Union[requests.Response, aiohttp.ClientResponse],
+        svc_id: str,
+        with_detail: bool,
+        refresh: bool = False,
+    ) -> RegionTree:
+        """
+        response 는 fetch_region_list 의 Referer 로 쓰이는 init_page 응답입니다.
+        refresh 가 True 이면 TTL 에 관계없이 모든 지역 목록을 다시 받습니다.
+        """
+        if not self.enabled:
+            return self.fetch_remote_catalogue(
+                nsdi_client, response, svc_id, with_detail, None
+            ).tree(with_detail)
+
+        catalogue = None if refresh else self.load(svc_id)
+
+        if catalogue is not None and self.is_fresh(catalogue, with_detail):
+            logger.info("Region catalogue hit", svc_id=svc_id)
+            return catalogue.tree(with_detail)
+
+        catalogue = self.fetch_remote_catalogue(
+            nsdi_client, response, svc_id, with_detail, catalogue
+        )
+        self.save(catalogue)
+
+        return catalogue.tree(with_detail)
+
+    def is_fresh(
+        self, catalogue: RegionCatalogueData, with_detail: bool
+    ) -> bool:
+        if with_detail and not catalogue.detail_dict:
+            return False
+        return time.time() - catalogue.checked_at < self.ttl
+
+    def fetch_remote_catalogue(
+        self,
+        nsdi_client: typing.Union[NsdiClient, NsdiLoopClient],
+        response: typing.Union[requests.Response, aiohttp.ClientResponse],
+        svc_id: str,
+        with_detail: bool,
+        cached: typing.Optional[RegionCatalogueData],
+    ) -> RegionCatalogueData:
+        region_list = nsdi_client.fetch_region_list(response)
+
+        detail_dict: typing.Dict[str, typing.List[NsdiRegion]] = {}
+        if with_detail:
+            for region in region_list:
+                detail_dict[region.adm_code] = (
+                    nsdi_client.fetch_region_detail_list(region.adm_code)
+                )
+        content_hash = region_tree_hash(
+            [(x, detail_dict.get(x.adm_code, [])) for x in region_list]
+        )
+
+        logger.info(
+            "Region catalogue revalidated",
+            svc_id=svc_id,
+            changed=cached is None or cached.content_hash != content_hash,
+            detail_fetch_count=len(detail_dict),
+        )
+
+        return RegionCatalogueData(
+            svc_id=svc_id,
+            content_hash=content_hash,
+            checked_at=time.time(),
+            region_dict={x.adm_code: x for x in region_list},
+            detail_dict=detail_dict,
+        )
+
+    def load(self, svc_id: str) -> typing.Optional[RegionCatalogueData]:
+        data = None
+        if self.cache_dir:
+            try:
+                with open(self.cache_path(svc_id), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (IOError, ValueError):
+                data = None
+
+        if data is None and self.s3_cache:
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name, Key=self.cache_key(svc_id)
+                )
+                data = json.loads(response["Body"].read())
+            except (botocore.exceptions.ClientError, ValueError):
+                data = None
+
+        if data is None:
+            return None
+
+        try:
+            return RegionCatalogueData.from_json(data)
+        except (KeyError, AttributeError):
+            logger.warning("Invalid region catalogue", svc_id=svc_id)
+            return None
+
+    def save(self, catalogue: RegionCatalogueData) -> None:
+        body = json.dumps(catalogue.to_json(), ensure_ascii=False)
+
+        with self.lock:
+            if self.cache_dir:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                path = self.cache_path(catalogue.svc_id)
+                temp_path = path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(body)
+                os.replace(temp_path, path)
+
+            if self.s3_cache:
+                try:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=self.cache_key(catalogue.svc_id),
+                        Body=body.encode("utf-8"),
+                        ContentType="application/json",
+                    )
+                except botocore.exceptions.ClientError as e:
+                    # 캐시 저장 실패는 다음 실행에서 다시 받으면 되므로 수집을 멈추지 않습니다
+                    logger.warning(
+                        "Failed to save region catalogue", error=str(e)
+                    )
@@ -0,0 +1,99 @@
+import typing
+
+import boto3
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+#: S3 멀티파트 업로드에서 마지막 파트를 제외한 최소 파트 크기
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def create_boto3_client(
+    config: typing.Dict[str, typing.Any], service_name: str
+) -> typing.Any:
+    return boto3.client(
+        service_name,
+        aws_access_key_id=config.get("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=config.get("AWS_SECRET_ACCESS_KEY"),
+        region_name=config.get("AWS_REGION_NAME"),
+        endpoint_url=config.get("AWS_ENDPOINT_URL") or None,
+    )
+
+
+class S3MultipartUploader(object):
+    """
+    chunk 스트림을 디스크를 거치지 않고 S3 멀티파트 업로드로 올립니다.
+    메모리에는 최대 part_size 만큼의 버퍼만 유지합니다.
+    """
+
+    def __init__(
+        self, config: typing.Dict[str, typing.Any], part_size: int
+    ) -> None:
+        super().__init__()
+        self.client = create_boto3_client(config, "s3")
+        self.bucket_name = config["AWS_S3_BUCKET_NAME"]
+        self.part_size = max(part_size, MIN_PART_SIZE)
+
+    def upload_chunks(
+        self,
+        key: str,
+        chunks: typing.Iterable[bytes],
+        mime_type: str,
+    ) -> int:
+        """
+        업로드한 전체 바이트 수를 반환합니다.
+        중간에 실패하면 멀티파트 업로드를 취소해서 미완성 파트가 남지 않도록 합니다.
+        """
+        upload = self.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, ContentType=mime_type
+        )
+        upload_id = upload["UploadId"]
+        parts: typing.List[typing.Dict[str, typing.Any]] = []
+        buffer = bytearray()
+        size = 0
+
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                buffer.extend(chunk)
+                size += len(chunk)
+                if len(buffer) >= self.part_size:
+                    self._upload_part(key, upload_id, parts, buffer)
+                    buffer = bytearray()
+
+            if buffer or not parts:
+                self._upload_part(key, upload_id, parts, buffer)
+
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            logger.warning("Abort multipart upload", key=key)
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+
+        return size
+
+    def _upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        parts: typing.List[typing.Dict[str, typing.Any]],
+        data: bytearray,
+    ) -> None:
+        part_number = len(parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=bytes(data),
+        )
+        parts.append({"ETag": response["ETag"], "PartNumber": part_number})
@@ -0,0 +1,54 @@
+import datetime
+import typing
+
+import attr
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+@attr.s(frozen=True)
+class DateWindow(object):
+    #: 조회 시작 날짜 (startDate)
+    start_date: datetime.date = attr.ib()
+    #: 조회 종료 날짜 (endDate)
+    end_date: datetime.date = attr.ib()
+
+    @property
+    def start_date_str(self) -> str:
+        return self.start_date.strftime(DATE_FORMAT)
+
+    @property
+    def end_date_str(self) -> str:
+        return self.end_date.strftime(DATE_FORMAT)
+
+
+def parse_date(value: str) -> datetime.date:
+    return datetime.datetime.strptime(value, DATE_FORMAT).date()
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """
+    date 가 속한 달에서 months 만큼 지난 달의 1일을 반환합니다.
+    """
+    month_index = date.year * 12 + date.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def split_date_windows(
+    start_date: str, end_date: str, months: int = 1
+) -> typing.List[DateWindow]:
+    """
+    startDate ~ endDate 조회 기간을 months 개월 단위로 나눠 오래된 순서로 반환합니다.
+    NSDI 가 종료 날짜를 포함하는지 알 수 없으므로 이웃한 구간은 경계 날짜를 공유합니다.
+    """
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    months = max(months, 1)
+
+    window_list: typing.List[DateWindow] = []
+    while start < end:
+        window_end = min(add_months(start, months), end)
+        window_list.append(DateWindow(start, window_end))
+        start = window_end
+
+    return window_list or [DateWindow(start, end)]
@@ -0,0 +1,60 @@
+from nsdi_crawler.crawler.data import (
+    CRAWLER_LOG_FORMAT_VERSION,
+    CrawlerLogPointer,
+)
+
+NAME_TYPE = "토지이용계획정보"
+
+
+def pointer(run_prefix: str) -> CrawlerLogPointer:
+    time_stamp = run_prefix.strip("/").split("/")[-1]
+    return CrawlerLogPointer(
+        name_type=NAME_TYPE,
+        log_key=f"{run_prefix}{NAME_TYPE}/crawler-log/{time_stamp}.json",
+        run_prefix=run_prefix,
+        time_stamp=time_stamp,
+    )
+
+
+def test_from_log_key() -> None:
+    log_key = (
+        f"prod/2020/9/8/1599523200.5/{NAME_TYPE}/crawler-log/1599523200.5.json"
+    )
+
+    assert CrawlerLogPointer.from_log_key(log_key) == CrawlerLogPointer(
+        name_type=NAME_TYPE,
+        log_key=log_key,
+        run_prefix="prod/2020/9/8/1599523200.5/",
+        time_stamp="1599523200.5",
+    )
+
+
+def test_sort_key_compares_numbers() -> None:
+    old = pointer("prod/2020/9/30/1601424000.0/")
+    new = pointer("prod/2020/10/1/1601510400.0/")
+
+    # 문자열로는 "9" > "10" 이지만 숫자로 비교합니다
+    assert old.run_prefix > new.run_prefix
+    assert old.sort_key < new.sort_key
+    assert new.sort_key == (2020.0, 10.0, 1.0, 1601510400.0)
+
+
+def test_sort_key_orders_runs_of_same_day() -> None:
+    pointer_list = [
+        pointer("prod/2020/10/1/1601510400.123/"),
+        pointer("prod/2020/10/1/999.0/"),
+        pointer("prod/2020/10/1/1601510400.5/"),
+    ]
+
+    latest = max(pointer_list, key=lambda x: x.sort_key)
+
+    assert latest.time_stamp == "1601510400.5"
+
+
+def test_to_json_round_trip() -> None:
+    data = pointer("prod/2020/10/1/1601510400.0/").to_json()
+
+    assert data["version"] == CRAWLER_LOG_FORMAT_VERSION
+    assert CrawlerLogPointer.from_json(data) == pointer(
+        "prod/2020/10/1/1601510400.0/"
+    )
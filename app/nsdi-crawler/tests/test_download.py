@@ -0,0 +1,317 @@
+import http.server
+import pathlib
+import threading
+import typing
+
+import pytest
+
+from nsdi_crawler.client import (
+    DownloadJournal,
+    NsdiClient,
+    NsdiResumableDownloader,
+)
+from nsdi_crawler.client import download
+from nsdi_crawler.client.data import NsdiLandUsingInfo
+
+BODY = bytes(range(256)) * 64
+FILE_NAME = "AL_11_D155_20200908.zip"
+
+#: 응답 방식 : range (Range 지원), ignore (Range 를 무시하고 200), drop (중간에 끊기)
+MODE_RANGE = "range"
+MODE_IGNORE = "ignore"
+MODE_DROP = "drop"
+
+
+class DownloadHandler(http.server.BaseHTTPRequestHandler):
+    server: "DownloadServer"
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        range_header = self.headers.get("Range")
+        self.server.range_list.append(range_header)
+        mode = MODE_RANGE
+        if self.server.mode_list:
+            mode = self.server.mode_list.pop(0)
+
+        start = 0
+        if range_header:
+            start = int(range_header[len("bytes="):].rstrip("-"))
+        if mode == MODE_RANGE and start >= len(BODY):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(BODY)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if mode == MODE_RANGE and range_header:
+            body = BODY[start:]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"
+            )
+        else:
+            body = BODY
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if mode == MODE_DROP:
+            # 본문 절반만 보내고 연결을 끊습니다
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class DownloadServer(http.server.ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), DownloadHandler)
+        #: 요청별 응답 방식 (비어 있으면 range)
+        self.mode_list: typing.List[str] = []
+        #: 요청별 Range 헤더
+        self.range_list: typing.List[typing.Optional[str]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> typing.Iterator[DownloadServer]:
+    server = DownloadServer()
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.01,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def downloader(
+    server: DownloadServer, monkeypatch: pytest.MonkeyPatch
+) -> NsdiResumableDownloader:
+    monkeypatch.setattr(download.time, "sleep", lambda x: None)
+    client = NsdiClient({"NSDI_BASE_URL": server.url})
+    return NsdiResumableDownloader(
+        client, chunk_size=1024, journal_interval=1024
+    )
+
+
+def table_data() -> NsdiLandUsingInfo.NsdiTableData:
+    return NsdiLandUsingInfo.NsdiTableData(
+        svcld_dialog="F014",
+        extrc_se_dialog="AL",
+        extrc_dt_dialog="20200908",
+        extrc_scope_dialog="11",
+        file_nm_dialog=FILE_NAME,
+        opert_sn_dialog="2448",
+    )
+
+
+def read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_resume_with_range(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    server.mode_list = [MODE_DROP]
+    path = str(tmp_path / FILE_NAME)
+
+    journal = downloader.download(table_data(), "NIDO", path)
+
+    assert read(path) == BODY
+    assert journal.completed
+    assert journal.total_size == len(BODY)
+    assert server.range_list[0] is None
+    # 끊기기 전에 저장한 위치부터 이어받습니다
+    assert server.range_list[1] is not None
+    offset = int(server.range_list[1][len("bytes="):].rstrip("-"))
+    assert 0 < offset < len(BODY)
+
+
+def test_skip_saved_bytes_when_range_is_ignored(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    server.mode_list = [MODE_IGNORE]
+    path = str(tmp_path / FILE_NAME)
+    offset = 3000
+    with open(path, "wb") as f:
+        f.write(BODY[:offset])
+    DownloadJournal(file_name=FILE_NAME, offset=offset).save(
+        NsdiResumableDownloader.journal_path(path)
+    )
+
+    journal = downloader.download(table_data(), "NIDO", path)
+
+    assert server.range_list == [f"bytes={offset}-"]
+    assert read(path) == BODY
+    assert journal.offset == len(BODY)
+
+
+def test_unsaved_tail_is_truncated(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    offset = 2048
+    # 저널에 기록되지 않은 뒷부분(잘못된 바이트)은 버리고 이어받습니다
+    with open(path, "wb") as f:
+        f.write(BODY[:offset] + b"\xff" * 100)
+    DownloadJournal(file_name=FILE_NAME, offset=offset).save(
+        NsdiResumableDownloader.journal_path(path)
+    )
+
+    downloader.download(table_data(), "NIDO", path)
+
+    assert server.range_list == [f"bytes={offset}-"]
+    assert read(path) == BODY
+
+
+@pytest.mark.parametrize("total_size", [len(BODY), None])
+def test_range_not_satisfiable_at_end_completes(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+    total_size: typing.Optional[int],
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    # 마지막 조각까지 저장한 후 완료를 기록하기 전에 종료된 경우입니다
+    with open(path, "wb") as f:
+        f.write(BODY)
+    DownloadJournal(
+        file_name=FILE_NAME, offset=len(BODY), total_size=total_size
+    ).save(NsdiResumableDownloader.journal_path(path))
+
+    journal = downloader.download(table_data(), "NIDO", path)
+
+    assert server.range_list == [f"bytes={len(BODY)}-"]
+    assert read(path) == BODY
+    assert journal.completed
+    assert journal.total_size == len(BODY)
+    assert journal.sha256 == download.file_sha256(path)
+
+
+def test_range_not_satisfiable_restarts_from_zero(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    offset = len(BODY) + 100
+    # 서버의 파일이 저장한 크기보다 작아졌으면 처음부터 다시 받습니다
+    with open(path, "wb") as f:
+        f.write(b"\xff" * offset)
+    DownloadJournal(file_name=FILE_NAME, offset=offset).save(
+        NsdiResumableDownloader.journal_path(path)
+    )
+
+    journal = downloader.download(table_data(), "NIDO", path)
+
+    assert server.range_list == [f"bytes={offset}-", None]
+    assert read(path) == BODY
+    assert journal.completed
+
+
+def test_completed_download_is_reused(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    first = downloader.download(table_data(), "NIDO", path)
+
+    second = downloader.download(table_data(), "NIDO", path)
+
+    assert len(server.range_list) == 1
+    assert second == first
+    assert second.sha256 == download.file_sha256(path)
+
+
+def test_changed_file_is_downloaded_again(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    downloader.download(table_data(), "NIDO", path)
+    with open(path, "r+b") as f:
+        f.write(b"\x00\x00")
+
+    downloader.download(table_data(), "NIDO", path)
+
+    # sha256 이 달라 저널을 버리고 처음부터 받습니다
+    assert server.range_list == [None, None]
+    assert read(path) == BODY
+
+
+def test_journal_save_and_load(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "journal")
+    journal = DownloadJournal(
+        file_name=FILE_NAME,
+        offset=len(BODY),
+        total_size=len(BODY),
+        sha256="abc",
+        completed=True,
+    )
+    journal.save(path)
+
+    assert DownloadJournal.load(path, FILE_NAME) == journal
+    assert not (tmp_path / "journal.tmp").exists()
+
+
+def test_missing_journal_starts_from_zero(tmp_path: pathlib.Path) -> None:
+    journal = DownloadJournal.load(str(tmp_path / "journal"), FILE_NAME)
+
+    assert journal == DownloadJournal(file_name=FILE_NAME)
+    assert journal.offset == 0
+    assert not journal.completed
+
+
+def test_journal_of_other_file_is_ignored(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "journal")
+    DownloadJournal(file_name="other.zip", offset=10, completed=True).save(
+        path
+    )
+
+    assert DownloadJournal.load(path, FILE_NAME) == DownloadJournal(
+        file_name=FILE_NAME
+    )
+
+
+def test_broken_journal_is_ignored(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "journal")
+    with open(path, "w") as f:
+        f.write("{")
+
+    assert DownloadJournal.load(path, FILE_NAME) == DownloadJournal(
+        file_name=FILE_NAME
+    )
+
+
+def test_missing_file_resets_offset(
+    server: DownloadServer,
+    downloader: NsdiResumableDownloader,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = str(tmp_path / FILE_NAME)
+    DownloadJournal(file_name=FILE_NAME, offset=1000).save(
+        NsdiResumableDownloader.journal_path(path)
+    )
+
+    downloader.download(table_data(), "NIDO", path)
+
+    assert server.range_list == [None]
+    assert read(path) == BODY
@@ -0,0 +1,109 @@
+import threading
+import time
+import typing
+
+import pytest
+
+from nsdi_crawler.crawler.pipeline import Pipeline, PipelineStage
+
+
+class StageError(Exception):
+    pass
+
+
+def test_pipeline_passes_results_downstream() -> None:
+    result_list: typing.List[int] = []
+    lock = threading.Lock()
+
+    def double(item: int) -> typing.Tuple[int, int]:
+        return item * 2, 1
+
+    def collect(item: int) -> typing.Tuple[None, int]:
+        with lock:
+            result_list.append(item)
+        return None, 0
+
+    download = PipelineStage("download", double, workers=3, queue_size=2)
+    upload = PipelineStage("upload", collect, workers=2, queue_size=2)
+    with Pipeline("test", [download, upload]) as pipeline:
+        for i in range(20):
+            pipeline.put(i)
+
+    assert sorted(result_list) == [i * 2 for i in range(20)]
+    assert download.metrics.item_count == 20
+    assert download.metrics.byte_count == 20
+    assert upload.metrics.item_count == 20
+
+
+def test_pipeline_raises_first_stage_error() -> None:
+    def fail(item: int) -> typing.Tuple[int, int]:
+        if item == 3:
+            raise StageError(item)
+        return item, 0
+
+    stage = PipelineStage("download", fail, workers=1, queue_size=1)
+    with pytest.raises(StageError):
+        with Pipeline("test", [stage]) as pipeline:
+            for i in range(5):
+                pipeline.put(i)
+
+    assert stage.metrics.failure_count == 1
+
+
+def test_pipeline_stops_producer_after_error() -> None:
+    def fail(item: int) -> typing.Tuple[int, int]:
+        raise StageError(item)
+
+    stage = PipelineStage("download", fail, workers=1, queue_size=1)
+    with pytest.raises(StageError):
+        with Pipeline("test", [stage]) as pipeline:
+            pipeline.put(0)
+            deadline = time.monotonic() + 5
+            while pipeline.error is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # 실패가 기록된 후에는 더 이상 작업을 넣을 수 없습니다
+            with pytest.raises(StageError):
+                pipeline.put(1)
+
+    assert stage.metrics.failure_count == 1
+
+
+def test_pipeline_skips_remaining_items_after_error() -> None:
+    handled_list: typing.List[int] = []
+    release = threading.Event()
+
+    def fail_first(item: int) -> typing.Tuple[int, int]:
+        if item == 0:
+            release.wait(5)
+            raise StageError(item)
+        handled_list.append(item)
+        return item, 0
+
+    downstream_list: typing.List[int] = []
+
+    def collect(item: int) -> typing.Tuple[None, int]:
+        downstream_list.append(item)
+        return None, 0
+
+    download = PipelineStage("download", fail_first, workers=1, queue_size=10)
+    upload = PipelineStage("upload", collect, workers=1, queue_size=10)
+    with pytest.raises(StageError):
+        with Pipeline("test", [download, upload]) as pipeline:
+            for i in range(5):
+                pipeline.put(i)
+            release.set()
+
+    assert handled_list == []
+    assert downstream_list == []
+
+
+def test_pipeline_reraises_producer_error() -> None:
+    stage = PipelineStage(
+        "download", lambda x: (x, 0), workers=1, queue_size=1
+    )
+    with pytest.raises(StageError, match="listing"):
+        with Pipeline("test", [stage]) as pipeline:
+            pipeline.put(0)
+            raise StageError("listing")
+
+    assert isinstance(pipeline.error, StageError)
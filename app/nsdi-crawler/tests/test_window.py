@@ -0,0 +1,55 @@
+import datetime
+import typing
+
+from nsdi_crawler.crawler.window import (
+    DateWindow,
+    add_months,
+    split_date_windows,
+)
+
+
+def window_str_list(
+    window_list: typing.List[DateWindow],
+) -> typing.List[typing.Tuple[str, str]]:
+    return [(x.start_date_str, x.end_date_str) for x in window_list]
+
+
+def test_add_months_returns_first_day() -> None:
+    assert add_months(datetime.date(2020, 1, 31), 1) == datetime.date(
+        2020, 2, 1
+    )
+    assert add_months(datetime.date(2020, 11, 15), 3) == datetime.date(
+        2021, 2, 1
+    )
+
+
+def test_split_date_windows_share_boundary() -> None:
+    window_list = split_date_windows("2020-01-15", "2020-04-10")
+
+    assert window_str_list(window_list) == [
+        ("2020-01-15", "2020-02-01"),
+        ("2020-02-01", "2020-03-01"),
+        ("2020-03-01", "2020-04-01"),
+        ("2020-04-01", "2020-04-10"),
+    ]
+
+
+def test_split_date_windows_by_months() -> None:
+    window_list = split_date_windows("2020-01-01", "2020-12-31", months=6)
+
+    assert window_str_list(window_list) == [
+        ("2020-01-01", "2020-07-01"),
+        ("2020-07-01", "2020-12-31"),
+    ]
+
+
+def test_split_date_windows_within_one_month() -> None:
+    window_list = split_date_windows("2020-09-01", "2020-09-20", months=0)
+
+    assert window_str_list(window_list) == [("2020-09-01", "2020-09-20")]
+
+
+def test_split_date_windows_same_day() -> None:
+    assert split_date_windows("2020-09-01", "2020-09-01") == [
+        DateWindow(datetime.date(2020, 9, 1), datetime.date(2020, 9, 1))
+    ]
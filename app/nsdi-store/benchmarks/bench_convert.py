@@ -0,0 +1,62 @@
+"""
+CSV 변환 방식 벤치마크
+====================
+
+    python -m benchmarks.bench_convert
+    python -m benchmarks.bench_convert --rows 500000 --name-type 토지이용계획정보
+
+같은 CP949 원본 CSV 를 한 줄씩 변환(row)하는 경우와
+pyarrow 로 컬럼 단위 변환(arrow)하는 경우의 초당 변환 행 수를 비교합니다.
+arrow 는 숫자, 날짜, PNU 정리까지 포함한 시간입니다.
+"""
+import os
+import tempfile
+import time
+
+import click
+
+from nsdi_store.store.columnar import is_available
+from nsdi_store.store.convert import (
+    CONVERTER_ARROW,
+    CONVERTER_ROW,
+    convert_csv_file,
+)
+from .fixtures import NAME_TYPE_DICT, write_source_csv
+
+
+@click.command()
+@click.option("--rows", default=200000, help="CSV 행 수")
+@click.option(
+    "--name-type",
+    default="토지특성정보",
+    type=click.Choice(list(NAME_TYPE_DICT)),
+)
+def main(rows: int, name_type: str) -> None:
+    converter_list = [CONVERTER_ROW]
+    if is_available():
+        converter_list.append(CONVERTER_ARROW)
+    else:
+        click.echo("pyarrow is not installed, skip arrow")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        folder_path = temp_dir + "/"
+        source_path = folder_path + "source.csv"
+        write_source_csv(source_path, name_type, rows, seed=1)
+        size = os.path.getsize(source_path) / 1024 / 1024
+        click.echo(f"name_type: {name_type}, rows: {rows}, size: {size:.1f}MB")
+
+        for converter in converter_list:
+            start = time.perf_counter()
+            converted_path = convert_csv_file(
+                source_path, folder_path, "source.csv", name_type, converter
+            )
+            elapsed = time.perf_counter() - start
+            os.remove(converted_path)
+            click.echo(
+                f"{converter:>5}: {rows / elapsed:10.0f} rows/s, "
+                f"{size / elapsed:6.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Store 전체 실행 벤치마크
+=====================
+
+    docker run -p 5000:5000 motoserver/moto  (또는 minio)
+    (nsdi-crawler) python -m benchmarks.bench_e2e \\
+        --s3-endpoint-url http://127.0.0.1:5000
+    (nsdi-store) python -m benchmarks.bench_e2e \\
+        --uri postgresql://localhost/nsdi_bench \\
+        --s3-endpoint-url http://127.0.0.1:5000 -c LOADER=copy
+
+nsdi-crawler 의 bench_e2e 가 stub 서버에서 받아 로컬 S3 에 올린 최신 실행 폴더를
+NsdiStore.run 으로 저장하고 초당 저장 행 수, 초당 읽은 압축 파일 MB,
+최대 메모리(RSS, 변환 워커 프로세스 포함)를 출력합니다.
+전국 규모 데이터는 크롤러 대신 benchmarks.generate 로 같은 S3 에 만들 수 있습니다.
+대상 테이블에 저장하므로 벤치마크용 DB 에서만 실행해주세요.
+"""
+import time
+import typing
+
+import boto3
+import click
+import sqlalchemy as sa
+from loan_model.models.nsdi.nsdi_land_feature import NsdiLandFeature
+from loan_model.models.nsdi.nsdi_land_use import NsdiLandUse
+from nsdi_metrics import MetricsRegistry, PeakRssSampler
+
+from nsdi_store.store import NsdiStore
+
+MB = 1024 * 1024
+
+
+def zip_size(config: typing.Dict[str, typing.Any], prefix: str) -> int:
+    client = boto3.client(
+        "s3",
+        endpoint_url=config["AWS_ENDPOINT_URL"],
+        region_name=config["AWS_REGION_NAME"],
+        aws_access_key_id=config["AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=config["AWS_SECRET_ACCESS_KEY"],
+    )
+    size = 0
+    for page in client.get_paginator("list_objects_v2").paginate(
+        Bucket=config["AWS_S3_BUCKET_NAME"], Prefix=prefix
+    ):
+        for content in page.get("Contents", []):
+            if content["Key"].endswith(".zip"):
+                size += content["Size"]
+    return size
+
+
+@click.command()
+@click.option("--uri", required=True, help="벤치마크용 DB 주소")
+@click.option("--s3-endpoint-url", required=True)
+@click.option("--bucket", default="nsdi-bench")
+@click.option(
+    "-c",
+    "--config",
+    "config_list",
+    multiple=True,
+    help="Store 설정 (예: LOADER=copy)",
+)
+def main(
+    uri: str,
+    s3_endpoint_url: str,
+    bucket: str,
+    config_list: typing.Tuple[str, ...],
+) -> None:
+    engine = sa.create_engine(uri)
+    for model in (NsdiLandUse, NsdiLandFeature):
+        model.__table__.create(engine, checkfirst=True)
+
+    config: typing.Dict[str, typing.Any] = {
+        "ENVIRONMENT": "local",
+        "SQLALCHEMY_DATABASE_URI": uri,
+        "CRAWLER_LOG_ID": None,
+        "REGION_REGEX_LEVEL_1": ".*",
+        "REGION_REGEX_LEVEL_2": ".*",
+        "AWS_ACCESS_KEY_ID": "bench",
+        "AWS_SECRET_ACCESS_KEY": "bench",
+        "AWS_REGION_NAME": "us-east-1",
+        "AWS_ENDPOINT_URL": s3_endpoint_url,
+        "AWS_S3_BUCKET_NAME": bucket,
+    }
+    config.update(x.split("=", 1) for x in config_list)
+
+    sampler = PeakRssSampler()
+    store = NsdiStore(
+        config, metrics=MetricsRegistry(rss_sampler=sampler)
+    )
+    log_id_prefix = store.fetch_latest_log_prefix()
+    size = zip_size(config, log_id_prefix)
+    click.echo(f"run: {log_id_prefix}, zip {size / MB:.1f} MB")
+
+    with sampler:
+        start = time.perf_counter()
+        store.run("BENCHMARK")
+        elapsed = time.perf_counter() - start
+
+    click.echo(
+        f"store: {elapsed:.2f}s, "
+        f"rows {store.stored_row_count} "
+        f"({store.stored_row_count / elapsed:.0f} rows/s), "
+        f"zip {size / MB / elapsed:.2f} MB/s, "
+        f"peak RSS {sampler.peak / MB:.1f} MB"
+    )
+    for name, peak in sorted(sampler.stage_peak.items()):
+        click.echo(f"  {name}: peak RSS {peak / MB:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+CSV 저장 방식 벤치마크
+====================
+
+    python -m benchmarks.bench_loader --uri postgresql://localhost/nsdi_bench
+    python -m benchmarks.bench_loader --uri ... --name-type 토지이용계획정보
+
+10,000줄 단위 upsert 와 COPY 로 같은 CSV 를 저장할 때의 초당 저장 행 수를 비교합니다.
+처음 저장(insert)과 같은 PNU 를 다시 저장(update)하는 경우를 각각 측정합니다.
+대상 테이블을 비우므로 벤치마크용 DB 에서만 실행해주세요.
+"""
+import os
+import tempfile
+import time
+
+import click
+import sqlalchemy as sa
+from loan_model.models.nsdi.nsdi_land_feature import NsdiLandFeature
+from loan_model.models.nsdi.nsdi_land_use import NsdiLandUse
+
+from nsdi_store.store import NsdiStore
+from .fixtures import NAME_TYPE_DICT, write_converted_csv
+
+TABLE_DICT = {
+    "토지이용계획정보": NsdiLandUse.__table__,
+    "토지특성정보": NsdiLandFeature.__table__,
+}
+
+
+def measure(
+    store: NsdiStore, loader: str, file_path: str, name_type: str
+) -> float:
+    store.loader = loader
+    start = time.perf_counter()
+    store.store_csv_data(file_path, name_type)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--uri", required=True, help="벤치마크용 DB 주소")
+@click.option("--rows", default=50000, help="CSV 행 수")
+@click.option(
+    "--name-type",
+    default="토지특성정보",
+    type=click.Choice(list(NAME_TYPE_DICT)),
+)
+def main(uri: str, rows: int, name_type: str) -> None:
+    table = TABLE_DICT[name_type]
+    engine = sa.create_engine(uri)
+    table.create(engine, checkfirst=True)
+
+    store = NsdiStore(
+        {
+            "ENVIRONMENT": "local",
+            "SQLALCHEMY_DATABASE_URI": uri,
+            "REGION_REGEX_LEVEL_1": ".*",
+            "REGION_REGEX_LEVEL_2": ".*",
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        insert_path = os.path.join(temp_dir, "insert.csv")
+        update_path = os.path.join(temp_dir, "update.csv")
+        pnu_list = write_converted_csv(insert_path, name_type, rows, seed=1)
+        write_converted_csv(update_path, name_type, rows, 2, pnu_list)
+        click.echo(f"table: {table.name}, rows: {rows}")
+
+        for loader in ["upsert", "copy"]:
+            with engine.begin() as conn:
+                conn.execute(f"TRUNCATE {table.name}")
+
+            insert_time = measure(store, loader, insert_path, name_type)
+            update_time = measure(store, loader, update_path, name_type)
+
+            with engine.connect() as conn:
+                count = conn.execute(
+                    f"SELECT count(*) FROM {table.name}"
+                ).scalar()
+            click.echo(
+                f"{loader:>6}: insert {rows / insert_time:10.0f} rows/s, "
+                f"update {rows / update_time:10.0f} rows/s, "
+                f"table rows {count}"
+            )
+
+
+if __name__ == "__main__":
+    main()
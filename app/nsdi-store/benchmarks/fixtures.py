@@ -0,0 +1,324 @@
+"""
+fixtures
+========
+
+nsdi-crawler 가 받는 CSV 를 컬럼명 변환까지 마친 형태로 만들어 벤치마크에 사용합니다.
+부하 테스트용으로 NSDI 원본과 같은 한글 컬럼명, CP949 인코딩의 압축 파일과
+크롤러가 쓰는 S3 키 구조(실행 폴더, manifest.json, 크롤러 로그, latest 포인터)도 만듭니다.
+"""
+import csv
+import datetime
+import io
+import random
+import typing
+import zipfile
+
+from nsdi_store.store.data import NSDI_FEATURE_DICT, NSDI_USE_DICT
+
+NAME_TYPE_DICT = {
+    "토지이용계획정보": NSDI_USE_DICT,
+    "토지특성정보": NSDI_FEATURE_DICT,
+}
+
+
+def converted_columns(name_type: str) -> typing.List[str]:
+    return [x for x in NAME_TYPE_DICT[name_type].values() if x]
+
+
+def make_pnu(rnd: random.Random, sido_code: str = "11") -> str:
+    """
+    시도(2) + 시군구(3) + 읍면동(3) + 리(2) + 대장구분(1) + 본번(4) + 부번(4)
+    """
+    return (
+        f"{sido_code}{rnd.randrange(110, 750):03}{rnd.randrange(101, 130):03}"
+        f"00{rnd.randrange(1, 3)}{rnd.randrange(1, 10000):04}"
+        f"{rnd.randrange(0, 100):04}"
+    )
+
+
+def make_value(rnd: random.Random, column: str, pnu: str) -> str:
+    if column == "pnu":
+        return pnu
+    if column == "last_update_date":
+        return f"2020-{rnd.randrange(1, 13):02}-01"
+    if column == "land_area":
+        return f"{rnd.randrange(1, 100000) / 10:.1f}"
+    if column == "land_declared_value":
+        return str(rnd.randrange(1000, 10 ** 8))
+    if column.endswith("_name") or column == "address_jibun":
+        return rnd.choice(["서울특별시 강남구 역삼동", "대지", "제2종일반주거지역", ""])
+    return str(rnd.randrange(0, 1000))
+
+
+def write_converted_csv(
+    file_path: str,
+    name_type: str,
+    rows: int,
+    seed: int = 0,
+    pnu_list: typing.Optional[typing.List[str]] = None,
+) -> typing.List[str]:
+    """
+    rows 줄의 변환된 CSV 를 만들고 사용한 PNU 목록을 반환합니다.
+    pnu_list 를 주면 같은 PNU 를 다시 사용하므로 갱신(update) 데이터가 됩니다.
+    """
+    rnd = random.Random(seed)
+    column_list = converted_columns(name_type)
+    if pnu_list is None:
+        pnu_set: typing.Set[str] = set()
+        while len(pnu_set) < rows:
+            pnu_set.add(make_pnu(rnd))
+        pnu_list = sorted(pnu_set)
+
+    with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(column_list)
+        for pnu in pnu_list[:rows]:
+            writer.writerow([make_value(rnd, x, pnu) for x in column_list])
+
+    return pnu_list
+
+
+def write_source_csv(
+    file_path: str, name_type: str, rows: int, seed: int = 0
+) -> None:
+    """
+    NSDI 에서 받은 것과 같은 한글 컬럼명의 CP949 CSV 를 만듭니다.
+    변환하지 않는 컬럼("")도 포함합니다.
+    """
+    rnd = random.Random(seed)
+    column_dict = NAME_TYPE_DICT[name_type]
+
+    with open(file_path, "w", encoding="cp949", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(column_dict))
+        for _ in range(rows):
+            pnu = make_pnu(rnd)
+            writer.writerow(
+                [
+                    make_value(rnd, column or source, pnu)
+                    for source, column in column_dict.items()
+                ]
+            )
+
+
+#: (시,도 코드, 시,도 폴더 이름, 필지 수 비율) 비율은 시,도별 대략의 필지 수(백만)입니다
+SIDO_PARCEL_LIST = [
+    ("11", "서울특별시", 0.9),
+    ("26", "부산광역시", 0.7),
+    ("27", "대구광역시", 0.6),
+    ("28", "인천광역시", 0.7),
+    ("29", "광주광역시", 0.4),
+    ("30", "대전광역시", 0.3),
+    ("31", "울산광역시", 0.5),
+    ("36", "세종특별자치시", 0.2),
+    ("41", "경기도", 5.1),
+    ("43", "충청북도", 2.4),
+    ("44", "충청남도", 4.0),
+    ("46", "전라남도", 6.0),
+    ("47", "경상북도", 6.2),
+    ("48", "경상남도", 4.8),
+    ("50", "제주특별자치도", 0.9),
+    ("51", "강원특별자치도", 3.0),
+    ("52", "전북특별자치도", 3.8),
+]
+DISTRIBUTION_NATIONAL = "national"
+DISTRIBUTION_UNIFORM = "uniform"
+
+DATASET_CODE_DICT = {
+    "토지이용계획정보": "D155",
+    "토지특성정보": "D194",
+}
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+def distribute_rows(
+    rows: int,
+    distribution: str = DISTRIBUTION_NATIONAL,
+    sido_code_list: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.List[typing.Tuple[str, str, int]]:
+    """
+    전체 행 수를 시,도별로 나눈 (시,도 코드, 시,도 이름, 행 수) 목록을 반환합니다.
+    """
+    sido_list = [
+        x
+        for x in SIDO_PARCEL_LIST
+        if not sido_code_list or x[0] in sido_code_list
+    ]
+    if distribution == DISTRIBUTION_UNIFORM:
+        weight_list = [1.0] * len(sido_list)
+    else:
+        weight_list = [x[2] for x in sido_list]
+
+    total_weight = sum(weight_list)
+    count_list = [int(rows * x / total_weight) for x in weight_list]
+    # 나누고 남은 행은 앞의 시,도부터 하나씩 더합니다
+    for i in range(rows - sum(count_list)):
+        count_list[i % len(count_list)] += 1
+    return [
+        (code, name, count)
+        for (code, name, _), count in zip(sido_list, count_list)
+    ]
+
+
+def synthetic_pnu(sido_code: str, index: int) -> str:
+    """
+    index 번째 필지의 PNU 입니다. 같은 index 는 항상 같은 PNU 이고 index 순서로 정렬됩니다.
+    본번(3,000) -> 리(40) -> 읍면동(50) -> 시군구 순서로 자리를 올립니다.
+    """
+    rest, bonbun = divmod(index, 3000)
+    rest, ri = divmod(rest, 40)
+    sigungu, emd = divmod(rest, 50)
+    ledger = 2 if index % 17 == 0 else 1
+    bubun = (index * 2654435761) % 37
+    return (
+        f"{sido_code}{110 + sigungu * 5:03}{101 + emd:03}{ri:02}"
+        f"{ledger}{bonbun + 1:04}{bubun:04}"
+    )
+
+
+def is_updated(index: int, generation: int, update_ratio: float) -> bool:
+    """
+    generation 0 과 비교해 generation 에서 값이 바뀌는 행인지 여부입니다.
+    """
+    if generation == 0 or update_ratio <= 0:
+        return False
+    return (index * 2654435761 + generation * 40503) % 1000000 < (
+        update_ratio * 1000000
+    )
+
+
+def iter_source_rows(
+    name_type: str,
+    sido_code: str,
+    rows: int,
+    seed: int = 0,
+    generation: int = 0,
+    update_ratio: float = 0.0,
+) -> typing.Iterator[typing.List[str]]:
+    """
+    NSDI 원본 컬럼 순서의 행을 반환합니다.
+    바뀌지 않는 행은 generation 과 관계없이 항상 같은 값입니다.
+    """
+    column_dict = NAME_TYPE_DICT[name_type]
+    rnd = random.Random()
+    for index in range(rows):
+        pnu = synthetic_pnu(sido_code, index)
+        version = 0
+        if is_updated(index, generation, update_ratio):
+            version = generation
+        rnd.seed(f"{seed}:{pnu}:{version}")
+        yield [
+            make_value(rnd, column or source, pnu)
+            for source, column in column_dict.items()
+        ]
+
+
+def write_source_zip(
+    file_path: str,
+    name_type: str,
+    sido_code: str,
+    rows: int,
+    seed: int = 0,
+    generation: int = 0,
+    update_ratio: float = 0.0,
+) -> None:
+    """
+    CP949 CSV 하나를 담은 압축 파일을 만듭니다. 행을 바로 압축하므로 행 수와 관계없이
+    메모리 사용량이 일정합니다.
+    """
+    csv_name = file_path.rsplit("/", 1)[-1].replace(".zip", ".csv")
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as f:
+        with f.open(csv_name, "w", force_zip64=True) as member:
+            text = io.TextIOWrapper(member, encoding="cp949", newline="")
+            writer = csv.writer(text)
+            writer.writerow(list(NAME_TYPE_DICT[name_type]))
+            writer.writerows(
+                iter_source_rows(
+                    name_type, sido_code, rows, seed, generation, update_ratio
+                )
+            )
+            text.flush()
+            text.detach()
+
+
+def source_file_name(name_type: str, sido_code: str, base_date: str) -> str:
+    """
+    AL_{시,도 코드}_{데이터셋 코드}_{기준일자}.zip
+    """
+    return (
+        f"AL_{sido_code}_{DATASET_CODE_DICT[name_type]}_"
+        f"{base_date.replace('-', '')}.zip"
+    )
+
+
+def run_prefix(environment: str, time_stamp: str) -> str:
+    """
+    크롤러 실행 폴더 {ENVIRONMENT}/{년}/{월}/{일}/{time_stamp}/
+    """
+    date = datetime.datetime.fromtimestamp(float(time_stamp), KST)
+    return (
+        f"{environment}/{date.year}/{date.month:02}/{date.day:02}/"
+        f"{time_stamp}/"
+    )
+
+
+def zip_key(
+    prefix: str, name_type: str, sido: str, base_date: str, file_name: str
+) -> str:
+    """
+    시,도 전체 파일은 크롤러와 같이 시,군,구 폴더를 ALL 로 저장합니다.
+    """
+    return (
+        f"{prefix}{name_type}/data/전체데이터/{sido}/ALL/"
+        f"base_date_{base_date}/{file_name}"
+    )
+
+
+def manifest_data(
+    time_stamp: str, entry_list: typing.List[typing.Dict[str, typing.Any]]
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "time_stamp": time_stamp,
+        "entries": sorted(
+            entry_list,
+            key=lambda x: (
+                x["name_type"], x["sido"], x["gugun"], x["base_date"], x["key"]
+            ),
+        ),
+    }
+
+
+def crawler_log_data(
+    time_stamp: str,
+    name_type: str,
+    zip_count: int,
+    region_date_list: typing.List[typing.Tuple[str, str]],
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "time_stamp": time_stamp,
+        "run_by": "BENCHMARK",
+        "finish_time_stamp": time_stamp,
+        "total_statistics": {
+            "land_use_zip_count": (
+                zip_count if name_type == "토지이용계획정보" else 0
+            ),
+            "land_feature_zip_count": (
+                zip_count if name_type == "토지특성정보" else 0
+            ),
+        },
+        "region_date": [
+            {"region": region, "date": date}
+            for region, date in region_date_list
+        ],
+    }
+
+
+def pointer_data(
+    prefix: str, name_type: str, log_key: str, time_stamp: str
+) -> typing.Dict[str, str]:
+    return {
+        "name_type": name_type,
+        "log_key": log_key,
+        "run_prefix": prefix,
+        "time_stamp": time_stamp,
+    }
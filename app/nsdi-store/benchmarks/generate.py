@@ -0,0 +1,213 @@
+"""
+부하 테스트용 NSDI 압축 파일 생성
+============================
+
+    python -m benchmarks.generate --output /data/nsdi --rows 1000000
+    python -m benchmarks.generate --rows 38000000 \\
+        --s3-endpoint-url http://127.0.0.1:5000 --bucket nsdi-bench
+    python -m benchmarks.generate --rows 38000000 --generation 1 \\
+        --update-ratio 0.05 --s3-endpoint-url http://127.0.0.1:5000
+
+토지이용계획정보, 토지특성정보 압축 파일(CP949 CSV)을 시,도별로 하나씩 만들고
+크롤러와 같은 S3 키 구조로 저장합니다. (실행 폴더, manifest.json, 크롤러 로그, latest 포인터)
+--output 이면 로컬 디렉토리에, --s3-endpoint-url 이면 S3 에 저장합니다.
+
+--rows 는 종류별 전체 행 수이며 --distribution national 은 시,도별 필지 수 비율로,
+uniform 은 똑같이 나눕니다. 같은 --seed 로 --generation 을 올려 만들면 PNU 는 같고
+--update-ratio 만큼의 행만 값이 바뀌므로 DELTA_SKIP, upsert 갱신 성능을 측정할 수 있습니다.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import typing
+
+import boto3
+import click
+
+from .fixtures import (
+    DISTRIBUTION_NATIONAL,
+    DISTRIBUTION_UNIFORM,
+    NAME_TYPE_DICT,
+    SIDO_PARCEL_LIST,
+    crawler_log_data,
+    distribute_rows,
+    manifest_data,
+    pointer_data,
+    run_prefix,
+    source_file_name,
+    write_source_zip,
+    zip_key,
+)
+
+
+class LocalTarget(object):
+    def __init__(self, root: str) -> None:
+        super().__init__()
+        self.root = root
+
+    def path(self, key: str) -> str:
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def put_file(self, key: str, file_path: str) -> None:
+        shutil.move(file_path, self.path(key))
+
+    def put_json(self, key: str, data: typing.Any) -> None:
+        with open(self.path(key), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+class S3Target(object):
+    def __init__(
+        self, endpoint_url: typing.Optional[str], bucket: str
+    ) -> None:
+        super().__init__()
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.bucket = bucket
+
+    def put_file(self, key: str, file_path: str) -> None:
+        self.client.upload_file(file_path, self.bucket, key)
+        os.remove(file_path)
+
+    def put_json(self, key: str, data: typing.Any) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=json.dumps(data, ensure_ascii=False).encode("utf-8"),
+            ContentType="application/json",
+        )
+
+
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@click.command()
+@click.option("--output", default=None, type=click.Path(file_okay=False))
+@click.option("--s3-endpoint-url", default=None)
+@click.option("--bucket", default="nsdi-bench")
+@click.option("--environment", default="local")
+@click.option("--rows", default=100000, help="종류별 전체 행 수")
+@click.option(
+    "--name-type",
+    "name_type_list",
+    multiple=True,
+    type=click.Choice(list(NAME_TYPE_DICT)),
+)
+@click.option(
+    "--distribution",
+    default=DISTRIBUTION_NATIONAL,
+    type=click.Choice([DISTRIBUTION_NATIONAL, DISTRIBUTION_UNIFORM]),
+)
+@click.option(
+    "--sido-code",
+    "sido_code_list",
+    multiple=True,
+    type=click.Choice([x[0] for x in SIDO_PARCEL_LIST]),
+)
+@click.option("--seed", default=0)
+@click.option("--generation", default=0, help="0 이면 처음 데이터")
+@click.option("--update-ratio", default=0.0, help="generation 0 대비 바뀌는 행 비율")
+@click.option("--base-date", default=None, help="기준일자 (기본: generation 개월 후)")
+def main(
+    output: typing.Optional[str],
+    s3_endpoint_url: typing.Optional[str],
+    bucket: str,
+    environment: str,
+    rows: int,
+    name_type_list: typing.Tuple[str, ...],
+    distribution: str,
+    sido_code_list: typing.Tuple[str, ...],
+    seed: int,
+    generation: int,
+    update_ratio: float,
+    base_date: typing.Optional[str],
+) -> None:
+    if output:
+        target: typing.Union[LocalTarget, S3Target] = LocalTarget(output)
+    elif s3_endpoint_url:
+        target = S3Target(s3_endpoint_url, bucket)
+    else:
+        raise click.UsageError("--output 또는 --s3-endpoint-url 이 필요합니다")
+
+    if base_date is None:
+        year, month = divmod(generation, 12)
+        base_date = f"{2020 + year}-{month + 1:02}-01"
+    time_stamp = str(time.time())
+    prefix = run_prefix(environment, time_stamp)
+    entry_list = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name_type in name_type_list or list(NAME_TYPE_DICT):
+            region_date_list = []
+            for code, sido, count in distribute_rows(
+                rows, distribution, sido_code_list
+            ):
+                if not count:
+                    continue
+                file_name = source_file_name(name_type, code, base_date)
+                file_path = os.path.join(temp_dir, file_name)
+                start = time.perf_counter()
+                write_source_zip(
+                    file_path,
+                    name_type,
+                    code,
+                    count,
+                    seed,
+                    generation,
+                    update_ratio,
+                )
+                elapsed = time.perf_counter() - start
+                size = os.path.getsize(file_path)
+                key = zip_key(prefix, name_type, sido, base_date, file_name)
+                entry_list.append(
+                    {
+                        "key": key,
+                        "name_type": name_type,
+                        "data_type": "전체데이터",
+                        "sido": sido,
+                        "gugun": "ALL",
+                        "base_date": base_date,
+                        "file_name": file_name,
+                        "size": size,
+                        "sha256": file_sha256(file_path),
+                    }
+                )
+                target.put_file(key, file_path)
+                region_date_list.append((sido, base_date))
+                click.echo(
+                    f"{key}: {count} rows, {size / 1024 / 1024:.1f} MB, "
+                    f"{count / elapsed:.0f} rows/s"
+                )
+
+            log_key = (
+                f"{prefix}{name_type}/crawler-log/{time_stamp}.json"
+            )
+            target.put_json(
+                log_key,
+                crawler_log_data(
+                    time_stamp, name_type, len(region_date_list),
+                    region_date_list,
+                ),
+            )
+            target.put_json(
+                f"latest/{environment}/{name_type}.json",
+                pointer_data(prefix, name_type, log_key, time_stamp),
+            )
+
+    target.put_json(
+        f"{prefix}manifest.json", manifest_data(time_stamp, entry_list)
+    )
+    click.echo(f"run: {prefix}, files: {len(entry_list)}")
+
+
+if __name__ == "__main__":
+    main()
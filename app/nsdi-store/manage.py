@@ -3,6 +3,7 @@ import os
 import typing
 
 import attr
+import boto3
 import click
 import psutil
 import sentry_sdk
@@ -12,7 +13,18 @@ from crawler.aws_client import CloudWatchClient
 from dotenv import load_dotenv, find_dotenv
 from tanker.utils.logging import setup_logging
 import nsdi_store.config
+from nsdi_store.db import create_session_factory
+from nsdi_metrics import (
+    CloudWatchMetricsExporter,
+    MetricsRegistry,
+    PrometheusTextfileExporter,
+)
 from nsdi_store.store import NsdiStore
+from nsdi_store.store.delta import NsdiDeltaFilter
+from nsdi_store.store.ledger import NsdiIngestionLedger
+from nsdi_store.store.partition import NsdiPartitioner, SIDO_CODE_DICT
+from nsdi_store.store.store import NAME_TYPE_MODEL_DICT
+from nsdi_store.store.swap import NsdiShadowSwap
 
 logger = structlog.get_logger(__name__)
 
@@ -30,14 +42,27 @@ class Context(object):
     config: typing.Dict[str, typing.Any] = attr.ib()
 
 
-def init_runner(context: Context, run_by: str) -> typing.Callable:
+def init_runner(
+    context: Context,
+    run_by: str,
+    metrics: typing.Optional[MetricsRegistry] = None,
+) -> typing.Callable:
     setup_logging(context.config["DEBUG"])
 
     sentry_sdk.init(dsn=context.config.get("SENTRY_DSN"))
 
+    registry = metrics or MetricsRegistry()
+    textfile_path = context.config.get("METRICS_TEXTFILE")
+
     def runner() -> None:
-        store = NsdiStore(context.config)
-        store.run(run_by)
+        store = NsdiStore(context.config, registry)
+        try:
+            store.run(run_by)
+        finally:
+            if textfile_path:
+                PrometheusTextfileExporter(
+                    textfile_path, "nsdi_store", registry
+                ).export()
 
     return runner
 
@@ -93,6 +118,113 @@ def run(ctx: typing.Any) -> None:
     runner()
 
 
+@cli.command()
+@click.option("--table-name", default=None, help="비울 테이블 (없으면 전체)")
+@click.pass_context
+def reset_fingerprint(
+    ctx: typing.Any, table_name: typing.Optional[str]
+) -> None:
+    """
+    DELTA_SKIP 에 쓰는 행 해시를 지워서 다음 저장 때 모든 행을 다시 저장합니다.
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    delta_filter = NsdiDeltaFilter(create_session_factory(context.config))
+    delta_filter.create_table()
+    delta_filter.reset(table_name)
+
+
+@cli.command()
+@click.option("--key-prefix", default=None, help="지울 S3 키 접두어 (없으면 전체)")
+@click.pass_context
+def reset_ledger(ctx: typing.Any, key_prefix: typing.Optional[str]) -> None:
+    """
+    LEDGER 저장 기록을 지워서 이미 저장한 압축 파일도 다시 저장하게 합니다.
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    ledger = NsdiIngestionLedger(create_session_factory(context.config))
+    ledger.create_table()
+    ledger.reset(key_prefix)
+
+
+@cli.command()
+@click.option(
+    "--name-type",
+    "name_type_list",
+    multiple=True,
+    type=click.Choice(list(NAME_TYPE_MODEL_DICT)),
+    required=True,
+)
+@click.pass_context
+def rollback_swap(
+    ctx: typing.Any, name_type_list: typing.List[str]
+) -> None:
+    """
+    FULL_RELOAD 로 교체한 테이블을 {테이블}_old 와 다시 바꿉니다.
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    shadow_swap = NsdiShadowSwap(create_session_factory(context.config))
+    for name_type in name_type_list:
+        shadow_swap.rollback(NAME_TYPE_MODEL_DICT[name_type].__table__)
+
+
+@cli.command()
+@click.option(
+    "--name-type",
+    "name_type_list",
+    multiple=True,
+    type=click.Choice(list(NAME_TYPE_MODEL_DICT)),
+    required=True,
+)
+@click.pass_context
+def create_partition(
+    ctx: typing.Any, name_type_list: typing.List[str]
+) -> None:
+    """
+    테이블을 시,도 코드(PNU 앞 2자리) 파티션 테이블로 바꿉니다. (store 가 멈춘 상태에서 실행)
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    partitioner = NsdiPartitioner(create_session_factory(context.config))
+    for name_type in name_type_list:
+        partitioner.create(NAME_TYPE_MODEL_DICT[name_type].__table__)
+
+
+@cli.command()
+@click.option(
+    "--name-type",
+    type=click.Choice(list(NAME_TYPE_MODEL_DICT)),
+    required=True,
+)
+@click.option(
+    "--sido-code",
+    "sido_code_list",
+    multiple=True,
+    type=click.Choice(sorted(set(SIDO_CODE_DICT.values()))),
+    required=True,
+)
+@click.pass_context
+def rollback_partition(
+    ctx: typing.Any, name_type: str, sido_code_list: typing.List[str]
+) -> None:
+    """
+    PARTITION_RELOAD 로 교체한 시,도 파티션을 {파티션}_old 와 다시 바꿉니다.
+    """
+    context: Context = ctx.obj["context"]
+    setup_logging(context.config["DEBUG"])
+
+    partitioner = NsdiPartitioner(create_session_factory(context.config))
+    table = NAME_TYPE_MODEL_DICT[name_type].__table__
+    for sido_code in sido_code_list:
+        partitioner.rollback(table, sido_code)
+
+
 # scheduled tasks로 돌릴 때 사용하는 함수이고, cloudwatch 로그를 찍습니다.
 @cli.command()
 @click.pass_context
@@ -100,11 +232,28 @@ def run_scheduler(ctx: typing.Any) -> None:
     context: Context = ctx.obj["context"]
 
     cloudwatch = CloudWatchClient(context.config)
+    metrics = MetricsRegistry()
+    exporter: typing.Optional[CloudWatchMetricsExporter] = None
+    if context.config.get("CLOUDWATCH_METRICS") != "OFF":
+        exporter = CloudWatchMetricsExporter(
+            boto3.client(
+                "cloudwatch",
+                aws_access_key_id=context.config.get("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=context.config.get(
+                    "AWS_SECRET_ACCESS_KEY"
+                ),
+                region_name=context.config.get("AWS_REGION_NAME"),
+                endpoint_url=context.config.get("AWS_ENDPOINT_URL") or None,
+            ),
+            "NsdiStore",
+            metrics,
+            context.config["ENVIRONMENT"],
+        )
 
     scheduler = BackgroundScheduler()
     scheduler.add_job(
         _run_cloudwatch_log,
-        args=[cloudwatch],
+        args=[cloudwatch, exporter],
         id="cloudwatch_log",
         name="cloudwatch_log",
         trigger="cron",
@@ -113,14 +262,20 @@ def run_scheduler(ctx: typing.Any) -> None:
 
     scheduler.start()
 
-    runner = init_runner(context, "SCHEDULER")
+    runner = init_runner(context, "SCHEDULER", metrics)
 
-    runner()
-
-    scheduler.remove_job("cloudwatch_log")
+    try:
+        runner()
+    finally:
+        scheduler.remove_job("cloudwatch_log")
+        # 마지막 전송 이후 1분이 되지 않은 지표도 보냅니다
+        _export_metrics(exporter)
 
 
-def _run_cloudwatch_log(client: CloudWatchClient) -> None:
+def _run_cloudwatch_log(
+    client: CloudWatchClient,
+    exporter: typing.Optional[CloudWatchMetricsExporter] = None,
+) -> None:
     try:
         client.put_metric(
             "NsdiStore",
@@ -141,6 +296,22 @@ def _run_cloudwatch_log(client: CloudWatchClient) -> None:
     except Exception as e:
         logger.error("Exception while cloudwatch scheduler", exc_info=e)
 
+    _export_metrics(exporter)
+
+
+def _export_metrics(
+    exporter: typing.Optional[CloudWatchMetricsExporter],
+) -> None:
+    """
+    단계별 지표(S3 목록, 압축 해제, CSV 변환, DB 저장 등)를 PutMetricData 로 묶어서 보냅니다.
+    """
+    if exporter is None:
+        return
+    try:
+        exporter.export()
+    except Exception as e:
+        logger.error("Exception while exporting metrics", exc_info=e)
+
 
 def main() -> None:
     cli()
@@ -41,6 +41,52 @@ SCHEMA = {
     'REGION_REGEX_LEVEL_1': fields.StringField(optional=False),
     # 시, 군, 구 지역
     'REGION_REGEX_LEVEL_2': fields.StringField(optional=False),
+    # 압축 파일을 다운로드, 변환, 저장 워커 풀로 나눠 처리할지 여부 : ON, OFF
+    'INGEST_PARALLEL': fields.StringField(optional=True),
+    # S3 다운로드 스레드 수 (기본 4)
+    'INGEST_DOWNLOAD_WORKERS': fields.StringField(optional=True),
+    # 압축 해제, 컬럼 변환 프로세스 수 (기본 CPU 수, 0이면 다운로드 스레드에서 변환)
+    'INGEST_CONVERT_WORKERS': fields.StringField(optional=True),
+    # 동시에 DB 에 저장하는 워커(연결) 수 (기본 2)
+    'INGEST_WRITER_WORKERS': fields.StringField(optional=True),
+    # 다운로드 후 저장을 기다리는 최대 파일 수 (기본 8)
+    'INGEST_MAX_INFLIGHT': fields.StringField(optional=True),
+    # CSV 저장 방식 : upsert (10,000줄 단위 upsert, 기본), copy (PostgreSQL COPY)
+    'LOADER': fields.StringField(optional=True),
+    # 압축 파일을 임시 파일 없이 S3 에서 바로 읽어 저장할지 여부 : ON, OFF
+    'STREAM_ZIP': fields.StringField(optional=True),
+    # CSV 변환 방식 : row (한 줄씩, 기본), arrow (pyarrow 컬럼 단위 변환, 숫자/날짜/PNU 정리)
+    # arrow 는 poetry install -E arrow 로 pyarrow 를 설치해야 하며 없으면 시작할 때 실패합니다
+    'CONVERTER': fields.StringField(optional=True),
+    # 내용(해시)이 바뀌지 않은 행은 저장하지 않을지 여부 : ON, OFF
+    'DELTA_SKIP': fields.StringField(optional=True),
+    # 압축 파일별 저장 기록을 남기고 이미 저장한 파일은 건너뛸지 여부 : ON, OFF
+    'LEDGER': fields.StringField(optional=True),
+    # 전체데이터를 shadow 테이블에 넣은 후 운영 테이블과 교체할지 여부 : ON, OFF
+    # (이번에 받지 않은 시,군,구는 운영 테이블 값을 유지하고 이전 테이블은 {테이블}_old 로 남깁니다)
+    'FULL_RELOAD': fields.StringField(optional=True),
+    # 시,도 파티션 테이블에서 받은 시,도 파티션을 새 테이블로 교체할지 여부 : ON, OFF
+    # (upsert 하지 않고 DETACH / ATTACH 로 바꾸며 받지 않은 시,군,구는 유지하고
+    #  이전 파티션은 {파티션}_old 로 남깁니다)
+    'PARTITION_RELOAD': fields.StringField(optional=True),
+    # 단계별 지표를 Prometheus textfile 형식으로 저장할 파일 경로 (*.prom, 없으면 저장 안함)
+    'METRICS_TEXTFILE': fields.StringField(optional=True),
+    # 단계별 지표를 run_scheduler 에서 CloudWatch 로 보낼지 여부 : ON, OFF (기본 ON)
+    'CLOUDWATCH_METRICS': fields.StringField(optional=True),
+    # upsert 한 번에 보내는 줄 수 (기본 10000)
+    'BATCH_SIZE': fields.StringField(optional=True),
+    # 몇 번의 upsert 마다 커밋할지 (기본 1, 0 이면 파일 하나를 한 트랜잭션으로 저장)
+    'COMMIT_EVERY': fields.StringField(optional=True),
+    # DB 연결 풀 크기 (기본 SQLAlchemy 5)
+    'DB_POOL_SIZE': fields.StringField(optional=True),
+    # 풀 크기를 넘어서 추가로 여는 연결 수 (기본 SQLAlchemy 10)
+    'DB_MAX_OVERFLOW': fields.StringField(optional=True),
+    # 연결을 꺼낼 때 살아있는지 확인할지 여부 : ON, OFF
+    'DB_POOL_PRE_PING': fields.StringField(optional=True),
+    # 연결을 다시 맺는 주기 (초)
+    'DB_POOL_RECYCLE': fields.StringField(optional=True),
+    # psycopg2 executemany 방식 : values (기본), batch, default
+    'DB_EXECUTEMANY_MODE': fields.StringField(optional=True),
 }
 
 
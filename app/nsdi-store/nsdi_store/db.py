@@ -3,10 +3,37 @@ import typing
 from sqlalchemy import orm
 
 
+def create_engine_options(
+    config: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    """
+    설정하지 않은 값은 SQLAlchemy 기본값을 사용합니다.
+    """
+    options: typing.Dict[str, typing.Any] = {}
+    if config.get("DB_POOL_SIZE"):
+        options["pool_size"] = int(config["DB_POOL_SIZE"])
+    if config.get("DB_MAX_OVERFLOW"):
+        options["max_overflow"] = int(config["DB_MAX_OVERFLOW"])
+    if config.get("DB_POOL_PRE_PING") == "ON":
+        options["pool_pre_ping"] = True
+    if config.get("DB_POOL_RECYCLE"):
+        options["pool_recycle"] = int(config["DB_POOL_RECYCLE"])
+
+    db_uri = config["SQLALCHEMY_DATABASE_URI"]
+    if db_uri.startswith("postgresql"):
+        # psycopg2 의 executemany 는 한 줄씩 실행하므로
+        # values (execute_values), batch (execute_batch) 로 묶어서 보냅니다
+        executemany_mode = config.get("DB_EXECUTEMANY_MODE") or "values"
+        if executemany_mode != "default":
+            options["executemany_mode"] = executemany_mode
+
+    return options
+
+
 def create_session_factory(
     config: typing.Dict[str, typing.Any]
 ) -> orm.session:
     db_uri = config["SQLALCHEMY_DATABASE_URI"]
-    db_engine = sa.create_engine(db_uri)
+    db_engine = sa.create_engine(db_uri, **create_engine_options(config))
     session_factory = orm.sessionmaker(bind=db_engine)
     return session_factory
@@ -0,0 +1,165 @@
+"""
+pyarrow 로 NSDI CSV 를 컬럼 단위로 변환합니다.
+
+convert_land_csv 는 한 줄씩 컬럼명만 바꾸지만 여기서는 record batch 단위로
+컬럼명 변환, 빈 컬럼("") 제거, 숫자/날짜 변환, PNU 자리수 정규화를 한 번에 처리합니다.
+pyarrow 는 선택 의존성(poetry install -E arrow)이며
+설치되어 있지 않으면 CONVERTER=arrow 를 사용할 수 없습니다.
+"""
+import csv
+import typing
+
+from .data import PNU_COLUMN
+from .exc import NsdiStoreError
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None
+
+SOURCE_ENCODING = "cp949"
+BLOCK_SIZE = 4 * 1024 * 1024
+
+#: 토지 고유번호 자리수 (시도 2 + 시군구 3 + 읍면동 3 + 리 2 + 대장 1 + 본번 4 + 부번 4)
+PNU_LENGTH = 19
+NUMERIC_COLUMN_DICT = {
+    "land_area": "float64",
+    "land_declared_value": "int64",
+}
+DATE_COLUMN_SET = {"last_update_date"}
+
+
+def is_available() -> bool:
+    return pa is not None
+
+
+def read_header(file_path: str) -> typing.List[str]:
+    with open(file_path, "r", encoding=SOURCE_ENCODING, newline="") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise NsdiStoreError("empty csv")
+    return header
+
+
+def empty_to_null(array: typing.Any) -> typing.Any:
+    return pc.if_else(pc.equal(array, ""), pa.scalar(None, pa.string()), array)
+
+
+def normalize_pnu(array: typing.Any) -> typing.Any:
+    """
+    엑셀 등을 거치면서 생긴 앞뒤 공백, 소수점(.0), 빠진 앞자리 0 을 정리합니다.
+    빈 PNU 는 0 으로 채우지 않고 null 로 바꿉니다. (iter_converted_batches 에서 버립니다)
+    """
+    array = empty_to_null(pc.replace_substring_regex(array, r"\.0+$", ""))
+    return pc.utf8_lpad(array, PNU_LENGTH, "0")
+
+
+def parse_numeric(array: typing.Any, type_name: str) -> typing.Any:
+    array = empty_to_null(pc.replace_substring(array, ",", ""))
+    if type_name == "int64":
+        # 공시지가가 "1000.0" 처럼 들어오는 경우가 있어 실수로 읽은 후 바꿉니다
+        return pc.cast(pc.cast(array, pa.float64()), pa.int64())
+    return pc.cast(array, pa.type_for_alias(type_name))
+
+
+def parse_date(array: typing.Any) -> typing.Any:
+    """
+    2020-07-01, 2020/07/01, 20200701 을 모두 날짜로 변환합니다.
+    """
+    array = empty_to_null(pc.replace_substring_regex(array, r"[-/.]", ""))
+    timestamp = pc.strptime(array, format="%Y%m%d", unit="s")
+    return pc.cast(timestamp, pa.date32())
+
+
+def convert_column(name: str, array: typing.Any) -> typing.Any:
+    array = pc.utf8_trim_whitespace(array)
+    if name == PNU_COLUMN:
+        return normalize_pnu(array)
+    if name in NUMERIC_COLUMN_DICT:
+        return parse_numeric(array, NUMERIC_COLUMN_DICT[name])
+    if name in DATE_COLUMN_SET:
+        return parse_date(array)
+    return empty_to_null(array)
+
+
+def iter_converted_batches(
+    file_path: str,
+    column_dict: typing.Dict[str, str],
+    block_size: int = BLOCK_SIZE,
+) -> typing.Iterator[typing.Any]:
+    """
+    원본 CSV 를 block_size 단위로 읽어 변환된 pyarrow.RecordBatch 를 반환합니다.
+    PNU 가 비어있는 행은 저장할 수 없으므로 버립니다.
+    """
+    if not is_available():
+        raise NsdiStoreError("pyarrow is not installed")
+
+    source_list = []
+    column_list = []
+    for column in read_header(file_path):
+        converted = column_dict.get(column.strip())
+        if converted:
+            source_list.append(column)
+            column_list.append(converted)
+
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(
+            encoding=SOURCE_ENCODING, block_size=block_size
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=source_list,
+            column_types={x: pa.string() for x in source_list},
+            strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        try:
+            converted = pa.RecordBatch.from_arrays(
+                [
+                    convert_column(name, batch.column(source))
+                    for source, name in zip(source_list, column_list)
+                ],
+                names=column_list,
+            )
+            if PNU_COLUMN in column_list:
+                # data.is_empty_pnu 와 같은 규칙입니다 (빈 PNU 는 null 로 바뀝니다)
+                pnu = converted.column(column_list.index(PNU_COLUMN))
+                converted = converted.filter(pc.is_valid(pnu))
+            yield converted
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise NsdiStoreError(f"Convert column error: {e}")
+
+
+def convert_land_csv_columnar(
+    file_path: str,
+    folder_path: str,
+    file_name: str,
+    column_dict: typing.Dict[str, str],
+) -> str:
+    """
+    convert_land_csv 처럼 folder_path 에 변환된 CSV (UTF-8) 를 저장하고 경로를 반환합니다.
+    """
+    converted_csv_path = folder_path + "converted_" + file_name
+    writer = None
+    try:
+        for batch in iter_converted_batches(file_path, column_dict):
+            if writer is None:
+                writer = pa_csv.CSVWriter(converted_csv_path, batch.schema)
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # 내용이 없는 파일도 다음 단계가 읽을 수 있도록 컬럼명은 남깁니다
+        with open(converted_csv_path, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerow(
+                column_dict[x.strip()]
+                for x in read_header(file_path)
+                if column_dict.get(x.strip())
+            )
+
+    return converted_csv_path
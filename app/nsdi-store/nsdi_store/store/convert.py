@@ -0,0 +1,130 @@
+import csv
+import os
+import time
+import typing
+
+import structlog
+from crawler.utils.converter import convert_land_csv
+from crawler.utils.download import extract_zip_file
+
+from .columnar import convert_land_csv_columnar
+from .data import (
+    NSDI_FEATURE_DICT,
+    NSDI_USE_DICT,
+    PNU_COLUMN,
+    is_empty_pnu,
+)
+from .exc import NsdiStoreError
+
+logger = structlog.get_logger(__name__)
+
+
+CONVERTER_ROW = "row"
+CONVERTER_ARROW = "arrow"
+
+
+def convert_csv_file(
+    file_path: str,
+    folder_path: str,
+    file_name: str,
+    name_type: str,
+    converter: str = CONVERTER_ROW,
+) -> str:
+    """
+    converter 가 arrow 이면 pyarrow 로 컬럼 단위 변환을 하고
+    숫자, 날짜, PNU 값도 정리합니다.
+    어느 방식이든 PNU 가 비어있는 행은 버립니다.
+    """
+    logger.info("Convert start", file_name=file_name, converter=converter)
+    if name_type == "토지이용계획정보":
+        column_dict = NSDI_USE_DICT
+    elif name_type == "토지특성정보":
+        column_dict = NSDI_FEATURE_DICT
+    else:
+        raise NsdiStoreError("not found name type")
+
+    if converter == CONVERTER_ARROW:
+        converted_csv_path = convert_land_csv_columnar(
+            file_path, folder_path, file_name, column_dict
+        )
+    else:
+        converted_csv_path = convert_land_csv(
+            file_path, folder_path, file_name, column_dict
+        )
+        drop_empty_pnu_rows(converted_csv_path)
+    logger.info("Convert finish", file_name=file_name)
+
+    return converted_csv_path
+
+
+def drop_empty_pnu_rows(csv_path: str) -> int:
+    """
+    convert_land_csv 는 모든 행을 그대로 옮기므로 PNU 가 비어있는 행을 지우고 지운 행 수를 반환합니다.
+    """
+    temp_path = csv_path + ".tmp"
+    drop_count = 0
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f, open(
+        temp_path, "w", encoding="utf-8-sig", newline=""
+    ) as temp:
+        reader = csv.reader(f)
+        writer = csv.writer(temp)
+        header = next(reader, None)
+        pnu_index = None
+        if header is not None:
+            writer.writerow(header)
+            if PNU_COLUMN in header:
+                pnu_index = header.index(PNU_COLUMN)
+        for row in reader:
+            if row and pnu_index is not None and is_empty_pnu(row[pnu_index]):
+                drop_count += 1
+                continue
+            writer.writerow(row)
+    os.replace(temp_path, csv_path)
+
+    return drop_count
+
+
+def convert_zip_file(
+    zip_path: str,
+    folder_path: str,
+    file_name: str,
+    name_type: str,
+    converter: str = CONVERTER_ROW,
+) -> str:
+    """
+    압축 파일을 풀고 컬럼명을 변환한 CSV 경로를 반환합니다.
+    프로세스 풀에서도 실행할 수 있도록 모듈 함수로 둡니다.
+    """
+    return convert_zip_file_timed(
+        zip_path, folder_path, file_name, name_type, converter
+    )[0]
+
+
+def convert_zip_file_timed(
+    zip_path: str,
+    folder_path: str,
+    file_name: str,
+    name_type: str,
+    converter: str = CONVERTER_ROW,
+) -> typing.Tuple[str, typing.Dict[str, float]]:
+    """
+    convert_zip_file 과 같고 단계별 소요 시간(zip_extract, csv_convert)도 반환합니다.
+    프로세스 풀 안에서는 부모 프로세스의 지표에 기록할 수 없으므로 값으로 돌려줍니다.
+    """
+    csv_file_name = file_name.replace(".zip", ".csv")
+    start = time.perf_counter()
+    extract_zip_file(zip_path, folder_path, csv_file_name)
+    extract_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    converted_csv_path = convert_csv_file(
+        zip_path.replace(".zip", ".csv"),
+        folder_path,
+        csv_file_name,
+        name_type,
+        converter,
+    )
+    return converted_csv_path, {
+        "zip_extract": extract_seconds,
+        "csv_convert": time.perf_counter() - start,
+    }
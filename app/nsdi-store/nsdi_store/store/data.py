@@ -1,6 +1,20 @@
 import typing
 import attr
 
+#: 읽을 수 있는 크롤러 latest 포인터, manifest.json 형식 버전 (nsdi-crawler 와 같아야 합니다)
+CRAWLER_LOG_FORMAT_VERSION = 1
+
+#: 변환된 CSV 의 PNU 컬럼명
+PNU_COLUMN = "pnu"
+
+
+def is_empty_pnu(pnu: typing.Optional[str]) -> bool:
+    """
+    PNU 가 비어있는 행은 저장할 수 없으므로 모든 변환 방식(row, arrow, 스트리밍)에서 버립니다.
+    """
+    return not pnu
+
+
 NSDI_FEATURE_DICT = {
     "고유번호": "pnu",
     "법정동코드": "",
@@ -108,3 +122,71 @@ class CrawlerLogResponse(object):
                 CrawlerRegionDate.from_json(x) for x in data["region_date"]
             ],
         )
+
+
+@attr.s(frozen=True)
+class CrawlerLogPointer(object):
+    name_type: str = attr.ib()
+    log_key: str = attr.ib()
+    run_prefix: str = attr.ib()
+    time_stamp: str = attr.ib()
+
+    class CrawlerLogPointerData(typing.Dict):
+        name_type: str
+        log_key: str
+        run_prefix: str
+        time_stamp: str
+
+    @classmethod
+    def from_json(cls, data: CrawlerLogPointerData) -> "CrawlerLogPointer":
+        return cls(
+            name_type=data["name_type"],
+            log_key=data["log_key"],
+            run_prefix=data["run_prefix"],
+            time_stamp=data["time_stamp"],
+        )
+
+    @property
+    def sort_key(self) -> typing.Tuple[float, ...]:
+        split_prefix = self.run_prefix.strip("/").split("/")[1:]
+        return tuple(float(x) for x in split_prefix)
+
+
+@attr.s(frozen=True)
+class CrawlerManifestEntry(object):
+    key: str = attr.ib()
+    name_type: str = attr.ib()
+    data_type: str = attr.ib()
+    sido: str = attr.ib()
+    gugun: str = attr.ib()
+    base_date: str = attr.ib()
+    file_name: str = attr.ib()
+    size: int = attr.ib()
+    sha256: str = attr.ib()
+
+    class CrawlerManifestEntryData(typing.Dict):
+        key: str
+        name_type: str
+        data_type: str
+        sido: str
+        gugun: str
+        base_date: str
+        file_name: str
+        size: int
+        sha256: str
+
+    @classmethod
+    def from_json(
+        cls, data: CrawlerManifestEntryData
+    ) -> "CrawlerManifestEntry":
+        return cls(
+            key=data["key"],
+            name_type=data["name_type"],
+            data_type=data["data_type"],
+            sido=data["sido"],
+            gugun=data["gugun"],
+            base_date=data["base_date"],
+            file_name=data["file_name"],
+            size=data["size"],
+            sha256=data["sha256"],
+        )
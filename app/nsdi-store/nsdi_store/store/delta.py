@@ -0,0 +1,161 @@
+"""
+PNU 별 행 내용 해시(fingerprint)를 보관해서 바뀌지 않은 행은 upsert 하지 않습니다.
+
+매달 받는 전체데이터는 대부분의 행이 지난달과 같으므로
+해시가 같은 행을 걸러내면 DB 쓰기(WAL) 양이 크게 줄어듭니다.
+해시는 nsdi_store_fingerprint 테이블에 (테이블 이름, PNU) 별로 저장합니다.
+"""
+import hashlib
+import threading
+import typing
+
+import attr
+import sqlalchemy as sa
+import structlog
+from sqlalchemy import orm
+from sqlalchemy.dialects.postgresql import insert
+
+from .schema import fingerprint_table
+
+logger = structlog.get_logger(__name__)
+
+FIELD_SEPARATOR = "\x1f"
+
+
+def row_fingerprint(
+    row: typing.Dict[str, typing.Any], column_list: typing.List[str]
+) -> int:
+    data = FIELD_SEPARATOR.join(
+        "" if row.get(x) is None else str(row[x]) for x in column_list
+    )
+    digest = hashlib.md5(data.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def sql_fingerprint(column_list: typing.List[str], alias: str) -> str:
+    """
+    COPY 경로에서 임시 테이블 값으로 해시를 만드는 SQL 입니다.
+    값의 문자열 형태가 row_fingerprint 와 다를 수 있어 저장 방식을 바꾸면
+    한 번은 모든 행을 다시 저장합니다. (해시가 달라서 건너뛰지 못할 뿐 잘못 건너뛰지는 않습니다)
+    """
+    values = ", ".join(
+        f"coalesce({alias}.{x}::text, '')" for x in column_list
+    )
+    return (
+        f"('x' || left(md5(concat_ws(E'\\x1f', {values})), 16))"
+        "::bit(64)::bigint"
+    )
+
+
+@attr.s
+class DeltaStatistics(object):
+    #: 저장한 행 수
+    written: int = attr.ib(default=0)
+    #: 바뀌지 않아 건너뛴 행 수
+    skipped: int = attr.ib(default=0)
+
+
+class NsdiDeltaFilter(object):
+    def __init__(self, session_factory: orm.sessionmaker) -> None:
+        super().__init__()
+        self.session_factory = session_factory
+        self.statistics: typing.Dict[str, DeltaStatistics] = {}
+        self.statistics_lock = threading.Lock()
+
+    def create_table(self) -> None:
+        session = self.session_factory()
+        try:
+            fingerprint_table.create(session.get_bind(), checkfirst=True)
+        finally:
+            session.close()
+
+    def filter(
+        self,
+        session: orm.Session,
+        table_name: str,
+        rows: typing.List[typing.Dict[str, typing.Any]],
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        해시가 바뀐 행만 반환하고 그 행의 해시를 같은 트랜잭션에서 갱신합니다.
+        같은 PNU 가 여러 번 있으면 upsert 와 같이 마지막 행만 남깁니다.
+        """
+        if not rows:
+            return []
+
+        row_dict = {x["pnu"]: x for x in rows}
+        column_list = sorted(rows[0])
+        fingerprint_dict = {
+            pnu: row_fingerprint(row, column_list)
+            for pnu, row in row_dict.items()
+        }
+
+        stored_dict = dict(
+            session.execute(
+                sa.text(
+                    "SELECT pnu, fingerprint FROM nsdi_store_fingerprint "
+                    "WHERE table_name = :table_name AND pnu = ANY(:pnu_list)"
+                ),
+                {"table_name": table_name, "pnu_list": list(row_dict)},
+            ).fetchall()
+        )
+
+        changed_list = [
+            pnu
+            for pnu, fingerprint in fingerprint_dict.items()
+            if stored_dict.get(pnu) != fingerprint
+        ]
+        if changed_list:
+            stmt = insert(fingerprint_table).values(
+                [
+                    {
+                        "table_name": table_name,
+                        "pnu": pnu,
+                        "fingerprint": fingerprint_dict[pnu],
+                    }
+                    for pnu in changed_list
+                ]
+            )
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["table_name", "pnu"],
+                    set_={"fingerprint": stmt.excluded.fingerprint},
+                )
+            )
+
+        self.record(
+            table_name, len(changed_list), len(rows) - len(changed_list)
+        )
+        return [row_dict[x] for x in changed_list]
+
+    def record(self, table_name: str, written: int, skipped: int) -> None:
+        with self.statistics_lock:
+            statistics = self.statistics.setdefault(
+                table_name, DeltaStatistics()
+            )
+            statistics.written += written
+            statistics.skipped += skipped
+
+    def reset(self, table_name: typing.Optional[str] = None) -> int:
+        """
+        대상 테이블을 비우거나 직접 수정했다면 해시를 지워서 다음 저장 때 모두 다시 저장합니다.
+        """
+        session = self.session_factory()
+        try:
+            query = fingerprint_table.delete()
+            if table_name:
+                query = query.where(
+                    fingerprint_table.c.table_name == table_name
+                )
+            count = session.execute(query).rowcount
+            session.commit()
+        finally:
+            session.close()
+        logger.info("Fingerprint reset", table_name=table_name, count=count)
+        return count
+
+    def summary(self) -> str:
+        with self.statistics_lock:
+            return ", ".join(
+                f"{k} 저장 {v.written} / 건너뜀 {v.skipped}"
+                for k, v in sorted(self.statistics.items())
+            )
@@ -0,0 +1,350 @@
+import functools
+import itertools
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import typing
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import attr
+import structlog
+from nsdi_metrics import MetricsRegistry
+
+from .convert import CONVERTER_ROW, convert_zip_file_timed
+from .exc import NsdiStoreError
+
+logger = structlog.get_logger(__name__)
+
+
+@attr.s(frozen=True)
+class StoreZipJob(object):
+    #: 압축 파일 S3 키
+    key: str = attr.ib()
+    file_name: str = attr.ib()
+    name_type: str = attr.ib()
+    #: 시,도 폴더 이름
+    sido: str = attr.ib()
+    #: 시,군,구 폴더 이름
+    gugun: str = attr.ib()
+    #: base_date_{날짜} 폴더 이름
+    base_date: str = attr.ib()
+    #: 파일 버전 (S3 ETag)
+    etag: str = attr.ib(default="")
+
+    @classmethod
+    def from_key(
+        cls, key: str, name_type: str, etag: str = ""
+    ) -> "StoreZipJob":
+        """
+        .../{name_type}/data/{data_type}/{시도}/{시군구}/base_date_{날짜}/{파일}
+        """
+        split_key = key.split("/")
+        return cls(
+            key=key,
+            file_name=split_key[-1],
+            name_type=name_type,
+            sido=split_key[-4],
+            gugun=split_key[-3].strip(),
+            base_date=split_key[-2],
+            etag=etag,
+        )
+
+    @property
+    def group(self) -> typing.Tuple[str, str]:
+        """
+        같은 PNU 를 포함할 수 있는 파일끼리 묶는 키입니다.
+        시,도 전체 파일과 시,군,구 파일이 겹칠 수 있으므로 시,도 단위로 묶습니다.
+        """
+        return self.name_type, self.sido
+
+    @property
+    def sort_key(self) -> typing.Tuple[str, ...]:
+        return self.name_type, self.sido, self.base_date, self.gugun, self.key
+
+
+class NsdiIngestor(object):
+    """
+    압축 파일 저장을 단계별 워커 풀로 나눠 처리합니다.
+
+        다운로드(스레드 풀) -> 압축 해제 + 컬럼 변환(프로세스 풀) -> DB 저장(스레드 풀)
+
+    각 단계는 다음 단계를 기다리지 않으므로 워커 수를 단계별로 따로 정할 수 있습니다.
+
+    같은 PNU 를 포함할 수 있는 파일(name_type, 시,도)은 한 DB 저장 워커가 base_date 순서로
+    차례로 저장하므로 실행할 때마다 같은 결과가 됩니다. 서로 다른 묶음만 동시에 저장합니다.
+    디스크에 쌓이는 파일 수는 max_inflight 개로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        download: typing.Callable[[str, str], None],
+        write: typing.Callable[[StoreZipJob, str], None],
+        download_workers: int,
+        convert_workers: int,
+        writer_workers: int,
+        max_inflight: int,
+        converter: str = CONVERTER_ROW,
+        on_fail: typing.Optional[
+            typing.Callable[[StoreZipJob, BaseException], None]
+        ] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+    ) -> None:
+        super().__init__()
+        #: download(S3 키, 저장 경로)
+        self.download = download
+        #: write(압축 파일, 변환된 CSV 경로)
+        self.write = write
+        self.download_workers = max(download_workers, 1)
+        self.convert_workers = convert_workers
+        self.writer_workers = max(writer_workers, 1)
+        self.inflight = threading.BoundedSemaphore(max(max_inflight, 1))
+        self.converter = converter
+        #: 다운로드, 변환에 실패한 파일을 알려줍니다 (저장 실패는 write 가 처리합니다)
+        self.on_fail = on_fail
+        #: 변환 워커가 돌려준 압축 해제, 변환 시간을 기록합니다
+        self.metrics = metrics or MetricsRegistry()
+        self.error: typing.Optional[BaseException] = None
+        self.error_lock = threading.Lock()
+
+    def group_jobs(
+        self, job_list: typing.List[StoreZipJob]
+    ) -> typing.List[typing.List[StoreZipJob]]:
+        job_list = sorted(job_list, key=lambda x: x.sort_key)
+        return [
+            list(jobs)
+            for _, jobs in itertools.groupby(job_list, key=lambda x: x.group)
+        ]
+
+    def ingest(self, job_list: typing.List[StoreZipJob]) -> None:
+        group_list = self.group_jobs(job_list)
+        job_list = [x for group in group_list for x in group]
+        logger.info(
+            "Ingest start",
+            file_count=len(job_list),
+            group_count=len(group_list),
+        )
+
+        # 다운로드 작업이 결과를 넣어줄 자리이며 DB 저장 워커는 이 순서대로 기다립니다
+        futures: typing.Dict[StoreZipJob, Future] = {
+            x: Future() for x in job_list
+        }
+        submitted: typing.Set[StoreZipJob] = set()
+
+        convert_executor: typing.Optional[Executor] = None
+        if self.convert_workers > 0:
+            # 다운로드, DB 저장 스레드가 잡고 있는 lock 이 fork 된 프로세스에
+            # 그대로 복사되어 멈출 수 있으므로 spawn 으로 시작합니다
+            convert_executor = ProcessPoolExecutor(
+                self.convert_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        try:
+            with ThreadPoolExecutor(
+                self.download_workers, "ingest-download"
+            ) as download_executor, ThreadPoolExecutor(
+                self.writer_workers, "ingest-writer"
+            ) as writer_executor:
+                writer_futures = [
+                    writer_executor.submit(
+                        self.write_group, group, futures, submitted
+                    )
+                    for group in group_list
+                ]
+                # 저장 순서대로 다운로드를 시작하므로 앞선 파일이 먼저 준비됩니다
+                for job in job_list:
+                    self.inflight.acquire()
+                    if self.error is not None:
+                        self.inflight.release()
+                        break
+                    submitted.add(job)
+                    download_executor.submit(
+                        self.prepare, job, futures[job], convert_executor
+                    )
+
+                for job in job_list:
+                    if job not in submitted:
+                        futures[job].set_exception(
+                            NsdiStoreError("ingest cancelled")
+                        )
+                for future in writer_futures:
+                    future.result()
+        finally:
+            if convert_executor is not None:
+                convert_executor.shutdown()
+
+        if self.error is not None:
+            raise self.error
+
+        logger.info("Ingest finish", file_count=len(job_list))
+
+    def stream(
+        self,
+        job_list: typing.List[StoreZipJob],
+        write_stream: typing.Callable[[StoreZipJob], None],
+    ) -> None:
+        """
+        다운로드, 변환 단계 없이 DB 저장 워커가 S3 응답을 바로 읽어 저장합니다.
+        저장 순서는 ingest 와 같습니다.
+        """
+        group_list = self.group_jobs(job_list)
+        logger.info(
+            "Stream ingest start",
+            file_count=len(job_list),
+            group_count=len(group_list),
+        )
+
+        with ThreadPoolExecutor(
+            self.writer_workers, "ingest-stream"
+        ) as writer_executor:
+            writer_futures = [
+                writer_executor.submit(self.stream_group, group, write_stream)
+                for group in group_list
+            ]
+            for future in writer_futures:
+                future.result()
+
+        if self.error is not None:
+            raise self.error
+
+        logger.info("Stream ingest finish", file_count=len(job_list))
+
+    def stream_group(
+        self,
+        group: typing.List[StoreZipJob],
+        write_stream: typing.Callable[[StoreZipJob], None],
+    ) -> None:
+        for job in group:
+            if self.error is not None:
+                return
+            try:
+                write_stream(job)
+            except BaseException as e:
+                self.fail(e)
+                return
+
+    def prepare(
+        self,
+        job: StoreZipJob,
+        future: Future,
+        convert_executor: typing.Optional[Executor],
+    ) -> None:
+        """
+        압축 파일을 받아 변환하고 future 에 (임시 폴더, 변환된 CSV 경로) 를 넣어줍니다.
+        변환 워커 풀이 있으면 변환을 넘긴 후 바로 돌아가므로 다운로드 워커는 변환을
+        기다리지 않고 다음 파일을 받습니다.
+        """
+        if self.error is not None:
+            future.set_exception(NsdiStoreError("ingest cancelled"))
+            return
+
+        folder_path = tempfile.mkdtemp() + "/"
+        try:
+            zip_path = folder_path + job.file_name
+            logger.info("S3 ZIP DOWNLOAD", file_name=job.file_name)
+            self.download(job.key, zip_path)
+
+            args = (
+                zip_path,
+                folder_path,
+                job.file_name,
+                job.name_type,
+                self.converter,
+            )
+            if convert_executor is None:
+                result = convert_zip_file_timed(*args)
+            else:
+                convert_executor.submit(
+                    convert_zip_file_timed, *args
+                ).add_done_callback(
+                    functools.partial(
+                        self.converted, job, future, folder_path
+                    )
+                )
+                return
+        except BaseException as e:
+            self.prepare_failed(job, future, folder_path, e)
+        else:
+            self.prepared(future, folder_path, result)
+
+    def converted(
+        self,
+        job: StoreZipJob,
+        future: Future,
+        folder_path: str,
+        convert_future: Future,
+    ) -> None:
+        """
+        변환 워커 풀의 결과를 future 에 넘겨줍니다. (변환 워커 풀 스레드에서 실행됩니다)
+        """
+        try:
+            result = convert_future.result()
+        except BaseException as e:
+            self.prepare_failed(job, future, folder_path, e)
+        else:
+            self.prepared(future, folder_path, result)
+
+    def prepared(
+        self,
+        future: Future,
+        folder_path: str,
+        result: typing.Tuple[str, typing.Dict[str, float]],
+    ) -> None:
+        csv_path, seconds_dict = result
+        for name, seconds in seconds_dict.items():
+            self.metrics.observe(name, seconds)
+        future.set_result((folder_path, csv_path))
+
+    def prepare_failed(
+        self,
+        job: StoreZipJob,
+        future: Future,
+        folder_path: str,
+        error: BaseException,
+    ) -> None:
+        shutil.rmtree(folder_path, ignore_errors=True)
+        self.fail(error)
+        future.set_exception(error)
+        if self.on_fail is not None:
+            try:
+                self.on_fail(job, error)
+            except Exception:
+                logger.exception("Ingest on_fail error", key=job.key)
+
+    def write_group(
+        self,
+        group: typing.List[StoreZipJob],
+        futures: typing.Dict[StoreZipJob, Future],
+        submitted: typing.Set[StoreZipJob],
+    ) -> None:
+        """
+        묶음 안의 파일을 순서대로 저장합니다.
+        다른 워커가 실패하면 남은 파일은 저장하지 않고 임시 폴더만 정리합니다.
+        """
+        for job in group:
+            try:
+                folder_path, csv_path = futures[job].result()
+            except BaseException:
+                if job in submitted:
+                    self.inflight.release()
+                continue
+
+            try:
+                if self.error is None:
+                    self.write(job, csv_path)
+            except BaseException as e:
+                self.fail(e)
+            finally:
+                shutil.rmtree(folder_path, ignore_errors=True)
+                self.inflight.release()
+
+    def fail(self, error: BaseException) -> None:
+        with self.error_lock:
+            if self.error is None:
+                self.error = error
@@ -0,0 +1,124 @@
+"""
+압축 파일별 저장 기록(ledger)을 남겨서 다시 실행할 때 이미 저장한 파일은 건너뜁니다.
+
+(S3 키, ETag) 가 같은 파일이 done 이면 건너뛰고 running(중간에 멈춤), failed 는 다시 저장합니다.
+"""
+import typing
+
+import sqlalchemy as sa
+import structlog
+from sqlalchemy import orm
+from sqlalchemy.dialects.postgresql import insert
+
+from .ingest import StoreZipJob
+from .schema import ledger_table
+
+logger = structlog.get_logger(__name__)
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class NsdiIngestionLedger(object):
+    def __init__(self, session_factory: orm.sessionmaker) -> None:
+        super().__init__()
+        self.session_factory = session_factory
+
+    def create_table(self) -> None:
+        session = self.session_factory()
+        try:
+            ledger_table.create(session.get_bind(), checkfirst=True)
+        finally:
+            session.close()
+
+    def is_done(self, job: StoreZipJob) -> bool:
+        session = self.session_factory()
+        try:
+            status = session.execute(
+                sa.select([ledger_table.c.status]).where(
+                    sa.and_(
+                        ledger_table.c.key == job.key,
+                        ledger_table.c.etag == job.etag,
+                    )
+                )
+            ).scalar()
+        finally:
+            session.close()
+        return status == STATUS_DONE
+
+    def begin(self, job: StoreZipJob) -> None:
+        self.save(job, status=STATUS_RUNNING, row_count=None, duration=None)
+
+    def finish(
+        self, job: StoreZipJob, row_count: int, duration: float
+    ) -> None:
+        self.save(
+            job, status=STATUS_DONE, row_count=row_count, duration=duration
+        )
+        logger.info(
+            "Ledger done",
+            key=job.key,
+            row_count=row_count,
+            duration=round(duration, 3),
+        )
+
+    def fail(
+        self,
+        job: StoreZipJob,
+        error: str,
+        duration: typing.Optional[float] = None,
+    ) -> None:
+        self.save(
+            job,
+            status=STATUS_FAILED,
+            row_count=None,
+            duration=duration,
+            error=error,
+        )
+
+    def save(
+        self,
+        job: StoreZipJob,
+        status: str,
+        row_count: typing.Optional[int],
+        duration: typing.Optional[float],
+        error: typing.Optional[str] = None,
+    ) -> None:
+        values = {
+            "name_type": job.name_type,
+            "status": status,
+            "row_count": row_count,
+            "duration": duration,
+            "error": error,
+            "updated_at": sa.func.now(),
+        }
+        stmt = insert(ledger_table).values(
+            key=job.key, etag=job.etag, **values
+        )
+        session = self.session_factory()
+        try:
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["key", "etag"], set_=values
+                )
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    def reset(self, key_prefix: typing.Optional[str] = None) -> int:
+        """
+        기록을 지워서 다음 실행 때 해당 파일을 다시 저장합니다.
+        """
+        session = self.session_factory()
+        try:
+            query = ledger_table.delete()
+            if key_prefix:
+                query = query.where(ledger_table.c.key.startswith(key_prefix))
+            count = session.execute(query).rowcount
+            session.commit()
+        finally:
+            session.close()
+        logger.info("Ledger reset", key_prefix=key_prefix, count=count)
+        return count
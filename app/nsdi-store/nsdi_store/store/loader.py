@@ -0,0 +1,242 @@
+import csv
+import typing
+
+import sqlalchemy as sa
+import structlog
+from nsdi_metrics import MetricsRegistry
+from sqlalchemy import orm
+
+from .delta import NsdiDeltaFilter, sql_fingerprint
+from .exc import NsdiStoreError
+
+logger = structlog.get_logger(__name__)
+
+
+def copy_options(table: sa.Table, column_list: typing.List[str]) -> str:
+    """
+    upsert 경로(DictReader)와 같이 빈 문자 컬럼은 ''로, 빈 숫자/날짜 컬럼은 NULL 로 넣습니다.
+    """
+    text_list = [
+        x for x in column_list if isinstance(table.c[x].type, sa.String)
+    ]
+    other_list = [x for x in column_list if x not in text_list]
+    option_list = ["FORMAT csv"]
+    if text_list:
+        option_list.append(f"FORCE_NOT_NULL ({', '.join(text_list)})")
+    if other_list:
+        option_list.append(f"FORCE_NULL ({', '.join(other_list)})")
+    return ", ".join(option_list)
+
+
+class NsdiCopyLoader(object):
+    """
+    변환된 CSV 를 PostgreSQL COPY 로 임시 테이블에 넣은 후
+    INSERT ... ON CONFLICT (pnu) DO UPDATE 한 번으로 대상 테이블에 반영합니다.
+    파일 하나를 한 트랜잭션으로 처리하므로 실패하면 그 파일은 반영되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: orm.sessionmaker,
+        conflict_column: str = "pnu",
+        delta_filter: typing.Optional[NsdiDeltaFilter] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+    ) -> None:
+        super().__init__()
+        self.session_factory = session_factory
+        self.conflict_column = conflict_column
+        #: 있으면 해시가 바뀐 행만 반영합니다
+        self.delta_filter = delta_filter
+        #: COPY(db_copy), 반영(db_merge) 시간과 행 수를 기록합니다
+        #: STREAM_ZIP 이면 COPY 시간에 S3 읽기, 변환 시간이 포함됩니다
+        self.metrics = metrics or MetricsRegistry()
+
+    def load_csv(
+        self,
+        file_path: str,
+        table: sa.Table,
+        target_name: typing.Optional[str] = None,
+    ) -> int:
+        with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+            return self.load(f, table, target_name)
+
+    def read_columns(
+        self, csv_file: typing.IO[str], table: sa.Table
+    ) -> typing.List[str]:
+        column_list = next(csv.reader([csv_file.readline()]))
+        unknown_column_list = [x for x in column_list if x not in table.c]
+        if unknown_column_list:
+            raise NsdiStoreError(
+                f"unknown column {unknown_column_list} in {table.name}"
+            )
+        return column_list
+
+    def load(
+        self,
+        csv_file: typing.IO[str],
+        table: sa.Table,
+        target_name: typing.Optional[str] = None,
+    ) -> int:
+        """
+        첫 줄이 컬럼명인 CSV 를 반영하고 읽은 행 수를 반환합니다.
+        target_name 이 있으면 table 대신 그 테이블(시,도 파티션)에 반영합니다.
+        """
+        column_list = self.read_columns(csv_file, table)
+
+        staging_name = f"staging_{table.name}"
+        columns = ", ".join(column_list)
+        session = self.session_factory()
+        try:
+            cursor = session.connection().connection.cursor()
+            # 제약 조건 없이 컬럼 타입만 같은 임시 테이블을 만듭니다
+            cursor.execute(
+                f"CREATE TEMP TABLE {staging_name} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table.name} WITH NO DATA"
+            )
+            with self.metrics.timer("db_copy"):
+                cursor.copy_expert(
+                    f"COPY {staging_name} ({columns}) FROM STDIN WITH "
+                    f"({copy_options(table, column_list)})",
+                    csv_file,
+                )
+            copy_count = cursor.rowcount
+
+            with self.metrics.timer("db_merge"):
+                if self.delta_filter is not None:
+                    source_name = self.create_changed_table(
+                        cursor, table, column_list, staging_name
+                    )
+                else:
+                    source_name = staging_name
+                cursor.execute(
+                    self.merge_query(
+                        table, column_list, source_name, target_name
+                    )
+                )
+                merge_count = cursor.rowcount
+            if self.delta_filter is not None:
+                cursor.execute(
+                    "INSERT INTO nsdi_store_fingerprint "
+                    "(table_name, pnu, fingerprint) "
+                    "SELECT %(table_name)s, pnu, fingerprint "
+                    f"FROM {source_name} "
+                    "ON CONFLICT (table_name, pnu) DO UPDATE "
+                    "SET fingerprint = EXCLUDED.fingerprint",
+                    {"table_name": table.name},
+                )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Copy {target_name or table.name} error")
+        finally:
+            session.close()
+
+        self.metrics.increment("db_copy_rows", copy_count)
+        self.metrics.increment("db_merge_rows", merge_count)
+        if self.delta_filter is not None:
+            self.delta_filter.record(
+                table.name, merge_count, copy_count - merge_count
+            )
+        logger.info(
+            "Copy load finish",
+            table=target_name or table.name,
+            copy_count=copy_count,
+            merge_count=merge_count,
+        )
+        return copy_count
+
+    def append_csv(
+        self, file_path: str, table: sa.Table, target_name: str
+    ) -> int:
+        with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+            return self.append(f, table, target_name)
+
+    def append(
+        self, csv_file: typing.IO[str], table: sa.Table, target_name: str
+    ) -> int:
+        """
+        임시 테이블, 중복 처리 없이 target_name 테이블에 바로 COPY 합니다.
+        전체 교체(FULL_RELOAD)에서 인덱스 없는 shadow 테이블에 넣을 때 사용합니다.
+        """
+        column_list = self.read_columns(csv_file, table)
+        columns = ", ".join(column_list)
+        session = self.session_factory()
+        try:
+            cursor = session.connection().connection.cursor()
+            with self.metrics.timer("db_copy"):
+                cursor.copy_expert(
+                    f"COPY {target_name} ({columns}) FROM STDIN WITH "
+                    f"({copy_options(table, column_list)})",
+                    csv_file,
+                )
+            copy_count = cursor.rowcount
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Copy {target_name} error")
+        finally:
+            session.close()
+
+        self.metrics.increment("db_copy_rows", copy_count)
+        logger.info(
+            "Copy append finish", table=target_name, copy_count=copy_count
+        )
+        return copy_count
+
+    def create_changed_table(
+        self,
+        cursor: typing.Any,
+        table: sa.Table,
+        column_list: typing.List[str],
+        staging_name: str,
+    ) -> str:
+        """
+        pnu 별 마지막 행 중 저장된 해시와 다른 행만 모은 임시 테이블을 만듭니다.
+        """
+        changed_name = f"changed_{table.name}"
+        columns = ", ".join(column_list)
+        fingerprint = sql_fingerprint(sorted(column_list), "s")
+        cursor.execute(
+            f"CREATE TEMP TABLE {changed_name} ON COMMIT DROP AS "
+            f"SELECT * FROM ("
+            f"SELECT DISTINCT ON ({self.conflict_column}) {columns}, "
+            f"{fingerprint} AS fingerprint "
+            f"FROM {staging_name} s "
+            f"ORDER BY {self.conflict_column}, ctid DESC"
+            f") src WHERE NOT EXISTS ("
+            f"SELECT 1 FROM nsdi_store_fingerprint f "
+            f"WHERE f.table_name = %(table_name)s "
+            f"AND f.pnu = src.{self.conflict_column} "
+            f"AND f.fingerprint = src.fingerprint)",
+            {"table_name": table.name},
+        )
+        return changed_name
+
+    def merge_query(
+        self,
+        table: sa.Table,
+        column_list: typing.List[str],
+        staging_name: str,
+        target_name: typing.Optional[str] = None,
+    ) -> str:
+        """
+        한 문장에서 같은 pnu 를 두 번 갱신할 수 없으므로 pnu 별로 파일에서 마지막 행만 반영합니다.
+        (기존 10,000줄 단위 upsert 에서도 뒤의 행이 앞의 행을 덮어씁니다)
+        """
+        columns = ", ".join(column_list)
+        update_list = [
+            f"{x} = EXCLUDED.{x}"
+            for x in column_list
+            if x != self.conflict_column
+        ]
+        if "updated_at" in table.c and "updated_at" not in column_list:
+            update_list.append("updated_at = now()")
+
+        return (
+            f"INSERT INTO {target_name or table.name} ({columns}) "
+            f"SELECT DISTINCT ON ({self.conflict_column}) {columns} "
+            f"FROM {staging_name} "
+            f"ORDER BY {self.conflict_column}, ctid DESC "
+            f"ON CONFLICT ({self.conflict_column}) DO UPDATE SET "
+            + ", ".join(update_list)
+        )
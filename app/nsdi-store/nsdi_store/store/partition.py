@@ -0,0 +1,266 @@
+"""
+토지이용계획정보, 토지특성정보 테이블을 시,도 코드(PNU 앞 2자리) 범위로 파티션합니다.
+
+    {테이블}              PARTITION BY RANGE (pnu)
+      {테이블}_p11        FOR VALUES FROM ('11') TO ('12')  서울특별시
+      {테이블}_p26        FOR VALUES FROM ('26') TO ('27')  부산광역시
+      ...
+      {테이블}_pdefault   DEFAULT
+
+시,도 폴더의 파일은 그 시,도 파티션에만 저장되므로 시,도 단위로 나뉜 저장 워커가
+서로 다른 파티션(테이블, 인덱스)에 쓰게 됩니다.
+PARTITION_RELOAD 가 ON 이면 시,도 파티션을 upsert 하지 않고 새 테이블에 넣은 후
+DETACH / ATTACH 로 교체합니다. 이번에 받지 않은 시,군,구 행은 기존 파티션에서 가져오며
+이전 파티션은 {파티션}_old 로 남겨두므로 rollback 할 수 있습니다.
+
+파티션 테이블의 기본 키, 유니크 제약 조건에는 파티션 컬럼이 있어야 하므로
+create 로 바꾸면 기본 키 (id) 는 (id, pnu) 가 됩니다.
+"""
+import typing
+
+import sqlalchemy as sa
+import structlog
+from sqlalchemy import orm
+
+from .exc import NsdiStoreError
+from .swap import NsdiShadowSwap
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_COLUMN = "pnu"
+PARTITION_SUFFIX = "_partitioned"
+DEFAULT_PARTITION = "default"
+
+#: 시,도 폴더 이름 -> 법정동 시,도 코드
+SIDO_CODE_DICT = {
+    "서울특별시": "11",
+    "부산광역시": "26",
+    "대구광역시": "27",
+    "인천광역시": "28",
+    "광주광역시": "29",
+    "대전광역시": "30",
+    "울산광역시": "31",
+    "세종특별자치시": "36",
+    "경기도": "41",
+    "강원도": "42",
+    "충청북도": "43",
+    "충청남도": "44",
+    "전라북도": "45",
+    "전라남도": "46",
+    "경상북도": "47",
+    "경상남도": "48",
+    "제주특별자치도": "50",
+    "강원특별자치도": "51",
+    "전북특별자치도": "52",
+}
+
+
+def sido_code(sido: str) -> typing.Optional[str]:
+    return SIDO_CODE_DICT.get(sido.strip())
+
+
+def partition_name(table_name: str, code: str) -> str:
+    return f"{table_name}_p{code}"
+
+
+def partition_bound(code: str) -> typing.Tuple[str, str]:
+    """
+    PNU 는 19자리 문자열이므로 '11' 이상 '12' 미만이 시,도 코드 11 입니다.
+    """
+    return code, f"{int(code) + 1:02}"
+
+
+class NsdiPartitioner(object):
+    def __init__(self, session_factory: orm.sessionmaker) -> None:
+        super().__init__()
+        self.session_factory = session_factory
+        self.shadow_swap = NsdiShadowSwap(session_factory)
+
+    def is_partitioned(self, table_name: str) -> bool:
+        session = self.session_factory()
+        try:
+            return bool(
+                session.execute(
+                    sa.text(
+                        "SELECT count(*) FROM pg_partitioned_table "
+                        "WHERE partrelid = to_regclass(:name)"
+                    ),
+                    {"name": table_name},
+                ).scalar()
+            )
+        finally:
+            session.close()
+
+    def create(self, table: sa.Table) -> None:
+        """
+        운영 테이블을 같은 컬럼의 시,도 파티션 테이블로 바꿉니다.
+        행을 모두 옮긴 후 이름을 바꾸므로 store 가 실행 중이 아닐 때 사용합니다.
+        이전 테이블은 {테이블}_old 로 남기며 rollback_swap 으로 되돌릴 수 있습니다.
+        """
+        table_name = table.name
+        if self.is_partitioned(table_name):
+            raise NsdiStoreError(f"{table_name} is already partitioned")
+
+        new_name = table_name + PARTITION_SUFFIX
+        old_name = self.shadow_swap.old_name(table_name)
+        columns = ", ".join(x.name for x in table.columns)
+
+        sql_list = [
+            f"DROP TABLE IF EXISTS {new_name}",
+            f"CREATE TABLE {new_name} (LIKE {table_name} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({PARTITION_COLUMN})",
+        ]
+        for code in sorted(set(SIDO_CODE_DICT.values())):
+            lower, upper = partition_bound(code)
+            sql_list.append(
+                f"CREATE TABLE {partition_name(table_name, code)} "
+                f"PARTITION OF {new_name} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        # 시,도 코드가 아닌 PNU 도 저장할 수 있도록 남겨둡니다
+        sql_list += [
+            f"CREATE TABLE {partition_name(table_name, DEFAULT_PARTITION)} "
+            f"PARTITION OF {new_name} DEFAULT",
+            f"INSERT INTO {new_name} ({columns}) "
+            f"SELECT {columns} FROM {table_name}",
+        ]
+        logger.info("Partition table create start", table=new_name)
+        self.shadow_swap.execute(sql_list)
+        self.shadow_swap.create_indexes(
+            table_name, new_name, partition_column=PARTITION_COLUMN
+        )
+        self.shadow_swap.execute([f"ANALYZE {new_name}"])
+
+        session = self.session_factory()
+        try:
+            session.execute(
+                sa.text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE")
+            )
+            session.execute(sa.text(f"DROP TABLE IF EXISTS {old_name}"))
+            self.shadow_swap.rename_table(
+                session, table_name, table_name, old_name
+            )
+            self.shadow_swap.rename_table(
+                session, table_name, new_name, table_name
+            )
+            self.shadow_swap.move_sequences(session, table, old_name)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Partition {table_name} error")
+        finally:
+            session.close()
+        logger.info("Partition table created", table=table_name, old=old_name)
+
+    def shadow_name(self, table_name: str, code: str) -> str:
+        return self.shadow_swap.shadow_name(partition_name(table_name, code))
+
+    def prepare(self, table_name: str, code: str) -> None:
+        """
+        파티션과 컬럼만 같은 {파티션}_shadow 를 새로 만듭니다.
+        """
+        self.shadow_swap.prepare(partition_name(table_name, code))
+
+    def drop_shadow(self, table_name: str, code: str) -> None:
+        self.shadow_swap.drop_shadow(partition_name(table_name, code))
+
+    def finalize(self, table: sa.Table, code: str) -> None:
+        """
+        이번에 받지 않은 시,군,구 행을 기존 파티션에서 가져오고
+        shadow 의 중복을 지운 후 파티션과 같은 인덱스를 만듭니다.
+        파티션 범위 CHECK 제약 조건을 미리 만들어 ATTACH 할 때 다시 검사하지 않게 합니다.
+        파티션마다 다른 연결을 쓰므로 여러 파티션을 동시에 실행할 수 있습니다.
+        """
+        name = partition_name(table.name, code)
+        shadow_name = self.shadow_swap.shadow_name(name)
+        lower, upper = partition_bound(code)
+
+        self.shadow_swap.finalize(table, name, shadow_name)
+        self.shadow_swap.execute(
+            [
+                f"ALTER TABLE {shadow_name} ADD CONSTRAINT {name}_bound "
+                f"CHECK ({PARTITION_COLUMN} IS NOT NULL "
+                f"AND {PARTITION_COLUMN} >= '{lower}' "
+                f"AND {PARTITION_COLUMN} < '{upper}')"
+            ]
+        )
+
+    def attach(self, table: sa.Table, code: str) -> None:
+        """
+        한 트랜잭션에서 기존 파티션을 DETACH 하고 shadow 를 ATTACH 합니다.
+        """
+        table_name = table.name
+        name = partition_name(table_name, code)
+        shadow_name = self.shadow_swap.shadow_name(name)
+        old_name = self.shadow_swap.old_name(name)
+
+        session = self.session_factory()
+        try:
+            session.execute(
+                sa.text(f"ALTER TABLE {table_name} DETACH PARTITION {name}")
+            )
+            session.execute(sa.text(f"DROP TABLE IF EXISTS {old_name}"))
+            self.shadow_swap.rename_table(session, name, name, old_name)
+            self.shadow_swap.rename_table(session, name, shadow_name, name)
+            self.attach_partition(session, table_name, code)
+            session.execute(
+                sa.text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bound")
+            )
+            self.shadow_swap.clear_fingerprint(session, table_name, code)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Attach {name} error")
+        finally:
+            session.close()
+        logger.info("Partition swapped", partition=name, old=old_name)
+
+    def replace(self, table: sa.Table, code: str) -> None:
+        self.finalize(table, code)
+        self.attach(table, code)
+
+    def rollback(self, table: sa.Table, code: str) -> None:
+        """
+        파티션과 {파티션}_old 를 서로 바꿉니다. 한 번 더 실행하면 다시 원래대로 돌아갑니다.
+        """
+        table_name = table.name
+        name = partition_name(table_name, code)
+        old_name = self.shadow_swap.old_name(name)
+        temp_name = name + "_rollback"
+
+        session = self.session_factory()
+        try:
+            if not session.execute(
+                sa.text("SELECT to_regclass(:name)"), {"name": old_name}
+            ).scalar():
+                raise NsdiStoreError(f"not found {old_name}")
+            session.execute(
+                sa.text(f"ALTER TABLE {table_name} DETACH PARTITION {name}")
+            )
+            self.shadow_swap.rename_table(session, name, name, temp_name)
+            self.shadow_swap.rename_table(session, name, old_name, name)
+            self.shadow_swap.rename_table(session, name, temp_name, old_name)
+            self.attach_partition(session, table_name, code)
+            self.shadow_swap.clear_fingerprint(session, table_name, code)
+            session.commit()
+        except NsdiStoreError:
+            session.rollback()
+            raise
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Rollback {name} error")
+        finally:
+            session.close()
+        logger.info("Partition rolled back", partition=name, old=old_name)
+
+    def attach_partition(
+        self, session: orm.Session, table_name: str, code: str
+    ) -> None:
+        lower, upper = partition_bound(code)
+        session.execute(
+            sa.text(
+                f"ALTER TABLE {table_name} ATTACH PARTITION "
+                f"{partition_name(table_name, code)} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
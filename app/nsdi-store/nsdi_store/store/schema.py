@@ -0,0 +1,44 @@
+"""
+schema
+======
+
+loan-model 에 없는 nsdi-store 전용 테이블입니다.
+저장을 시작할 때 없으면 만듭니다.
+"""
+import sqlalchemy as sa
+
+metadata = sa.MetaData()
+
+#: DELTA_SKIP 에서 쓰는 (테이블 이름, PNU) 별 행 내용 해시
+fingerprint_table = sa.Table(
+    "nsdi_store_fingerprint",
+    metadata,
+    sa.Column("table_name", sa.String(64), primary_key=True),
+    sa.Column("pnu", sa.String(19), primary_key=True),
+    #: md5 앞 8바이트
+    sa.Column("fingerprint", sa.BigInteger, nullable=False),
+)
+
+#: LEDGER 에서 쓰는 압축 파일별 저장 기록
+ledger_table = sa.Table(
+    "nsdi_store_ledger",
+    metadata,
+    #: 압축 파일 S3 키
+    sa.Column("key", sa.Text, primary_key=True),
+    #: S3 ETag (manifest 로 받은 파일도 S3 목록의 ETag)
+    sa.Column("etag", sa.String(128), primary_key=True),
+    sa.Column("name_type", sa.String(32), nullable=False),
+    #: running, done, failed
+    sa.Column("status", sa.String(16), nullable=False),
+    #: 파일에서 읽은 행 수
+    sa.Column("row_count", sa.Integer),
+    #: 저장에 걸린 시간 (초)
+    sa.Column("duration", sa.Float),
+    sa.Column("error", sa.Text),
+    sa.Column(
+        "updated_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    ),
+)
@@ -1,22 +1,44 @@
+import json
+import os
 import re
 import tempfile
+import threading
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from csv import DictReader
+
+import attr
+import botocore.exceptions
 import structlog
 from crawler.utils.csv import read_csv
 from crawler.aws_client import S3Client
-from crawler.utils.converter import convert_land_csv
-from crawler.utils.download import extract_zip_file
 from loan_model.models.nsdi.nsdi_land_feature import NsdiLandFeature
 from loan_model.models.nsdi.nsdi_land_use import NsdiLandUse
+from nsdi_metrics import UNIT_BYTES, MetricsRegistry
 from tanker.slack import SlackClient
 from tanker.utils.datetime import tzfromtimestamp
 
 from nsdi_store.db import create_session_factory
+from .columnar import is_available as is_columnar_available
+from .convert import (
+    CONVERTER_ARROW,
+    CONVERTER_ROW,
+    convert_csv_file,
+    convert_zip_file_timed,
+)
 from .data import (
-    NSDI_FEATURE_DICT,
-    NSDI_USE_DICT,
+    CRAWLER_LOG_FORMAT_VERSION,
+    CrawlerLogPointer,
+    CrawlerManifestEntry,
 )
+from .delta import NsdiDeltaFilter
+from .ingest import NsdiIngestor, StoreZipJob
+from .ledger import NsdiIngestionLedger
+from .loader import NsdiCopyLoader
+from .partition import NsdiPartitioner, partition_name, sido_code
+from .swap import NsdiShadowSwap
+from .stream import CsvRowStream, iter_converted_dicts, iter_converted_rows
 from .exc import (
     NsdiStoreError,
     NsdiStoreS3NotFound,
@@ -25,11 +47,24 @@ from .exc import (
 
 logger = structlog.get_logger(__name__)
 
+NsdiLandModel = typing.Type[typing.Union[NsdiLandUse, NsdiLandFeature]]
+
+NAME_TYPE_MODEL_DICT: typing.Dict[str, NsdiLandModel] = {
+    "토지이용계획정보": NsdiLandUse,
+    "토지특성정보": NsdiLandFeature,
+}
+
 
 class NsdiStore(object):
-    def __init__(self, config: typing.Dict[str, typing.Any]) -> None:
+    def __init__(
+        self,
+        config: typing.Dict[str, typing.Any],
+        metrics: typing.Optional[MetricsRegistry] = None,
+    ) -> None:
         super().__init__()
         self.config = config
+        #: 단계별 소요 시간, 처리량 (run_scheduler 가 CloudWatch 로 보냅니다)
+        self.metrics = metrics or MetricsRegistry()
         self.session_factory = create_session_factory(config)
         self.s3_client = S3Client(config)
         self.slack_client = SlackClient(
@@ -37,6 +72,57 @@ class NsdiStore(object):
         )
         self.region_level_1 = self.config["REGION_REGEX_LEVEL_1"]
         self.region_level_2 = self.config["REGION_REGEX_LEVEL_2"]
+        self.ingest_parallel = config.get("INGEST_PARALLEL") == "ON"
+        self.zip_job_list: typing.List[StoreZipJob] = []
+        self.loader = config.get("LOADER") or "upsert"
+        self.delta_filter: typing.Optional[NsdiDeltaFilter] = None
+        if config.get("DELTA_SKIP") == "ON":
+            self.delta_filter = NsdiDeltaFilter(self.session_factory)
+            self.delta_filter.create_table()
+        self.copy_loader = NsdiCopyLoader(
+            self.session_factory,
+            delta_filter=self.delta_filter,
+            metrics=self.metrics,
+        )
+        self.ledger: typing.Optional[NsdiIngestionLedger] = None
+        if config.get("LEDGER") == "ON":
+            self.ledger = NsdiIngestionLedger(self.session_factory)
+            self.ledger.create_table()
+        self.ledger_skip_count = 0
+        #: 이번 실행에서 파일에서 읽어 저장한 행 수
+        self.stored_row_count = 0
+        self.stored_row_lock = threading.Lock()
+        self.shadow_swap: typing.Optional[NsdiShadowSwap] = None
+        if config.get("FULL_RELOAD") == "ON":
+            self.shadow_swap = NsdiShadowSwap(self.session_factory)
+        #: 테이블별 shadow 테이블에 넣은 행 수
+        self.shadow_row_count: typing.Dict[str, int] = {}
+        self.shadow_lock = threading.Lock()
+        self.partition_reload = config.get("PARTITION_RELOAD") == "ON"
+        if self.partition_reload and self.shadow_swap is not None:
+            raise NsdiStoreError(
+                "FULL_RELOAD and PARTITION_RELOAD cannot be used together"
+            )
+        self.partitioner = NsdiPartitioner(self.session_factory)
+        #: 시,도 파티션으로 나눈 테이블
+        self.partitioned_table_set: typing.Set[str] = set()
+        if self.loader == "copy" or self.partition_reload:
+            self.partitioned_table_set = {
+                x.__tablename__
+                for x in NAME_TYPE_MODEL_DICT.values()
+                if self.partitioner.is_partitioned(x.__tablename__)
+            }
+        #: (테이블, 시,도 코드)별 shadow 파티션에 넣은 행 수
+        self.partition_row_count: typing.Dict[typing.Tuple[str, str], int] = {}
+        self.batch_size = int(config.get("BATCH_SIZE") or 10000)
+        self.commit_every = int(config.get("COMMIT_EVERY") or 1)
+        self.stream_zip = config.get("STREAM_ZIP") == "ON"
+        self.converter = config.get("CONVERTER") or CONVERTER_ROW
+        if self.converter == CONVERTER_ARROW and not is_columnar_available():
+            raise NsdiStoreError(
+                "CONVERTER=arrow requires pyarrow "
+                "(install with 'poetry install -E arrow')"
+            )
 
     def run(self, run_by: str) -> None:
 
@@ -47,37 +133,272 @@ class NsdiStore(object):
         crawler_log_id = self.config["CRAWLER_LOG_ID"]
 
         if crawler_log_id:
-            self.fetch_received_log_folder()  # 수동 log id 폴더 저장
+            log_id_prefix = self.fetch_received_log_prefix()  # 수동 log id 폴더
+        else:
+            log_id_prefix = self.fetch_latest_log_prefix()  # 최신 log id 폴더
+
+        if self.shadow_swap is not None:
+            for model in NAME_TYPE_MODEL_DICT.values():
+                self.shadow_swap.prepare(model.__tablename__)
+
+        manifest = self.fetch_manifest(log_id_prefix)
+        if manifest is not None:
+            self.store_manifest(manifest, log_id_prefix)
         else:
-            self.fetch_latest_log_folder()  # 최신 log id 폴더 저장
+            logger.info("Manifest not found", log_id_prefix=log_id_prefix)
+            self.fetch_name_type_folder(log_id_prefix)
 
+        if self.zip_job_list:
+            self.store_zip_jobs(self.zip_job_list)
+            self.zip_job_list.clear()
+
+        if self.shadow_swap is not None:
+            self.swap_shadow_tables()
+        if self.partition_reload:
+            self.replace_partitions()
+
+        if self.ledger_skip_count:
+            self.slack_client.send_info_slack(
+                f"Store 이미 저장한 파일 {self.ledger_skip_count}개를 건너뛰었습니다."
+            )
+        if self.delta_filter is not None:
+            self.slack_client.send_info_slack(
+                f"Store 변경분 저장 결과 : {self.delta_filter.summary()}"
+            )
+
+        logger.info("Store metrics", **self.metrics.summary())
         self.slack_client.send_info_slack(
             f"Store 종료합니다. ({self.config['ENVIRONMENT']}, {run_by})"
         )
 
-    def fetch_received_log_folder(self) -> None:
+    def swap_shadow_tables(self) -> None:
+        """
+        FULL_RELOAD 에서 모든 파일을 저장한 후 행이 들어간 shadow 테이블만 교체합니다.
+        """
+        assert self.shadow_swap is not None
+        for model in NAME_TYPE_MODEL_DICT.values():
+            table_name = model.__tablename__
+            row_count = self.shadow_row_count.get(table_name, 0)
+            if not row_count:
+                self.shadow_swap.drop_shadow(table_name)
+                continue
+            self.shadow_swap.swap(model.__table__)
+            self.slack_client.send_info_slack(
+                f"Store {table_name} 전체 교체 완료 ({row_count}행, "
+                f"이전 테이블 {self.shadow_swap.old_name(table_name)})"
+            )
+
+    def replace_partitions(self) -> None:
+        """
+        PARTITION_RELOAD 에서 모든 파일을 저장한 후 행이 들어간 시,도 파티션만 교체합니다.
+        인덱스 생성은 파티션별로 동시에 실행하고 DETACH / ATTACH 는 차례로 실행합니다.
+        """
+        table_dict = {
+            x.__tablename__: x.__table__ for x in NAME_TYPE_MODEL_DICT.values()
+        }
+        key_list = []
+        for key, row_count in sorted(self.partition_row_count.items()):
+            if row_count:
+                key_list.append(key)
+            else:
+                self.partitioner.drop_shadow(*key)
+        if not key_list:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=int(self.config.get("INGEST_WRITER_WORKERS") or 2)
+        ) as executor:
+            future_list = [
+                executor.submit(
+                    self.partitioner.finalize, table_dict[table_name], code
+                )
+                for table_name, code in key_list
+            ]
+            for future in future_list:
+                future.result()
+        for table_name, code in key_list:
+            self.partitioner.attach(table_dict[table_name], code)
+
+        self.slack_client.send_info_slack(
+            "Store 시,도 파티션 교체 완료 : "
+            + ", ".join(
+                f"{partition_name(*key)} {self.partition_row_count[key]}행"
+                for key in key_list
+            )
+        )
+
+    def add_shadow_row_count(self, table_name: str, row_count: int) -> None:
+        with self.shadow_lock:
+            self.shadow_row_count[table_name] = (
+                self.shadow_row_count.get(table_name, 0) + row_count
+            )
+
+    def fetch_received_log_prefix(self) -> str:
         crawler_log_id = self.config["CRAWLER_LOG_ID"]
         crawler_date = tzfromtimestamp(float(crawler_log_id))
-        log_id_prefix = (
+        # 크롤러는 월, 일을 두 자리로 저장합니다
+        return (
             f"{self.config['ENVIRONMENT']}/"
             f"{crawler_date.year}/"
-            f"{crawler_date.month}/"
-            f"{crawler_date.day}/"
+            f"{crawler_date.month:02}/"
+            f"{crawler_date.day:02}/"
             f"{crawler_log_id}/"
         )
-        self.fetch_name_type_folder(log_id_prefix)
 
-    def fetch_latest_log_folder(self) -> None:
+    def fetch_latest_log_prefix(self) -> str:
+        """
+        크롤러가 작성한 latest 포인터 중 가장 최신 실행 폴더를 반환합니다.
+        포인터가 없으면 년, 월, 일, time_stamp 폴더를 차례로 탐색합니다.
+        """
+        pointer_list = [
+            x
+            for x in (
+                self.fetch_crawler_log_pointer(name_type)
+                for name_type in ("토지이용계획정보", "토지특성정보")
+            )
+            if x is not None
+        ]
+        if pointer_list:
+            return max(pointer_list, key=lambda x: x.sort_key).run_prefix
+
         env_prefix = f"{self.config['ENVIRONMENT']}/"
         year_prefix = self.fetch_latest_folder(env_prefix)
         month_prefix = self.fetch_latest_folder(year_prefix)
         day_prefix = self.fetch_latest_folder(month_prefix)
-        log_id_prefix = self.fetch_latest_folder(day_prefix)
-        self.fetch_name_type_folder(log_id_prefix)
+        return self.fetch_latest_folder(day_prefix)
+
+    def list_s3_objects(
+        self, prefix: str, **kwargs: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        """
+        S3 목록 페이지를 반환하며 페이지마다 걸린 시간을 s3_list 로 기록합니다.
+        """
+        return self.metrics.timed_iter(
+            "s3_list", self.s3_client.get_objects(prefix, **kwargs)
+        )
+
+    def download_zip(self, key: str, file_path: str) -> None:
+        with self.metrics.timer("s3_download"):
+            self.s3_client.download_object(key, file_path)
+        self.metrics.increment(
+            "s3_download_bytes", os.path.getsize(file_path), UNIT_BYTES
+        )
+
+    def fetch_crawler_log_pointer(
+        self, name_type: str
+    ) -> typing.Optional[CrawlerLogPointer]:
+        key = f"latest/{self.config['ENVIRONMENT']}/{name_type}.json"
+        data = self.fetch_versioned_json_object(key)
+        if data is None:
+            return None
+        return CrawlerLogPointer.from_json(data)
+
+    def fetch_manifest(
+        self, log_id_prefix: str
+    ) -> typing.Optional[typing.List[CrawlerManifestEntry]]:
+        data = self.fetch_versioned_json_object(
+            f"{log_id_prefix}manifest.json"
+        )
+        if data is None:
+            return None
+        return [CrawlerManifestEntry.from_json(x) for x in data["entries"]]
+
+    def fetch_json_object(
+        self, key: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        try:
+            response = self.s3_client.get_object(key)
+            return json.loads(response.body.read())
+        except (botocore.exceptions.ClientError, KeyError, ValueError):
+            return None
+
+    def fetch_versioned_json_object(
+        self, key: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        크롤러가 작성한 형식 버전이 다르면 읽지 않고 None 을 반환합니다.
+        (포인터, manifest 대신 폴더를 탐색합니다)
+        """
+        data = self.fetch_json_object(key)
+        if data is None:
+            return None
+        version = data.get("version") if isinstance(data, dict) else None
+        if version != CRAWLER_LOG_FORMAT_VERSION:
+            logger.warning(
+                "Unsupported crawler log format",
+                key=key,
+                version=version,
+                supported_version=CRAWLER_LOG_FORMAT_VERSION,
+            )
+            return None
+        return data
+
+    def store_manifest(
+        self, manifest: typing.List[CrawlerManifestEntry], log_id_prefix: str
+    ) -> None:
+        """
+        폴더 탐색과 같은 조건(전체데이터, REGION_REGEX_LEVEL_1/2)으로 목록을 걸러서 저장합니다.
+        """
+        entry_list = [
+            x
+            for x in manifest
+            if x.data_type == "전체데이터"
+            and x.name_type in ("토지이용계획정보", "토지특성정보")
+        ]
+        sido_entry_list = [
+            x for x in entry_list if re.search(self.region_level_1, x.sido)
+        ]
+        if not sido_entry_list:
+            raise NsdiStoreRegionNotFound(
+                f"not found sido({self.region_level_1})"
+            )
+        gugun_entry_list = [
+            x
+            for x in sido_entry_list
+            if re.search(self.region_level_2, x.gugun)
+        ]
+        if not gugun_entry_list:
+            raise NsdiStoreRegionNotFound(
+                f"not found gugun({self.region_level_2})"
+            )
+
+        logger.info(
+            "Store manifest",
+            total_count=len(manifest),
+            store_count=len(gugun_entry_list),
+        )
+        etag_dict: typing.Dict[str, str] = {}
+        if self.ledger is not None:
+            for name_type in sorted({x.name_type for x in gugun_entry_list}):
+                etag_dict.update(
+                    self.fetch_etag_dict(
+                        f"{log_id_prefix}{name_type}/data/전체데이터/"
+                    )
+                )
+        for entry in sorted(
+            gugun_entry_list,
+            key=lambda x: (x.name_type, x.sido, x.gugun, x.base_date, x.key),
+        ):
+            self.add_zip_data(
+                entry.key,
+                entry.file_name,
+                entry.name_type,
+                etag_dict.get(entry.key, ""),
+            )
+
+    def fetch_etag_dict(self, prefix: str) -> typing.Dict[str, str]:
+        """
+        ledger 가 폴더 탐색과 같은 S3 ETag 로 파일 버전을 구분하도록 prefix 아래 파일의 ETag 를 읽습니다.
+        """
+        etag_dict: typing.Dict[str, str] = {}
+        for response in self.list_s3_objects(prefix):
+            for content in response.contents or []:
+                etag_dict[content["Key"]] = content.get("ETag", "").strip('"')
+        return etag_dict
 
     def fetch_latest_folder(self, base_prefix: str) -> str:
         date_list: typing.List[str] = list()
-        for response in self.s3_client.get_objects(base_prefix, Delimiter="/"):
+        for response in self.list_s3_objects(base_prefix, Delimiter="/"):
             prefixes = response.common_prefixes
             if not prefixes:
                 raise NsdiStoreS3NotFound("not found date list")
@@ -95,7 +416,7 @@ class NsdiStore(object):
         return base_prefix
 
     def fetch_name_type_folder(self, log_id_prefix: str) -> None:
-        for response in self.s3_client.get_objects(
+        for response in self.list_s3_objects(
             log_id_prefix, Delimiter="/"
         ):
             prefixes = response.common_prefixes
@@ -104,7 +425,7 @@ class NsdiStore(object):
             for name_type_prefix in prefixes:
                 name_type = (
                     name_type_prefix["Prefix"]
-                    .replace(name_type_prefix, "")
+                    .replace(log_id_prefix, "")
                     .replace("/", "")
                     .strip()
                 )
@@ -124,7 +445,7 @@ class NsdiStore(object):
     ) -> None:
         name_type_prefix += "data/전체데이터/"
         sido_check: bool = False
-        for response in self.s3_client.get_objects(
+        for response in self.list_s3_objects(
             name_type_prefix, Delimiter="/"
         ):
             prefixes = response.common_prefixes
@@ -152,7 +473,7 @@ class NsdiStore(object):
         self, sido_prefix: str, name_type: str
     ) -> None:
         gugun_check: bool = False
-        for response in self.s3_client.get_objects(sido_prefix, Delimiter="/"):
+        for response in self.list_s3_objects(sido_prefix, Delimiter="/"):
             prefixes = response.common_prefixes
             if not prefixes:
                 raise NsdiStoreS3NotFound("not found gugun region list")
@@ -177,7 +498,7 @@ class NsdiStore(object):
     def fetch_base_date_folder(
         self, gugun_prefix: str, name_type: str
     ) -> None:
-        for response in self.s3_client.get_objects(
+        for response in self.list_s3_objects(
             gugun_prefix, Delimiter="/"
         ):
             prefixes = response.common_prefixes
@@ -191,7 +512,7 @@ class NsdiStore(object):
     def fetch_zip_data_folder(
         self, base_date_prefix: str, name_type: str
     ) -> None:
-        for response in self.s3_client.get_objects(
+        for response in self.list_s3_objects(
             base_date_prefix, Delimiter="/"
         ):
             contents = response.contents
@@ -204,63 +525,325 @@ class NsdiStore(object):
                     .replace("/", "")
                     .strip()
                 )
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    folder_path = str(temp_dir) + "/"
-                    logger.info(folder_path)
-                    file_path = folder_path + file_name
-                    logger.info("S3 ZIP DOWNLOAD", file_name=file_name)
-                    self.s3_client.download_object(file_prefix, file_path)
-                    file_name = file_name.replace(".zip", ".csv")
-                    extract_zip_file(file_path, folder_path, file_name)
-                    file_path = file_path.replace(".zip", ".csv")
-
-                    converted_csv_path = self.convert_csv_file(
-                        file_path, folder_path, file_name, name_type
-                    )
-                    self.store_csv_data(converted_csv_path, name_type)
+                self.add_zip_data(
+                    file_prefix,
+                    file_name,
+                    name_type,
+                    content.get("ETag", "").strip('"'),
+                )
 
-    def convert_csv_file(
-        self, file_path: str, folder_path: str, file_name: str, name_type: str
-    ) -> str:
-        logger.info("Convert start", file_name=file_name)
-        if name_type == "토지이용계획정보":
-            converted_csv_path = convert_land_csv(
-                file_path, folder_path, file_name, NSDI_USE_DICT
+    def add_zip_data(
+        self, file_prefix: str, file_name: str, name_type: str, etag: str = ""
+    ) -> None:
+        """
+        목록을 모두 모은 후 store_zip_jobs 에서 저장합니다.
+        LEDGER 가 ON 이면 이미 저장한 파일은 건너뜁니다.
+        """
+        job = attr.evolve(
+            StoreZipJob.from_key(file_prefix, name_type, etag),
+            file_name=file_name,
+        )
+        # 전체 교체는 빈 테이블에 넣으므로 이미 저장한 파일도 다시 저장합니다
+        if (
+            self.ledger is not None
+            and self.shadow_swap is None
+            and not self.partition_reload
+            and self.ledger.is_done(job)
+        ):
+            logger.info("Ledger skip", key=file_prefix, etag=etag)
+            self.ledger_skip_count += 1
+            return
+
+        self.zip_job_list.append(job)
+
+    def store_zip_jobs(self, job_list: typing.List[StoreZipJob]) -> None:
+        """
+        같은 PNU 를 포함할 수 있는 파일은 나중에 저장한 값이 남으므로 병렬 여부와 관계없이
+        StoreZipJob.sort_key (시,도 안에서 base_date, 시,군,구 순서)로 저장합니다.
+        """
+        if not self.ingest_parallel:
+            for job in sorted(job_list, key=lambda x: x.sort_key):
+                self.store_zip_job(job)
+        elif self.stream_zip:
+            self.create_ingestor().stream(job_list, self.store_zip_job_stream)
+        else:
+            self.create_ingestor().ingest(job_list)
+
+    def store_zip_job(self, job: StoreZipJob) -> None:
+        self.record_zip_job(
+            job,
+            lambda: self.store_zip_data(
+                job.key, job.file_name, job.name_type, job.sido
+            ),
+        )
+
+    def store_zip_job_csv(self, job: StoreZipJob, csv_path: str) -> None:
+        self.record_zip_job(
+            job,
+            lambda: self.store_csv_data(csv_path, job.name_type, job.sido),
+        )
+
+    def record_zip_job_failure(
+        self, job: StoreZipJob, error: BaseException
+    ) -> None:
+        if self.ledger is not None:
+            self.ledger.fail(job, repr(error))
+
+    def record_zip_job(
+        self, job: StoreZipJob, store: typing.Callable[[], int]
+    ) -> None:
+        """
+        store 는 파일에서 읽은 행 수를 반환하고 그 결과를 ledger 에 기록합니다.
+        """
+        if self.ledger is None:
+            self.add_stored_row_count(store())
+            return
+
+        start = time.perf_counter()
+        self.ledger.begin(job)
+        try:
+            row_count = store()
+        except Exception as e:
+            self.ledger.fail(job, repr(e), time.perf_counter() - start)
+            raise
+        self.ledger.finish(job, row_count, time.perf_counter() - start)
+        self.add_stored_row_count(row_count)
+
+    def add_stored_row_count(self, row_count: int) -> None:
+        with self.stored_row_lock:
+            self.stored_row_count += row_count
+
+    def create_ingestor(self) -> NsdiIngestor:
+        return NsdiIngestor(
+            download=self.download_zip,
+            write=self.store_zip_job_csv,
+            download_workers=int(
+                self.config.get("INGEST_DOWNLOAD_WORKERS") or 4
+            ),
+            convert_workers=int(
+                self.config.get("INGEST_CONVERT_WORKERS")
+                or os.cpu_count()
+                or 1
+            ),
+            writer_workers=int(self.config.get("INGEST_WRITER_WORKERS") or 2),
+            max_inflight=int(self.config.get("INGEST_MAX_INFLIGHT") or 8),
+            converter=self.converter,
+            on_fail=self.record_zip_job_failure,
+            metrics=self.metrics,
+        )
+
+    def store_zip_data(
+        self, file_prefix: str, file_name: str, name_type: str, sido: str = ""
+    ) -> int:
+        if self.stream_zip:
+            return self.store_zip_stream(
+                file_prefix, file_name, name_type, sido
             )
-        elif name_type == "토지특성정보":
-            converted_csv_path = convert_land_csv(
-                file_path, folder_path, file_name, NSDI_FEATURE_DICT
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder_path = str(temp_dir) + "/"
+            logger.info(folder_path)
+            file_path = folder_path + file_name
+            logger.info("S3 ZIP DOWNLOAD", file_name=file_name)
+            self.download_zip(file_prefix, file_path)
+
+            converted_csv_path, seconds_dict = convert_zip_file_timed(
+                file_path, folder_path, file_name, name_type, self.converter
             )
-        else:
+            for name, seconds in seconds_dict.items():
+                self.metrics.observe(name, seconds)
+            return self.store_csv_data(converted_csv_path, name_type, sido)
+
+    def store_zip_job_stream(self, job: StoreZipJob) -> None:
+        self.record_zip_job(
+            job,
+            lambda: self.store_zip_stream(
+                job.key, job.file_name, job.name_type, job.sido
+            ),
+        )
+
+    def store_zip_stream(
+        self, file_prefix: str, file_name: str, name_type: str, sido: str = ""
+    ) -> int:
+        """
+        STREAM_ZIP 이 ON 이면 임시 파일 없이 S3 응답을 읽으면서 변환, 저장합니다.
+        """
+        model = NAME_TYPE_MODEL_DICT.get(name_type)
+        if model is None:
             raise NsdiStoreError("not found name type")
-        logger.info("Convert finish", file_name=file_name)
 
-        return converted_csv_path
+        logger.info("S3 ZIP STREAM", file_name=file_name)
+        response = self.s3_client.get_object(file_prefix)
+        if self.shadow_swap is not None:
+            return self.append_shadow(
+                CsvRowStream(iter_converted_rows(response.body, name_type)),
+                model,
+            )
+        if self.partition_reload:
+            return self.append_partition(
+                CsvRowStream(iter_converted_rows(response.body, name_type)),
+                model,
+                sido,
+            )
+        if self.loader == "copy":
+            return self.copy_loader.load(
+                CsvRowStream(iter_converted_rows(response.body, name_type)),
+                model.__table__,
+                self.partition_target(model, sido),
+            )
+        return self.store_rows_upsert(
+            iter_converted_dicts(response.body, name_type), model
+        )
+
+    def convert_csv_file(
+        self, file_path: str, folder_path: str, file_name: str, name_type: str
+    ) -> str:
+        return convert_csv_file(
+            file_path, folder_path, file_name, name_type, self.converter
+        )
 
-    def store_csv_data(self, file_path: str, name_type: str) -> None:
+    def store_csv_data(
+        self, file_path: str, name_type: str, sido: str = ""
+    ) -> int:
         """
-        우선은 10,000줄 단위로 읽은 후 upsert하도록 하였습니다
+        우선은 BATCH_SIZE(기본 10,000)줄 단위로 읽은 후 upsert하도록 하였습니다
         만약 bulk insert를 원할경우 store_bulk_insert 메소드를 사용해주세요
+        LOADER 가 copy 이면 COPY 로 파일 전체를 한 번에 반영합니다
+        sido 는 시,도 폴더 이름이며 파티션 테이블이면 그 시,도 파티션에 저장합니다
         """
-        rows = list()
-        if name_type == "토지이용계획정보":
-            # self.store_land_use_bulk_insert(file_path)
-            for idx, row in enumerate(read_csv(file_path)):
-                rows.append(row)
-                if idx % 10000 == 0 and idx != 0:
-                    self.store_land_use_bulk_upsert(rows)
-                    rows.clear()
-            if rows:
-                self.store_land_use_bulk_upsert(rows)
-        elif name_type == "토지특성정보":
-            # self.store_land_feature_bulk_insert(file_path)
-            for idx, row in enumerate(read_csv(file_path)):
-                rows.append(row)
-                if idx % 10000 == 0 and idx != 0:
-                    self.store_land_feature_bulk_upsert(rows)
-                    rows.clear()
-            if rows:
-                self.store_land_feature_bulk_upsert(rows)
+        model = NAME_TYPE_MODEL_DICT.get(name_type)
+        if model is None:
+            return 0
+
+        if self.shadow_swap is not None:
+            with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+                return self.append_shadow(f, model)
+        if self.partition_reload:
+            with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+                return self.append_partition(f, model, sido)
+        if self.loader == "copy":
+            return self.copy_loader.load_csv(
+                file_path, model.__table__, self.partition_target(model, sido)
+            )
+        # self.store_land_use_bulk_insert(file_path)
+        return self.store_rows_upsert(read_csv(file_path), model)
+
+    def append_shadow(
+        self, csv_file: typing.IO[str], model: NsdiLandModel
+    ) -> int:
+        """
+        FULL_RELOAD 이면 LOADER 와 관계없이 shadow 테이블에 COPY 로 추가만 합니다.
+        """
+        assert self.shadow_swap is not None
+        table_name = model.__tablename__
+        row_count = self.copy_loader.append(
+            csv_file, model.__table__, self.shadow_swap.shadow_name(table_name)
+        )
+        self.add_shadow_row_count(table_name, row_count)
+        return row_count
+
+    def partition_target(
+        self, model: NsdiLandModel, sido: str
+    ) -> typing.Optional[str]:
+        """
+        시,도 파티션 테이블이면 부모 테이블을 거치지 않고 그 시,도 파티션에 바로 저장합니다.
+        upsert 경로는 부모 테이블에 저장하고 PostgreSQL 이 파티션을 고릅니다.
+        """
+        code = sido_code(sido)
+        table_name = model.__tablename__
+        if code is None or table_name not in self.partitioned_table_set:
+            return None
+        return partition_name(table_name, code)
+
+    def append_partition(
+        self, csv_file: typing.IO[str], model: NsdiLandModel, sido: str
+    ) -> int:
+        """
+        PARTITION_RELOAD 이면 시,도 파티션의 shadow 테이블에 COPY 로 추가만 합니다.
+        shadow 는 그 시,도의 첫 파일을 저장할 때 만듭니다.
+        """
+        table_name = model.__tablename__
+        code = sido_code(sido)
+        if code is None or table_name not in self.partitioned_table_set:
+            raise NsdiStoreError(f"not found partition {table_name} {sido}")
+
+        key = (table_name, code)
+        with self.shadow_lock:
+            if key not in self.partition_row_count:
+                self.partitioner.prepare(table_name, code)
+                self.partition_row_count[key] = 0
+        row_count = self.copy_loader.append(
+            csv_file,
+            model.__table__,
+            self.partitioner.shadow_name(table_name, code),
+        )
+        with self.shadow_lock:
+            self.partition_row_count[key] += row_count
+        return row_count
+
+    def store_rows_upsert(
+        self,
+        rows: typing.Iterable[typing.Dict[str, str]],
+        model: NsdiLandModel,
+    ) -> int:
+        """
+        파일 하나를 한 연결(세션)로 저장하고 읽은 행 수를 반환합니다.
+        COMMIT_EVERY 번 upsert 할 때마다 커밋하고 (기본 1 : 매번)
+        0 이면 파일 전체를 한 트랜잭션으로 커밋합니다.
+        이 부분을 사용하려면 loan-model에 bulk_create_or_update를 추가해야합니다.
+        """
+        bulk_values: typing.List[typing.Dict[str, str]] = []
+        batch_count = 0
+        row_count = 0
+        session = self.session_factory()
+        logger.info("bulk upsert start", table=model.__tablename__)
+        try:
+            for row in rows:
+                bulk_values.append(row)
+                row_count += 1
+                if len(bulk_values) >= self.batch_size:
+                    self.store_bulk_upsert(session, model, bulk_values)
+                    bulk_values.clear()
+                    batch_count += 1
+                    if (
+                        self.commit_every
+                        and batch_count % self.commit_every == 0
+                    ):
+                        session.commit()
+            if bulk_values:
+                self.store_bulk_upsert(session, model, bulk_values)
+                batch_count += 1
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Store {model.__tablename__} error")
+        finally:
+            session.close()
+        logger.info(
+            "bulk upsert finish",
+            table=model.__tablename__,
+            batch_count=batch_count,
+            row_count=row_count,
+        )
+        return row_count
+
+    def store_bulk_upsert(
+        self,
+        session: typing.Any,
+        model: NsdiLandModel,
+        bulk_values: typing.List[typing.Dict[str, str]],
+    ) -> None:
+        """
+        DELTA_SKIP 이 ON 이면 내용이 바뀐 행만 upsert 합니다.
+        """
+        if self.delta_filter is not None:
+            bulk_values = self.delta_filter.filter(
+                session, model.__tablename__, bulk_values
+            )
+        if bulk_values:
+            with self.metrics.timer("db_upsert"):
+                model.bulk_create_or_update(session, bulk_values)
+            self.metrics.increment("db_upsert_rows", len(bulk_values))
 
     def store_land_use_bulk_insert(self, file_path: str) -> None:
         """
@@ -299,33 +882,3 @@ class NsdiStore(object):
         finally:
             session.close()
         logger.info("bulk insert finish")
-
-    def store_land_use_bulk_upsert(self, bulk_values: list) -> None:
-        """
-        이 부분을 사용하려면 loan-model에 bulk_create_or_update를 추가해야합니다.
-        """
-        session = self.session_factory()
-        logger.info("bulk upsert start")
-        try:
-            NsdiLandUse.bulk_create_or_update(session, bulk_values)
-            session.commit()
-        except Exception:
-            raise NsdiStoreError("Store land use error")
-        finally:
-            session.close()
-        logger.info("bulk upsert finish")
-
-    def store_land_feature_bulk_upsert(self, bulk_values: list) -> None:
-        """
-        이 부분을 사용하려면 loan-model에 bulk_create_or_update를 추가해야합니다.
-        """
-        session = self.session_factory()
-        logger.info("bulk upsert start")
-        try:
-            NsdiLandFeature.bulk_create_or_update(session, bulk_values)
-            session.commit()
-        except Exception:
-            raise NsdiStoreError("Store land feature error")
-        finally:
-            session.close()
-        logger.info("bulk upsert finish")
@@ -0,0 +1,223 @@
+"""
+압축 파일을 디스크에 풀지 않고 S3 응답에서 바로 읽어 변환합니다.
+
+    S3 응답 -> 압축 해제(zlib) -> CP949 디코딩 -> csv -> 컬럼명 변환 -> DB
+
+각 단계가 조각(chunk) 단위로 읽으므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+"""
+import csv
+import io
+import struct
+import typing
+import zlib
+
+from .data import (
+    NSDI_FEATURE_DICT,
+    NSDI_USE_DICT,
+    PNU_COLUMN,
+    is_empty_pnu,
+)
+from .exc import NsdiStoreError
+
+CHUNK_SIZE = 64 * 1024
+SOURCE_ENCODING = "cp949"
+
+LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHIIIHH")
+LOCAL_FILE_SIGNATURE = b"PK\x03\x04"
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+
+def read_exact(stream: typing.BinaryIO, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            raise NsdiStoreError("unexpected end of zip stream")
+        data += chunk
+    return data
+
+
+def iter_zip_member(
+    stream: typing.BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> typing.Iterator[bytes]:
+    """
+    압축 파일의 첫 번째 파일 내용을 앞에서부터 읽어 조각으로 반환합니다.
+    NSDI 압축 파일에는 CSV 하나만 들어있으므로 중앙 디렉터리(파일 끝)는 읽지 않습니다.
+    """
+    header = read_exact(stream, LOCAL_FILE_HEADER.size)
+    (
+        signature,
+        _version,
+        flags,
+        method,
+        _time,
+        _date,
+        _crc,
+        compressed_size,
+        _size,
+        name_length,
+        extra_length,
+    ) = LOCAL_FILE_HEADER.unpack(header)
+    if signature != LOCAL_FILE_SIGNATURE:
+        raise NsdiStoreError("not a zip stream")
+    if flags & 0x1:
+        raise NsdiStoreError("encrypted zip is not supported")
+    read_exact(stream, name_length + extra_length)
+
+    if method == ZIP_DEFLATED:
+        # 크기가 뒤에 붙는 경우(flags & 0x8)에도 deflate 스트림 끝을 zlib 이 알려줍니다
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        while not decompressor.eof:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                raise NsdiStoreError("unexpected end of zip stream")
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+        data = decompressor.flush()
+        if data:
+            yield data
+    elif (
+        method == ZIP_STORED
+        and not flags & 0x8
+        and compressed_size != 0xFFFFFFFF
+    ):
+        remain = compressed_size
+        while remain > 0:
+            chunk = stream.read(min(chunk_size, remain))
+            if not chunk:
+                raise NsdiStoreError("unexpected end of zip stream")
+            remain -= len(chunk)
+            yield chunk
+    else:
+        raise NsdiStoreError(f"unsupported zip compression method {method}")
+
+
+class ChunkReader(io.RawIOBase):
+    """
+    bytes 조각 iterator 를 io.TextIOWrapper 로 감쌀 수 있는 파일 객체로 만듭니다.
+    """
+
+    def __init__(self, chunks: typing.Iterator[bytes]) -> None:
+        super().__init__()
+        self.chunks = chunks
+        self.buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: typing.Any) -> int:
+        while not self.buffer:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+            self.buffer = chunk
+        size = min(len(b), len(self.buffer))
+        b[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+def iter_converted_rows(
+    stream: typing.BinaryIO, name_type: str
+) -> typing.Iterator[typing.List[str]]:
+    """
+    압축 파일 응답에서 convert_csv_file 과 같은 결과를 한 줄씩 반환합니다.
+    첫 줄은 변환된 컬럼명이며 PNU 가 비어있는 행은 버립니다.
+    """
+    if name_type == "토지이용계획정보":
+        column_dict = NSDI_USE_DICT
+    elif name_type == "토지특성정보":
+        column_dict = NSDI_FEATURE_DICT
+    else:
+        raise NsdiStoreError("not found name type")
+
+    text = io.TextIOWrapper(
+        io.BufferedReader(ChunkReader(iter_zip_member(stream)), CHUNK_SIZE),
+        encoding=SOURCE_ENCODING,
+        newline="",
+    )
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        raise NsdiStoreError("empty csv")
+
+    index_list = []
+    column_list = []
+    for index, column in enumerate(header):
+        converted = column_dict.get(column.strip())
+        if converted:
+            index_list.append(index)
+            column_list.append(converted)
+
+    pnu_index = (
+        index_list[column_list.index(PNU_COLUMN)]
+        if PNU_COLUMN in column_list
+        else None
+    )
+
+    yield column_list
+    for row in reader:
+        if not row:
+            continue
+        if pnu_index is not None and is_empty_pnu(row[pnu_index]):
+            continue
+        yield [row[x] for x in index_list]
+
+
+def iter_converted_dicts(
+    stream: typing.BinaryIO, name_type: str
+) -> typing.Iterator[typing.Dict[str, str]]:
+    """
+    read_csv 처럼 컬럼명을 키로 하는 dict 를 한 줄씩 반환합니다.
+    """
+    rows = iter_converted_rows(stream, name_type)
+    column_list = next(rows)
+    for row in rows:
+        yield dict(zip(column_list, row))
+
+
+class CsvRowStream(object):
+    """
+    줄 iterator 를 COPY FROM STDIN 이 읽을 수 있는 CSV 파일 객체로 만듭니다.
+    read 를 호출할 때마다 필요한 만큼만 CSV 로 씁니다.
+    """
+
+    def __init__(self, rows: typing.Iterator[typing.List[str]]) -> None:
+        super().__init__()
+        self.rows = rows
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, lineterminator="\n")
+        self.pending = ""
+
+    def fill(self, size: int) -> None:
+        while size < 0 or len(self.pending) + self.buffer.tell() < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            self.writer.writerow(row)
+        self.flush_buffer()
+
+    def flush_buffer(self) -> None:
+        self.pending += self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+    def read(self, size: int = -1) -> str:
+        self.fill(size)
+        if size < 0:
+            data, self.pending = self.pending, ""
+        else:
+            data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def readline(self) -> str:
+        if "\n" not in self.pending:
+            row = next(self.rows, None)
+            if row is not None:
+                self.writer.writerow(row)
+                self.flush_buffer()
+        index = self.pending.find("\n") + 1 or len(self.pending)
+        data, self.pending = self.pending[:index], self.pending[index:]
+        return data
@@ -0,0 +1,336 @@
+"""
+전체데이터를 운영 테이블에 upsert 하지 않고 shadow 테이블에 새로 넣은 후 한 번에 교체합니다.
+
+    1. prepare : 인덱스, 제약 조건 없이 컬럼만 같은 {테이블}_shadow 를 만듭니다
+    2. 저장   : COPY 로 shadow 에 추가만 합니다 (같은 PNU 는 나중에 넣은 행이 남습니다)
+    3. swap   : 이번에 받지 않은 시,군,구(PNU 앞 5자리) 행을 운영 테이블에서 가져오고
+                중복을 지운 후 인덱스를 만들고 한 트랜잭션에서 이름을 바꿉니다
+
+교체 전 테이블은 {테이블}_old 로 남겨두므로 rollback 으로 바로 되돌릴 수 있습니다.
+새로 넣은 행의 id 는 새로 발급되며 다른 테이블의 외래 키는 옮기지 않습니다.
+"""
+import re
+import typing
+
+import sqlalchemy as sa
+import structlog
+from sqlalchemy import orm
+
+from .exc import NsdiStoreError
+
+logger = structlog.get_logger(__name__)
+
+SHADOW_SUFFIX = "_shadow"
+OLD_SUFFIX = "_old"
+LOAD_SEQ_COLUMN = "nsdi_load_seq"
+#: 운영 테이블 행을 유지할지 판단하는 PNU 앞자리 수 (시,도 2자리 + 시,군,구 3자리)
+SIGUNGU_PREFIX_LENGTH = 5
+
+KEY_DEF_REGEX = re.compile(r"^((?:PRIMARY KEY|UNIQUE) )\(([^)]*)\)(.*)$")
+INDEX_DEF_REGEX = re.compile(
+    r"^(CREATE (?:UNIQUE )?INDEX )(\S+)( ON (?:ONLY )?)(\S+)( .*)$"
+)
+
+
+def index_name(table_name: str, base_name: str, live_name: str) -> str:
+    """
+    운영 테이블 인덱스 이름(base_name)에 대응하는 table_name 테이블의 인덱스 이름입니다.
+    """
+    if table_name == live_name:
+        return base_name
+    if live_name in base_name:
+        return base_name.replace(live_name, table_name, 1)
+    return f"{table_name}__{base_name}"
+
+
+def base_index_name(table_name: str, name: str, live_name: str) -> str:
+    """
+    index_name 의 반대로 운영 테이블 기준 인덱스 이름을 반환합니다.
+    """
+    if table_name == live_name:
+        return name
+    if name.startswith(f"{table_name}__"):
+        return name[len(table_name) + 2:]
+    if table_name in name:
+        return name.replace(table_name, live_name, 1)
+    return name
+
+
+def add_key_column(definition: str, column: typing.Optional[str]) -> str:
+    """
+    PRIMARY KEY (id) -> PRIMARY KEY (id, pnu)
+    """
+    match = KEY_DEF_REGEX.match(definition)
+    if column is None or match is None:
+        return definition
+    key, column_list, rest = match.groups()
+    if column in [x.strip() for x in column_list.split(",")]:
+        return definition
+    return f"{key}({column_list}, {column}){rest}"
+
+
+class NsdiShadowSwap(object):
+    def __init__(self, session_factory: orm.sessionmaker) -> None:
+        super().__init__()
+        self.session_factory = session_factory
+
+    @staticmethod
+    def shadow_name(table_name: str) -> str:
+        return table_name + SHADOW_SUFFIX
+
+    @staticmethod
+    def old_name(table_name: str) -> str:
+        return table_name + OLD_SUFFIX
+
+    def execute(
+        self, sql_list: typing.List[str], params: typing.Any = None
+    ) -> None:
+        session = self.session_factory()
+        try:
+            for sql in sql_list:
+                session.execute(sa.text(sql), params or {})
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def prepare(self, table_name: str) -> None:
+        """
+        이전 실행에서 남은 shadow 테이블은 지우고 새로 만듭니다.
+        """
+        shadow_name = self.shadow_name(table_name)
+        self.execute(
+            [
+                f"DROP TABLE IF EXISTS {shadow_name}",
+                f"CREATE UNLOGGED TABLE {shadow_name} "
+                f"(LIKE {table_name} INCLUDING DEFAULTS)",
+                # 같은 PNU 중 나중에 넣은 행을 남기기 위한 순서
+                f"ALTER TABLE {shadow_name} "
+                f"ADD COLUMN {LOAD_SEQ_COLUMN} bigserial",
+            ]
+        )
+        logger.info("Shadow table prepared", table=shadow_name)
+
+    def drop_shadow(self, table_name: str) -> None:
+        self.execute([f"DROP TABLE IF EXISTS {self.shadow_name(table_name)}"])
+
+    def finalize(
+        self,
+        table: sa.Table,
+        live_name: str,
+        shadow_name: str,
+        carry_over: bool = True,
+    ) -> None:
+        """
+        shadow 테이블의 중복을 지우고 live_name 테이블과 같은 인덱스를 만듭니다.
+        carry_over 이면 이번에 받지 않은 시,군,구 행을 live_name 테이블에서 가져옵니다.
+        (시,군,구 단위로 받거나 일부 시,군,구만 받아도 나머지 시,군,구 행은 유지됩니다)
+        """
+        columns = ", ".join(x.name for x in table.columns)
+        sql_list = []
+        if carry_over:
+            sql_list.append(
+                f"INSERT INTO {shadow_name} ({columns}) "
+                f"SELECT {columns} FROM {live_name} "
+                f"WHERE left(pnu, {SIGUNGU_PREFIX_LENGTH}) NOT IN "
+                f"(SELECT DISTINCT left(pnu, {SIGUNGU_PREFIX_LENGTH}) "
+                f"FROM {shadow_name})"
+            )
+        sql_list += [
+            f"DELETE FROM {shadow_name} WHERE {LOAD_SEQ_COLUMN} IN ("
+            f"SELECT {LOAD_SEQ_COLUMN} FROM ("
+            f"SELECT {LOAD_SEQ_COLUMN}, row_number() OVER ("
+            f"PARTITION BY pnu ORDER BY {LOAD_SEQ_COLUMN} DESC) AS rn "
+            f"FROM {shadow_name}) d WHERE rn > 1)",
+            f"ALTER TABLE {shadow_name} DROP COLUMN {LOAD_SEQ_COLUMN}",
+            f"ALTER TABLE {shadow_name} SET LOGGED",
+        ]
+
+        logger.info("Shadow table finalize start", table=shadow_name)
+        self.execute(sql_list)
+        self.create_indexes(live_name, shadow_name)
+        self.execute([f"ANALYZE {shadow_name}"])
+
+    def swap(self, table: sa.Table) -> None:
+        table_name = table.name
+        shadow_name = self.shadow_name(table_name)
+        old_name = self.old_name(table_name)
+
+        self.finalize(table, table_name, shadow_name)
+
+        session = self.session_factory()
+        try:
+            session.execute(
+                sa.text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE")
+            )
+            session.execute(sa.text(f"DROP TABLE IF EXISTS {old_name}"))
+            self.rename_table(session, table_name, table_name, old_name)
+            self.rename_table(session, table_name, shadow_name, table_name)
+            self.move_sequences(session, table, old_name)
+            self.clear_fingerprint(session, table_name)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Swap {table_name} error")
+        finally:
+            session.close()
+        logger.info("Shadow table swapped", table=table_name, old=old_name)
+
+    def rollback(self, table: sa.Table) -> None:
+        """
+        운영 테이블과 {테이블}_old 를 서로 바꿉니다. 한 번 더 실행하면 다시 원래대로 돌아갑니다.
+        """
+        table_name = table.name
+        old_name = self.old_name(table_name)
+        temp_name = table_name + "_rollback"
+
+        session = self.session_factory()
+        try:
+            if not session.execute(
+                sa.text("SELECT to_regclass(:name)"), {"name": old_name}
+            ).scalar():
+                raise NsdiStoreError(f"not found {old_name}")
+            session.execute(
+                sa.text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE")
+            )
+            self.rename_table(session, table_name, table_name, temp_name)
+            self.rename_table(session, table_name, old_name, table_name)
+            self.rename_table(session, table_name, temp_name, old_name)
+            self.move_sequences(session, table, old_name)
+            self.clear_fingerprint(session, table_name)
+            session.commit()
+        except NsdiStoreError:
+            session.rollback()
+            raise
+        except Exception:
+            session.rollback()
+            raise NsdiStoreError(f"Rollback {table_name} error")
+        finally:
+            session.close()
+        logger.info("Table rolled back", table=table_name, old=old_name)
+
+    def create_indexes(
+        self,
+        table_name: str,
+        shadow_name: str,
+        partition_column: typing.Optional[str] = None,
+    ) -> None:
+        """
+        운영 테이블의 기본 키, 유니크 제약 조건, 인덱스를 shadow 테이블에 만듭니다.
+        partition_column 이 있으면 파티션 테이블 조건에 맞게
+        기본 키, 유니크 제약 조건에 파티션 컬럼을 추가합니다.
+        """
+        session = self.session_factory()
+        try:
+            constraint_list = session.execute(
+                sa.text(
+                    "SELECT conname, pg_get_constraintdef(oid) "
+                    "FROM pg_constraint "
+                    "WHERE conrelid = CAST(:name AS regclass) "
+                    "AND contype IN ('p', 'u', 'x')"
+                ),
+                {"name": table_name},
+            ).fetchall()
+            index_list = session.execute(
+                sa.text(
+                    "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+                    "WHERE indrelid = CAST(:name AS regclass) "
+                    "AND indexrelid NOT IN (SELECT conindid FROM pg_constraint"
+                    " WHERE conrelid = CAST(:name AS regclass))"
+                ),
+                {"name": table_name},
+            ).fetchall()
+        finally:
+            session.close()
+
+        sql_list = [
+            f"ALTER TABLE {shadow_name} ADD CONSTRAINT "
+            f"{index_name(shadow_name, name, table_name)} "
+            f"{add_key_column(definition, partition_column)}"
+            for name, definition in constraint_list
+        ]
+        for (definition,) in index_list:
+            match = INDEX_DEF_REGEX.match(definition)
+            if match is None:
+                raise NsdiStoreError(f"unknown index definition {definition}")
+            create, name, on, _, rest = match.groups()
+            sql_list.append(
+                f"{create}{index_name(shadow_name, name, table_name)}"
+                f"{on}{shadow_name}{rest}"
+            )
+
+        for sql in sql_list:
+            logger.info("Shadow index", sql=sql)
+            self.execute([sql])
+
+    def rename_table(
+        self,
+        session: orm.Session,
+        live_name: str,
+        from_name: str,
+        to_name: str,
+    ) -> None:
+        """
+        테이블과 그 인덱스(제약 조건) 이름을 함께 바꿉니다.
+        """
+        name_list = session.execute(
+            sa.text(
+                "SELECT indexrelid::regclass::text FROM pg_index "
+                "WHERE indrelid = CAST(:name AS regclass)"
+            ),
+            {"name": from_name},
+        ).fetchall()
+        session.execute(
+            sa.text(f"ALTER TABLE {from_name} RENAME TO {to_name}")
+        )
+        for (name,) in name_list:
+            new_name = index_name(
+                to_name, base_index_name(from_name, name, live_name), live_name
+            )
+            if new_name != name:
+                session.execute(
+                    sa.text(f"ALTER INDEX {name} RENAME TO {new_name}")
+                )
+
+    def clear_fingerprint(
+        self,
+        session: orm.Session,
+        table_name: str,
+        pnu_prefix: str = "",
+    ) -> None:
+        """
+        교체한 테이블과 행 해시(DELTA_SKIP)가 맞지 않으므로 지웁니다.
+        pnu_prefix 가 있으면 그 PNU 로 시작하는 행 해시만 지웁니다.
+        """
+        if session.execute(
+            sa.text("SELECT to_regclass('nsdi_store_fingerprint')")
+        ).scalar():
+            session.execute(
+                sa.text(
+                    "DELETE FROM nsdi_store_fingerprint "
+                    "WHERE table_name = :table_name AND pnu LIKE :pnu_like"
+                ),
+                {"table_name": table_name, "pnu_like": pnu_prefix + "%"},
+            )
+
+    def move_sequences(
+        self, session: orm.Session, table: sa.Table, old_name: str
+    ) -> None:
+        """
+        id 시퀀스는 처음 만든 테이블 소유이므로 _old 를 지울 때 같이 지워지지 않도록
+        현재 운영 테이블로 옮깁니다.
+        """
+        for column in table.columns:
+            sequence = session.execute(
+                sa.text("SELECT pg_get_serial_sequence(:table, :column)"),
+                {"table": old_name, "column": column.name},
+            ).scalar()
+            if sequence:
+                session.execute(
+                    sa.text(
+                        f"ALTER SEQUENCE {sequence} "
+                        f"OWNED BY {table.name}.{column.name}"
+                    )
+                )
@@ -0,0 +1,57 @@
+import csv
+import io
+import pathlib
+import typing
+import zipfile
+
+import pytest
+
+from nsdi_store.store.convert import (
+    CONVERTER_ARROW,
+    CONVERTER_ROW,
+    convert_csv_file,
+)
+from nsdi_store.store.stream import iter_converted_rows
+
+USE = "토지이용계획정보"
+FILE_NAME = "AL_11_D155.csv"
+CSV_TEXT = (
+    "고유번호,관리번호,법정동명\r\n"
+    "1111010100100010000,1,서울특별시 종로구 청운동\r\n"
+    ",2,서울특별시 종로구 청운동\r\n"
+    "1111010100100020000,3,서울특별시 종로구 청운동\r\n"
+)
+PNU_LIST = ["1111010100100010000", "1111010100100020000"]
+
+
+def read_pnu_list(path: str) -> typing.List[str]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return [x["pnu"] for x in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize("converter", [CONVERTER_ROW, CONVERTER_ARROW])
+def test_convert_csv_file_drops_empty_pnu(
+    tmp_path: pathlib.Path, converter: str
+) -> None:
+    if converter == CONVERTER_ARROW:
+        pytest.importorskip("pyarrow")
+    file_path = tmp_path / FILE_NAME
+    file_path.write_bytes(CSV_TEXT.encode("cp949"))
+
+    converted_path = convert_csv_file(
+        str(file_path), f"{tmp_path}/", FILE_NAME, USE, converter
+    )
+
+    assert read_pnu_list(converted_path) == PNU_LIST
+
+
+def test_iter_converted_rows_drops_empty_pnu() -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as f:
+        f.writestr(FILE_NAME, CSV_TEXT.encode("cp949"))
+    buffer.seek(0)
+
+    rows = iter_converted_rows(buffer, USE)
+
+    assert next(rows) == ["pnu", "address_jibun"]
+    assert [x[0] for x in rows] == PNU_LIST
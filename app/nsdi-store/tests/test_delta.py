@@ -0,0 +1,57 @@
+import datetime
+
+from nsdi_store.store.delta import row_fingerprint, sql_fingerprint
+
+COLUMN_LIST = ["pnu", "land_use_name", "land_area"]
+ROW = {
+    "pnu": "1111010100100010000",
+    "land_use_name": "도시지역",
+    "land_area": 12.5,
+}
+
+
+def test_row_fingerprint_is_signed_64_bit() -> None:
+    fingerprint = row_fingerprint(ROW, COLUMN_LIST)
+
+    assert fingerprint == row_fingerprint(dict(ROW), COLUMN_LIST)
+    assert -(2 ** 63) <= fingerprint < 2 ** 63
+
+
+def test_row_fingerprint_changes_with_value() -> None:
+    changed = dict(ROW, land_area=12.6)
+
+    assert row_fingerprint(ROW, COLUMN_LIST) != row_fingerprint(
+        changed, COLUMN_LIST
+    )
+
+
+def test_row_fingerprint_ignores_other_columns() -> None:
+    row = dict(ROW, id=10, updated_at=datetime.datetime.now())
+
+    assert row_fingerprint(ROW, COLUMN_LIST) == row_fingerprint(
+        row, COLUMN_LIST
+    )
+
+
+def test_row_fingerprint_separates_columns() -> None:
+    column_list = ["a", "b"]
+
+    assert row_fingerprint({"a": "x", "b": "yz"}, column_list) != (
+        row_fingerprint({"a": "xy", "b": "z"}, column_list)
+    )
+
+
+def test_row_fingerprint_treats_missing_as_empty() -> None:
+    row = {"pnu": "1", "land_use_name": None}
+
+    assert row_fingerprint(row, COLUMN_LIST) == row_fingerprint(
+        {"pnu": "1", "land_use_name": ""}, COLUMN_LIST
+    )
+
+
+def test_sql_fingerprint_uses_all_columns() -> None:
+    sql = sql_fingerprint(COLUMN_LIST, "src")
+
+    for column in COLUMN_LIST:
+        assert f"coalesce(src.{column}::text, '')" in sql
+    assert sql.endswith("::bit(64)::bigint")
@@ -0,0 +1,190 @@
+import csv
+import io
+import os
+import threading
+import typing
+import zipfile
+
+import pytest
+
+from nsdi_store.store.ingest import NsdiIngestor, StoreZipJob
+
+USE = "토지이용계획정보"
+FEATURE = "토지특성정보"
+
+
+def job(
+    name_type: str, sido: str, gugun: str, base_date: str
+) -> StoreZipJob:
+    return StoreZipJob.from_key(
+        f"local/2020/9/8/1.0/{name_type}/data/전체데이터/{sido}/{gugun}/"
+        f"base_date_{base_date}/{sido}_{gugun}_{base_date}.zip",
+        name_type,
+    )
+
+
+def write_zip(key: str, zip_path: str) -> None:
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(["고유번호", "법정동명"])
+    writer.writerow(["1111010100100010000", key])
+    with zipfile.ZipFile(zip_path, "w") as f:
+        f.writestr(
+            os.path.basename(zip_path).replace(".zip", ".csv"),
+            text.getvalue().encode("cp949"),
+        )
+
+
+class Recorder(object):
+    def __init__(self) -> None:
+        super().__init__()
+        self.written: typing.List[StoreZipJob] = []
+        self.failed: typing.List[StoreZipJob] = []
+        self.lock = threading.Lock()
+
+    def write(self, job: StoreZipJob, csv_path: str) -> None:
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            row_list = list(csv.reader(f))
+        assert row_list[0] == ["pnu", "address_jibun"]
+        assert row_list[1][1] == job.key
+        with self.lock:
+            self.written.append(job)
+
+    def on_fail(self, job: StoreZipJob, error: BaseException) -> None:
+        with self.lock:
+            self.failed.append(job)
+
+
+def ingestor(
+    recorder: Recorder,
+    download: typing.Callable[[str, str], None] = write_zip,
+    convert_workers: int = 0,
+) -> NsdiIngestor:
+    return NsdiIngestor(
+        download=download,
+        write=recorder.write,
+        download_workers=3,
+        convert_workers=convert_workers,
+        writer_workers=2,
+        max_inflight=2,
+        on_fail=recorder.on_fail,
+    )
+
+
+JOB_LIST = [
+    job(USE, "서울특별시", "ALL", "2020-09-01"),
+    job(FEATURE, "서울특별시", "강남구", "2020-08-01"),
+    job(USE, "서울특별시", "강남구", "2020-08-01"),
+    job(USE, "부산광역시", "해운대구", "2020-09-02"),
+    job(USE, "서울특별시", "종로구", "2020-10-01"),
+]
+
+
+def test_from_key() -> None:
+    zip_job = StoreZipJob.from_key(
+        "local/2020/9/8/1.0/토지이용계획정보/data/전체데이터/"
+        "서울특별시/강남구 /base_date_2020-08-01/AL_11680.zip",
+        USE,
+        etag="abc",
+    )
+
+    assert zip_job == StoreZipJob(
+        key=zip_job.key,
+        file_name="AL_11680.zip",
+        name_type=USE,
+        sido="서울특별시",
+        gugun="강남구",
+        base_date="base_date_2020-08-01",
+        etag="abc",
+    )
+
+
+def test_group_jobs_by_name_type_and_sido() -> None:
+    group_list = ingestor(Recorder()).group_jobs(list(reversed(JOB_LIST)))
+
+    assert [[x.group for x in group] for group in group_list] == [
+        [(USE, "부산광역시")],
+        [(USE, "서울특별시")] * 3,
+        [(FEATURE, "서울특별시")],
+    ]
+    # 같은 묶음 안에서는 base_date 순서로 저장합니다
+    assert [x.base_date for x in group_list[1]] == [
+        "base_date_2020-08-01",
+        "base_date_2020-09-01",
+        "base_date_2020-10-01",
+    ]
+
+
+@pytest.mark.parametrize("convert_workers", [0, 1])
+def test_ingest_writes_groups_in_order(convert_workers: int) -> None:
+    recorder = Recorder()
+    ingestor(recorder, convert_workers=convert_workers).ingest(JOB_LIST)
+
+    assert sorted(x.key for x in recorder.written) == sorted(
+        x.key for x in JOB_LIST
+    )
+    seoul_use = [x for x in recorder.written if x.group == (USE, "서울특별시")]
+    assert seoul_use == sorted(seoul_use, key=lambda x: x.sort_key)
+    assert recorder.failed == []
+
+
+def test_serial_and_parallel_write_in_same_order() -> None:
+    # 폴더 목록 순서 : 시,군,구 폴더(모든 날짜) 다음에 ALL 폴더
+    listing_list = [
+        job(USE, "서울특별시", "강남구", "2020-08-01"),
+        job(USE, "서울특별시", "강남구", "2020-10-01"),
+        job(USE, "서울특별시", "ALL", "2020-09-01"),
+    ]
+    recorder = Recorder()
+    ingestor(recorder).ingest(listing_list)
+
+    # 직렬 저장도 sort_key 순서로 저장하므로 같은 PNU 는 같은 파일의 값이 남습니다
+    serial_list = sorted(listing_list, key=lambda x: x.sort_key)
+    assert recorder.written == serial_list
+    assert [x.gugun for x in serial_list] == ["강남구", "ALL", "강남구"]
+
+
+def test_ingest_raises_download_error() -> None:
+    def download(key: str, zip_path: str) -> None:
+        if "부산광역시" in key:
+            raise IOError(key)
+        write_zip(key, zip_path)
+
+    recorder = Recorder()
+    with pytest.raises(IOError):
+        ingestor(recorder, download=download).ingest(JOB_LIST)
+
+    assert [x.sido for x in recorder.failed] == ["부산광역시"]
+    assert all(x.sido != "부산광역시" for x in recorder.written)
+
+
+def test_ingest_raises_convert_error() -> None:
+    def download(key: str, zip_path: str) -> None:
+        with open(zip_path, "wb") as f:
+            f.write(b"not a zip")
+
+    recorder = Recorder()
+    with pytest.raises(zipfile.BadZipFile):
+        ingestor(recorder, download=download, convert_workers=1).ingest(
+            JOB_LIST
+        )
+
+    assert recorder.written == []
+    assert recorder.failed
+
+
+def test_ingest_stops_after_write_error() -> None:
+    recorder = Recorder()
+    written: typing.List[StoreZipJob] = []
+
+    def write(job: StoreZipJob, csv_path: str) -> None:
+        written.append(job)
+        raise ValueError(job.key)
+
+    store_ingestor = ingestor(recorder)
+    store_ingestor.write = write
+    with pytest.raises(ValueError):
+        store_ingestor.ingest(JOB_LIST)
+
+    # 실패한 후에는 다른 묶음의 남은 파일을 저장하지 않습니다
+    assert 1 <= len(written) < len(JOB_LIST)
@@ -0,0 +1,42 @@
+import pytest
+
+from nsdi_store.store.partition import (
+    SIDO_CODE_DICT,
+    partition_bound,
+    partition_name,
+    sido_code,
+)
+
+
+def test_partition_bound() -> None:
+    assert partition_bound("11") == ("11", "12")
+    assert partition_bound("09") == ("09", "10")
+    assert partition_bound("52") == ("52", "53")
+
+
+@pytest.mark.parametrize("code", sorted(SIDO_CODE_DICT.values()))
+def test_partition_bound_contains_only_its_pnu(code: str) -> None:
+    lower, upper = partition_bound(code)
+
+    assert lower <= f"{code}00000000000000000" < upper
+    assert lower <= f"{code}99999999999999999" < upper
+    # 이웃한 시,도의 PNU 는 범위 밖입니다
+    assert not lower <= f"{int(code) + 1:02}00000000000000000" < upper
+    assert not lower <= f"{int(code) - 1:02}99999999999999999" < upper
+
+
+def test_partition_bounds_do_not_overlap() -> None:
+    bound_list = sorted(partition_bound(x) for x in SIDO_CODE_DICT.values())
+
+    for (_, upper), (lower, _) in zip(bound_list, bound_list[1:]):
+        assert upper <= lower
+
+
+def test_sido_code() -> None:
+    assert sido_code("서울특별시") == "11"
+    assert sido_code(" 경기도 ") == "41"
+    assert sido_code("없는도") is None
+
+
+def test_partition_name() -> None:
+    assert partition_name("nsdi_land_use", "11") == "nsdi_land_use_p11"
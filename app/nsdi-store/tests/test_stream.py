@@ -0,0 +1,152 @@
+import csv
+import io
+import typing
+import zipfile
+
+import pytest
+
+from nsdi_store.store.exc import NsdiStoreError
+from nsdi_store.store.stream import (
+    CsvRowStream,
+    iter_converted_dicts,
+    iter_converted_rows,
+    iter_zip_member,
+)
+
+CSV_TEXT = (
+    "고유번호,관리번호,법정동명,용도지역지구명\r\n"
+    "1111010100100010000,1,서울특별시 종로구 청운동,\"제1종, 일반주거지역\"\r\n"
+    "\r\n"
+    "1111010100100020000,2,서울특별시 종로구 청운동,도시지역\r\n"
+)
+
+
+def zip_bytes(data: bytes, compression: int = zipfile.ZIP_DEFLATED) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as f:
+        f.writestr("AL_11_D155.csv", data)
+    return buffer.getvalue()
+
+
+class StreamingBody(io.RawIOBase):
+    """
+    파일 끝 중앙 디렉터리를 읽지 못하도록 앞에서부터 조금씩만 돌려주는 S3 응답입니다.
+    """
+
+    def __init__(self, data: bytes, size: int = 7) -> None:
+        super().__init__()
+        self.data = data
+        self.position = 0
+        self.size = size
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self.data)
+        size = min(size, self.size)
+        chunk = self.data[self.position:self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+
+@pytest.mark.parametrize(
+    "compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED]
+)
+def test_iter_zip_member(compression: int) -> None:
+    data = bytes(range(256)) * 1000
+    stream = StreamingBody(zip_bytes(data, compression), size=1000)
+
+    chunk_list = list(iter_zip_member(stream, chunk_size=100))
+
+    assert b"".join(chunk_list) == data
+    assert len(chunk_list) > 1
+
+
+def test_iter_zip_member_rejects_other_stream() -> None:
+    with pytest.raises(NsdiStoreError):
+        list(iter_zip_member(io.BytesIO(b"not a zip file at all, sorry")))
+
+
+def test_iter_zip_member_rejects_truncated_stream() -> None:
+    data = zip_bytes(bytes(range(256)) * 1000)
+
+    with pytest.raises(NsdiStoreError):
+        list(iter_zip_member(io.BytesIO(data[:100])))
+
+
+def test_iter_converted_rows() -> None:
+    stream = StreamingBody(zip_bytes(CSV_TEXT.encode("cp949")))
+
+    assert list(iter_converted_rows(stream, "토지이용계획정보")) == [
+        ["pnu", "address_jibun", "land_use_name"],
+        ["1111010100100010000", "서울특별시 종로구 청운동", "제1종, 일반주거지역"],
+        ["1111010100100020000", "서울특별시 종로구 청운동", "도시지역"],
+    ]
+
+
+def test_iter_converted_dicts() -> None:
+    stream = StreamingBody(zip_bytes(CSV_TEXT.encode("cp949")))
+
+    dict_list = list(iter_converted_dicts(stream, "토지이용계획정보"))
+
+    assert [x["pnu"] for x in dict_list] == [
+        "1111010100100010000",
+        "1111010100100020000",
+    ]
+
+
+def test_iter_converted_rows_rejects_unknown_name_type() -> None:
+    with pytest.raises(NsdiStoreError):
+        next(iter_converted_rows(io.BytesIO(b""), "토지정보"))
+
+
+ROW_LIST = [
+    ["pnu", "land_use_name"],
+    ["1111010100100010000", "제1종, 일반주거지역"],
+    ["1111010100100020000", ""],
+    ["1111010100100030000", "줄\n바꿈"],
+]
+
+
+def rows() -> typing.Iterator[typing.List[str]]:
+    return iter([list(x) for x in ROW_LIST])
+
+
+def expected_csv() -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(ROW_LIST)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("size", [1, 5, 64, 8192])
+def test_csv_row_stream_read(size: int) -> None:
+    stream = CsvRowStream(rows())
+    chunk_list = []
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        assert len(chunk) <= size
+        chunk_list.append(chunk)
+
+    assert "".join(chunk_list) == expected_csv()
+
+
+def test_csv_row_stream_read_all() -> None:
+    assert CsvRowStream(rows()).read() == expected_csv()
+
+
+def test_csv_row_stream_readline() -> None:
+    stream = CsvRowStream(rows())
+    line_list = []
+    while True:
+        line = stream.readline()
+        if not line:
+            break
+        line_list.append(line)
+
+    assert "".join(line_list) == expected_csv()
+    assert line_list[0] == "pnu,land_use_name\n"
+    assert line_list[1] == '1111010100100010000,"제1종, 일반주거지역"\n'
@@ -0,0 +1,94 @@
+import typing
+
+import pytest
+
+from nsdi_store.store.swap import (
+    INDEX_DEF_REGEX,
+    NsdiShadowSwap,
+    add_key_column,
+    base_index_name,
+    index_name,
+)
+
+LIVE = "nsdi_land_use"
+SHADOW = NsdiShadowSwap.shadow_name(LIVE)
+OLD = NsdiShadowSwap.old_name(LIVE)
+
+
+def test_shadow_and_old_name() -> None:
+    assert SHADOW == "nsdi_land_use_shadow"
+    assert OLD == "nsdi_land_use_old"
+
+
+@pytest.mark.parametrize(
+    "table_name, base_name, expected",
+    [
+        (LIVE, "nsdi_land_use_pkey", "nsdi_land_use_pkey"),
+        (SHADOW, "nsdi_land_use_pkey", "nsdi_land_use_shadow_pkey"),
+        (OLD, "ix_nsdi_land_use_pnu", "ix_nsdi_land_use_old_pnu"),
+        # 테이블 이름이 들어있지 않은 인덱스는 앞에 붙입니다
+        (SHADOW, "land_pnu_idx", "nsdi_land_use_shadow__land_pnu_idx"),
+    ],
+)
+def test_index_name(table_name: str, base_name: str, expected: str) -> None:
+    assert index_name(table_name, base_name, LIVE) == expected
+
+
+@pytest.mark.parametrize(
+    "base_name", ["nsdi_land_use_pkey", "ix_nsdi_land_use_pnu", "land_idx"]
+)
+@pytest.mark.parametrize("table_name", [LIVE, SHADOW, OLD])
+def test_base_index_name_reverses_index_name(
+    table_name: str, base_name: str
+) -> None:
+    name = index_name(table_name, base_name, LIVE)
+
+    assert base_index_name(table_name, name, LIVE) == base_name
+
+
+def test_rename_shadow_index_to_live_and_old() -> None:
+    # rename_table 과 같이 shadow -> 운영, 운영 -> old 로 이름을 옮깁니다
+    shadow_index = index_name(SHADOW, "nsdi_land_use_pkey", LIVE)
+    live_index = index_name(
+        LIVE, base_index_name(SHADOW, shadow_index, LIVE), LIVE
+    )
+    old_index = index_name(
+        OLD, base_index_name(LIVE, live_index, LIVE), LIVE
+    )
+
+    assert live_index == "nsdi_land_use_pkey"
+    assert old_index == "nsdi_land_use_old_pkey"
+
+
+@pytest.mark.parametrize(
+    "definition, column, expected",
+    [
+        ("PRIMARY KEY (id)", "pnu", "PRIMARY KEY (id, pnu)"),
+        ("UNIQUE (pnu)", "pnu", "UNIQUE (pnu)"),
+        ("UNIQUE (id, pnu) DEFERRABLE", "pnu", "UNIQUE (id, pnu) DEFERRABLE"),
+        ("PRIMARY KEY (id)", None, "PRIMARY KEY (id)"),
+        ("EXCLUDE USING gist (area WITH &&)", "pnu", None),
+    ],
+)
+def test_add_key_column(
+    definition: str,
+    column: typing.Optional[str],
+    expected: typing.Optional[str],
+) -> None:
+    assert add_key_column(definition, column) == (expected or definition)
+
+
+def test_index_def_regex() -> None:
+    match = INDEX_DEF_REGEX.match(
+        "CREATE UNIQUE INDEX ix_nsdi_land_use_pnu "
+        "ON public.nsdi_land_use USING btree (pnu)"
+    )
+
+    assert match is not None
+    assert match.groups() == (
+        "CREATE UNIQUE INDEX ",
+        "ix_nsdi_land_use_pnu",
+        " ON ",
+        "public.nsdi_land_use",
+        " USING btree (pnu)",
+    )
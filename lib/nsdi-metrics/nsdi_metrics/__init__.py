@@ -0,0 +1,25 @@
+from .memory import PeakRssSampler
+from .metrics import (
+    DEFAULT_BUCKETS,
+    UNIT_BYTES,
+    UNIT_COUNT,
+    UNIT_SECONDS,
+    CloudWatchMetricsExporter,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    PrometheusTextfileExporter,
+)
+
+__all__ = [
+    'DEFAULT_BUCKETS',
+    'UNIT_BYTES',
+    'UNIT_COUNT',
+    'UNIT_SECONDS',
+    'CloudWatchMetricsExporter',
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'PeakRssSampler',
+    'PrometheusTextfileExporter',
+]
@@ -0,0 +1,70 @@
+import contextlib
+import threading
+import typing
+
+import psutil
+
+
+class PeakRssSampler(object):
+    """
+    with 블록 동안 현재 프로세스와 자식 프로세스 RSS 합의 최댓값을 기록합니다.
+    stage 블록(MetricsRegistry.timer) 이 실행되는 동안의 최댓값은 단계별로 stage_peak 에 남깁니다.
+    interval 보다 짧은 단계는 시작할 때 마지막으로 잰 값이 기록됩니다.
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        super().__init__()
+        self.interval = interval
+        self.peak = 0
+        #: 단계 이름별 RSS 최댓값
+        self.stage_peak: typing.Dict[str, int] = {}
+        #: 실행 중인 단계 이름별 실행 수
+        self.active: typing.Dict[str, int] = {}
+        self.last = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self) -> None:
+        process = psutil.Process()
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+
+        with self.lock:
+            self.last = rss
+            self.peak = max(self.peak, rss)
+            for name in self.active:
+                self.stage_peak[name] = max(self.stage_peak[name], rss)
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> typing.Iterator[None]:
+        with self.lock:
+            self.active[name] = self.active.get(name, 0) + 1
+            self.stage_peak[name] = max(
+                self.stage_peak.get(name, 0), self.last
+            )
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.active[name] -= 1
+                if not self.active[name]:
+                    del self.active[name]
+
+    def __enter__(self) -> "PeakRssSampler":
+        self.sample()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
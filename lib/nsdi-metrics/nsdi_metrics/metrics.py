@@ -0,0 +1,312 @@
+"""
+metrics
+=======
+
+단계별 소요 시간(히스토그램)과 처리량(카운터)을 모아 CloudWatch, Prometheus textfile 로 내보냅니다.
+nsdi-crawler 와 nsdi-store 가 같이 사용합니다.
+
+    metrics = MetricsRegistry()
+    with metrics.timer("page_fetch"):
+        ...
+    metrics.increment("download_bytes", size, UNIT_BYTES)
+
+CloudWatch 는 각 앱의 run_scheduler 가 1분마다 지난 전송 이후 늘어난 값만 PutMetricData 로 묶어서 보내고
+Prometheus textfile 은 node_exporter 의 textfile collector 가 읽도록 누적 값을 파일로 씁니다.
+"""
+import bisect
+import contextlib
+import os
+import tempfile
+import threading
+import time
+import typing
+
+import attr
+
+from .memory import PeakRssSampler
+
+T = typing.TypeVar("T")
+
+UNIT_SECONDS = "Seconds"
+UNIT_BYTES = "Bytes"
+UNIT_COUNT = "Count"
+
+#: 소요 시간 히스토그램 구간 상한값(초)
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+#: PutMetricData 한 번에 보내는 최대 항목 수
+METRIC_BATCH_SIZE = 20
+
+
+@attr.s
+class Histogram(object):
+    buckets: typing.Tuple[float, ...] = attr.ib(default=DEFAULT_BUCKETS)
+    #: 구간별 관측 수 (마지막은 buckets[-1] 초과)
+    bucket_counts: typing.List[int] = attr.ib()
+    count: int = attr.ib(default=0)
+    total: float = attr.ib(default=0.0)
+    max: float = attr.ib(default=0.0)
+
+    @bucket_counts.default
+    def _bucket_counts(self) -> typing.List[int]:
+        return [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        # 구간 상한값과 같은 값은 그 구간에 넣습니다 (Prometheus 의 le)
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def bucket_value(self, index: int) -> float:
+        """
+        CloudWatch 로 보낼 구간의 대표값(상한값)입니다. 마지막 구간은 최댓값을 사용합니다.
+        """
+        if index < len(self.buckets):
+            return self.buckets[index]
+        return self.max
+
+    def copy(self) -> "Histogram":
+        return attr.evolve(self, bucket_counts=list(self.bucket_counts))
+
+
+@attr.s
+class Counter(object):
+    unit: str = attr.ib(default=UNIT_COUNT)
+    value: float = attr.ib(default=0)
+
+
+class MetricsRegistry(object):
+    """
+    여러 스레드에서 같은 인스턴스를 공유할 수 있습니다.
+    timer 블록에서 오류가 나면 소요 시간 대신 {이름}_errors 카운터를 올립니다.
+    rss_sampler 가 있으면 timer 블록이 실행되는 동안의 최대 메모리도 단계별로 기록합니다. (벤치마크용)
+    """
+
+    def __init__(
+        self, rss_sampler: typing.Optional[PeakRssSampler] = None
+    ) -> None:
+        super().__init__()
+        self.histograms: typing.Dict[str, Histogram] = {}
+        self.counters: typing.Dict[str, Counter] = {}
+        self.rss_sampler = rss_sampler
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def increment(
+        self, name: str, value: float = 1, unit: str = UNIT_COUNT
+    ) -> None:
+        with self._lock:
+            counter = self.counters.get(name)
+            if counter is None:
+                counter = self.counters[name] = Counter(unit)
+            counter.value += value
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> typing.Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            if self.rss_sampler is not None:
+                stack.enter_context(self.rss_sampler.stage(name))
+            start = time.perf_counter()
+            try:
+                yield
+            except BaseException:
+                self.increment(f"{name}_errors")
+                raise
+            self.observe(name, time.perf_counter() - start)
+
+    def timed_iter(
+        self, name: str, iterable: typing.Iterable[T]
+    ) -> typing.Iterator[T]:
+        """
+        항목 하나를 가져오는데 걸린 시간을 기록합니다. (예: S3 목록 페이지)
+        """
+        start = time.perf_counter()
+        for item in iterable:
+            self.observe(name, time.perf_counter() - start)
+            yield item
+            start = time.perf_counter()
+
+    def snapshot(
+        self,
+    ) -> typing.Tuple[typing.Dict[str, Histogram], typing.Dict[str, Counter]]:
+        with self._lock:
+            return (
+                {k: v.copy() for k, v in self.histograms.items()},
+                {k: attr.evolve(v) for k, v in self.counters.items()},
+            )
+
+    def summary(self) -> typing.Dict[str, typing.Any]:
+        """
+        로그에 남길 단계별 요약 (관측 수, 합계, 평균, 최댓값, 최대 메모리, 카운터 값)
+        """
+        histograms, counters = self.snapshot()
+        result: typing.Dict[str, typing.Any] = {
+            name: {
+                "count": x.count,
+                "seconds": round(x.total, 3),
+                "avg": round(x.total / x.count, 4) if x.count else 0,
+                "max": round(x.max, 4),
+            }
+            for name, x in sorted(histograms.items())
+        }
+        if self.rss_sampler is not None:
+            with self.rss_sampler.lock:
+                stage_peak = dict(self.rss_sampler.stage_peak)
+            for name, peak in stage_peak.items():
+                if name in result:
+                    result[name]["peak_rss_mb"] = round(peak / 1024 / 1024, 1)
+        result.update((name, x.value) for name, x in sorted(counters.items()))
+        return result
+
+
+class CloudWatchMetricsExporter(object):
+    """
+    히스토그램은 구간 대표값(Values)과 관측 수(Counts)로 보내므로 CloudWatch 에서
+    p50, p90 같은 백분위수를 볼 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        client: typing.Any,
+        namespace: str,
+        registry: MetricsRegistry,
+        environment: str,
+    ) -> None:
+        super().__init__()
+        #: boto3 cloudwatch client
+        self.client = client
+        self.namespace = namespace
+        self.registry = registry
+        self.dimensions = [{"Name": "Environment", "Value": environment}]
+        self.last_histograms: typing.Dict[str, Histogram] = {}
+        self.last_counters: typing.Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def metric_data(
+        self,
+        histograms: typing.Dict[str, Histogram],
+        counters: typing.Dict[str, Counter],
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        data_list = []
+        for name, histogram in sorted(histograms.items()):
+            last = self.last_histograms.get(name)
+            value_list = []
+            count_list = []
+            for index, count in enumerate(histogram.bucket_counts):
+                if last is not None:
+                    count -= last.bucket_counts[index]
+                if count > 0:
+                    value_list.append(histogram.bucket_value(index))
+                    count_list.append(count)
+            if value_list:
+                data_list.append(
+                    {
+                        "MetricName": name,
+                        "Dimensions": self.dimensions,
+                        "Values": value_list,
+                        "Counts": count_list,
+                        "Unit": UNIT_SECONDS,
+                    }
+                )
+
+        for name, counter in sorted(counters.items()):
+            last_counter = self.last_counters.get(name)
+            value = counter.value - (last_counter.value if last_counter else 0)
+            if value > 0:
+                data_list.append(
+                    {
+                        "MetricName": name,
+                        "Dimensions": self.dimensions,
+                        "Value": value,
+                        "Unit": counter.unit,
+                    }
+                )
+        return data_list
+
+    def export(self) -> int:
+        """
+        지난 전송 이후 늘어난 값을 보내고 보낸 항목 수를 반환합니다.
+        전송에 실패하면 다음 전송에서 다시 보냅니다.
+        """
+        with self._lock:
+            histograms, counters = self.registry.snapshot()
+            data_list = self.metric_data(histograms, counters)
+            for i in range(0, len(data_list), METRIC_BATCH_SIZE):
+                self.client.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=data_list[i:i + METRIC_BATCH_SIZE],
+                )
+            self.last_histograms = histograms
+            self.last_counters = counters
+            return len(data_list)
+
+
+class PrometheusTextfileExporter(object):
+    """
+    {prefix}_{이름}_seconds 히스토그램과 {prefix}_{이름}_total 카운터를 씁니다.
+    읽는 쪽이 쓰는 중인 파일을 보지 않도록 임시 파일에 쓴 후 이름을 바꿉니다.
+    """
+
+    def __init__(
+        self, path: str, prefix: str, registry: MetricsRegistry
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.prefix = prefix
+        self.registry = registry
+
+    def render(self) -> str:
+        histograms, counters = self.registry.snapshot()
+        line_list = []
+        for name, histogram in sorted(histograms.items()):
+            metric_name = f"{self.prefix}_{name}_seconds"
+            line_list.append(f"# TYPE {metric_name} histogram")
+            cumulative = 0
+            for bucket, count in zip(
+                histogram.buckets, histogram.bucket_counts
+            ):
+                cumulative += count
+                line_list.append(
+                    f'{metric_name}_bucket{{le="{bucket}"}} {cumulative}'
+                )
+            line_list += [
+                f'{metric_name}_bucket{{le="+Inf"}} {histogram.count}',
+                f"{metric_name}_sum {histogram.total}",
+                f"{metric_name}_count {histogram.count}",
+            ]
+
+        for name, counter in sorted(counters.items()):
+            metric_name = f"{self.prefix}_{name}_total"
+            line_list += [
+                f"# TYPE {metric_name} counter",
+                f"{metric_name} {counter.value}",
+            ]
+
+        metric_name = f"{self.prefix}_last_export_timestamp_seconds"
+        line_list += [
+            f"# TYPE {metric_name} gauge",
+            f"{metric_name} {time.time()}",
+        ]
+        return "\n".join(line_list) + "\n"
+
+    def export(self) -> None:
+        folder_path = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder_path, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=folder_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
@@ -0,0 +1,12 @@
+from setuptools import find_packages, setup
+
+setup(
+    name="nsdi-metrics",
+    version="0.1.0",
+    description="Stage metrics shared by nsdi crawler and store",
+    author="Tanker",
+    author_email="dev@tanker.fund",
+    packages=find_packages(exclude=["tests"]),
+    install_requires=["attrs", "psutil"],
+    python_requires=">=3.8",
+)